@@ -19,20 +19,24 @@ Topics covered:
 from __future__ import annotations
 
 import sys
+from pathlib import Path
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/actions/keyboard.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver  # noqa: E402
 
 KEYBOARD_PAGE = 'https://www.selenium.dev/selenium/web/single_text_input.html'
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -18,13 +18,20 @@ Topics covered:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/actions/wheel.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver  # noqa: E402
 
 SCROLL_PAGE_NESTED = (
     'https://www.selenium.dev/selenium/web/'
@@ -37,8 +44,7 @@ SCROLL_PAGE = (
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Per-command WebDriver round-trip latency benchmark.
+
+Every WebDriver command is an HTTP request to the driver process, which in
+turn talks to the browser. This benchmark times the commands the examples
+exercise, one call at a time, against the local fixture server so that the
+numbers reflect driver and browser overhead rather than network latency.
+
+Benchmarked commands:
+    - find_element with every By strategy used in elements/web_elements/locators.py
+    - get_attribute / get_property / get_dom_attribute (elements/web_elements/information.py)
+    - execute_script, page and element screenshots (interactions/windows.py)
+    - query_elements() batching several getters into one round trip (support/element_info.py)
+
+Usage (from the repository root):
+    python -m selenium_v4.benchmarks.commands
+    python -m selenium_v4.benchmarks.commands -n 500 --browser firefox --output output/benchmarks/commands.json
+
+Results are printed as a table and written as JSON (see harness.write_results).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/benchmarks/commands.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.benchmarks.harness import (  # noqa: E402
+    BenchmarkResult,
+    headless_driver,
+    measure,
+    print_results,
+    write_results,
+)
+from selenium_v4.support.element_info import query_elements  # noqa: E402
+from selenium_v4.support.fixture_server import FixtureServer  # noqa: E402
+
+FIXTURE_PAGE = 'https://www.selenium.dev/selenium/web/locators_tests/locators.html'
+
+# Same locators as elements/web_elements/locators.py, all present in the fixture copy of FIXTURE_PAGE.
+LOCATORS = {
+    'CLASS_NAME': (By.CLASS_NAME, 'information'),
+    'CSS_SELECTOR': (By.CSS_SELECTOR, '#fname'),
+    'ID': (By.ID, 'lname'),
+    'NAME': (By.NAME, 'newsletter'),
+    'LINK_TEXT': (By.LINK_TEXT, 'Selenium Official Page'),
+    'PARTIAL_LINK_TEXT': (By.PARTIAL_LINK_TEXT, 'Official Page'),
+    'TAG_NAME': (By.TAG_NAME, 'h1'),
+    'XPATH': (By.XPATH, "//input[@value='f']"),
+}
+
+
+def run_benchmarks(driver, iterations: int, warmup: int) -> list[BenchmarkResult]:
+    """Run every command benchmark against the page currently loaded in driver."""
+    results = []
+
+    for name, (by, value) in LOCATORS.items():
+        results.append(measure(f'find_element[{name}]', lambda: driver.find_element(by, value), iterations, warmup))
+
+    fname = driver.find_element(By.ID, 'fname')
+    results.append(measure('get_attribute', lambda: fname.get_attribute('value'), iterations, warmup))
+    results.append(measure('get_property', lambda: fname.get_property('value'), iterations, warmup))
+    results.append(measure('get_dom_attribute', lambda: fname.get_dom_attribute('value'), iterations, warmup))
+
+    # Same information for every input on the page: one command per getter vs one batched script.
+    inputs = driver.find_elements(By.TAG_NAME, 'input')
+    fields = ['tag_name', 'displayed', 'attribute:type', 'property:value']
+    results.append(measure(
+        f'getters[{len(inputs)} inputs x {len(fields)}]',
+        lambda: [(e.tag_name, e.is_displayed(), e.get_attribute('type'), e.get_property('value')) for e in inputs],
+        max(1, iterations // 10),
+        1,
+    ))
+    results.append(measure(
+        f'query_elements[{len(inputs)} inputs x {len(fields)}]',
+        lambda: query_elements(driver, inputs, fields),
+        max(1, iterations // 10),
+        1,
+    ))
+
+    results.append(measure('execute_script', lambda: driver.execute_script('return document.title;'), iterations, warmup))
+
+    # Screenshots are orders of magnitude slower; keep their run time bounded.
+    shots = max(1, iterations // 10)
+    heading = driver.find_element(By.TAG_NAME, 'h1')
+    results.append(measure('get_screenshot_as_png', driver.get_screenshot_as_png, shots, 1))
+    results.append(measure('element.screenshot_as_png', lambda: heading.screenshot_as_png, shots, 1))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='WebDriver per-command latency benchmark.')
+    parser.add_argument('-n', '--iterations', type=int, default=200, help='timed calls per command')
+    parser.add_argument('--warmup', type=int, default=10, help='untimed calls per command before measuring')
+    parser.add_argument('--browser', default='chrome', choices=['chrome', 'edge', 'firefox'])
+    parser.add_argument('--headed', action='store_true', help='run with a visible browser window')
+    parser.add_argument('--output', type=Path, help='JSON output file (default: output/benchmarks/...)')
+    args = parser.parse_args(argv)
+
+    with FixtureServer() as server:
+        driver = headless_driver(args.browser, headless=not args.headed)
+        try:
+            driver.get(server.local_url(FIXTURE_PAGE))
+            results = run_benchmarks(driver, args.iterations, args.warmup)
+            path = write_results('commands', results, driver, args.output, iterations=args.iterations)
+        finally:
+            driver.quit()
+
+    print_results(results)
+    print(f'\nResults written to {path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
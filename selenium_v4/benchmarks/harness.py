@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Shared helpers for the benchmark scripts.
+
+measure() times a callable repeatedly after a warm-up and summarizes the
+samples as latency percentiles and throughput. write_results() stores a run
+as JSON under output/benchmarks/, tagged with the Selenium, browser and
+Python versions, so runs against different Selenium releases can be diffed.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import selenium
+from selenium import webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from selenium_v4.support import build_driver
+
+OUTPUT_DIR = Path(__file__).resolve().parents[2] / 'output' / 'benchmarks'
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency summary of one benchmarked operation; times in milliseconds."""
+
+    name: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+    ops_per_sec: float
+    extra: dict = field(default_factory=dict)
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(name: str, samples: list[float], **extra) -> BenchmarkResult:
+    """Build a BenchmarkResult from per-call durations in seconds."""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return BenchmarkResult(
+        name=name,
+        iterations=len(ordered),
+        p50_ms=percentile(ordered, 50) * 1000,
+        p95_ms=percentile(ordered, 95) * 1000,
+        p99_ms=percentile(ordered, 99) * 1000,
+        mean_ms=statistics.fmean(ordered) * 1000 if ordered else 0.0,
+        min_ms=ordered[0] * 1000 if ordered else 0.0,
+        max_ms=ordered[-1] * 1000 if ordered else 0.0,
+        ops_per_sec=len(ordered) / total if total else 0.0,
+        extra=extra,
+    )
+
+
+def measure(name: str, func: Callable[[], object], iterations: int = 100, warmup: int = 5, **extra) -> BenchmarkResult:
+    """Call func warmup times untimed, then iterations times timed one by one."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(name, samples, **extra)
+
+
+def headless_driver(browser: str = 'chrome', headless: bool = True) -> WebDriver:
+    """A fresh, never pooled driver so that measurements start from a known state."""
+    options = {'chrome': webdriver.ChromeOptions, 'edge': webdriver.EdgeOptions, 'firefox': webdriver.FirefoxOptions}[browser]()
+    if headless:
+        options.add_argument('-headless' if browser == 'firefox' else '--headless=new')
+    return build_driver(browser, options, pooled=False)
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    """Print a fixed-width table of results."""
+    width = max([len('benchmark')] + [len(r.name) for r in results])
+    print(f'{"benchmark":<{width}}  {"p50 ms":>8}  {"p95 ms":>8}  {"p99 ms":>8}  {"ops/s":>8}')
+    for r in results:
+        print(f'{r.name:<{width}}  {r.p50_ms:8.2f}  {r.p95_ms:8.2f}  {r.p99_ms:8.2f}  {r.ops_per_sec:8.1f}')
+
+
+def write_results(
+    suite: str,
+    results: list[BenchmarkResult],
+    driver: WebDriver | None = None,
+    output: Path | None = None,
+    **metadata,
+) -> Path:
+    """Write results to JSON; the default file name embeds the suite and Selenium version."""
+    capabilities = driver.capabilities if driver is not None else {}
+    stamp = datetime.now(timezone.utc)
+    payload = {
+        'suite': suite,
+        'timestamp': stamp.isoformat(),
+        'selenium_version': selenium.__version__,
+        'browser_name': capabilities.get('browserName'),
+        'browser_version': capabilities.get('browserVersion'),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        **metadata,
+        'results': [asdict(r) for r in results],
+    }
+    path = output or OUTPUT_DIR / f'{suite}-selenium{selenium.__version__}-{stamp:%Y%m%dT%H%M%SZ}.json'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2), encoding='utf-8')
+    return path
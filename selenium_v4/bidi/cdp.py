@@ -25,25 +25,31 @@ Topics covered:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/bidi/cdp.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver  # noqa: E402
 
 SELENIUM_URL = 'https://www.selenium.dev/'
 EXAMPLE_URL = 'https://www.example.com/'
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 def _build_bidi_driver() -> webdriver.Chrome:
     """Build a driver with WebDriver BiDi enabled via the webSocketUrl capability."""
     options = webdriver.ChromeOptions()
     options.enable_bidi = True
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options)
+    # BiDi handlers are bound to the session, so BiDi sessions are never pooled.
+    return build_driver('chrome', options, pooled=False)
 
 
 # ---------------------------------------------------------------------------
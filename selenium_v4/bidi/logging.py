@@ -18,11 +18,18 @@ Topics covered:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/bidi/logging.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver  # noqa: E402
 
 LOG_PAGE = 'https://www.selenium.dev/selenium/web/bidi/logEntryAdded.html'
 
@@ -31,8 +38,8 @@ def _build_bidi_driver() -> webdriver.Chrome:
     """Build a Chrome driver with WebDriver BiDi enabled."""
     options = webdriver.ChromeOptions()
     options.enable_bidi = True
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options)
+    # BiDi handlers are bound to the session, so BiDi sessions are never pooled.
+    return build_driver('chrome', options, pooled=False)
 
 
 # ---------------------------------------------------------------------------
@@ -21,20 +21,27 @@ Topics covered:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
-BASIC_AUTH_URL = 'https://the-internet.herokuapp.com/basic_auth'
-SELENIUM_URL = 'https://www.selenium.dev/'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/bidi/network.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+
+BASIC_AUTH_URL = target_url('https://the-internet.herokuapp.com/basic_auth')
+SELENIUM_URL = target_url('https://www.selenium.dev/')
 
 
 def _build_bidi_driver() -> webdriver.Chrome:
     """Build a Chrome driver with WebDriver BiDi enabled."""
     options = webdriver.ChromeOptions()
     options.enable_bidi = True
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options)
+    # BiDi handlers are bound to the session, so BiDi sessions are never pooled.
+    return build_driver('chrome', options, pooled=False)
 
 
 # ---------------------------------------------------------------------------
@@ -12,17 +12,26 @@ Requires BiDi to be enabled: options.enable_bidi = True
 
 Topics covered:
     - DOM Mutation Handlers — observe when DOM attributes or nodes change
+    - Waits woken by DOM mutation events instead of polling (support.mutation_wait)
 """
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
-DYNAMIC_PAGE = 'https://www.selenium.dev/selenium/web/dynamic.html'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/bidi/script.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+from selenium_v4.support.mutation_wait import MutationWait  # noqa: E402
+
+DYNAMIC_PAGE = target_url('https://www.selenium.dev/selenium/web/dynamic.html')
 MUTATION_PAGE = 'https://www.selenium.dev/selenium/web/bidi/mutation_observer.html'
 
 
@@ -30,8 +39,8 @@ def _build_bidi_driver() -> webdriver.Chrome:
     """Build a Chrome driver with WebDriver BiDi enabled."""
     options = webdriver.ChromeOptions()
     options.enable_bidi = True
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options)
+    # BiDi handlers are bound to the session, so BiDi sessions are never pooled.
+    return build_driver('chrome', options, pooled=False)
 
 
 # ---------------------------------------------------------------------------
@@ -121,6 +130,32 @@ def track_multiple_mutations():
     driver.quit()
 
 
+# ---------------------------------------------------------------------------
+# 2. Waits woken by mutation events
+# ---------------------------------------------------------------------------
+
+def wait_on_dom_mutation():
+    """
+    On a BiDi session MutationWait subscribes a DOM mutation handler and sleeps
+    until it fires, so the condition is evaluated right after each change and
+    otherwise only once per poll_frequency (the fallback). Used as a context
+    manager, the subscription is kept across several waits.
+    """
+    driver = _build_bidi_driver()
+    driver.get(DYNAMIC_PAGE)
+
+    with MutationWait(driver, 5, poll_frequency=2) as wait:
+        driver.find_element(By.ID, 'reveal').click()
+        revealed = wait.until(lambda d: d.find_element(By.ID, 'revealed').is_displayed())
+        print(f'Revealed: {revealed}, wait cost: {wait.last_stats}')
+
+        driver.find_element(By.ID, 'adder').click()
+        wait.until(lambda d: d.find_elements(By.CLASS_NAME, 'redbox'))
+        print(f'Box added, wait cost: {wait.last_stats}')
+
+    driver.quit()
+
+
 if __name__ == '__main__':
     add_dom_mutation_handler()
     remove_dom_mutation_handler()
@@ -10,6 +10,8 @@ This module focuses on:
 	- W3C common capabilities
 	- Chrome-specific options (goog:chromeOptions)
 	- Local and remote-ready option building
+	- Fast-launch switch set (support/fast_launch.py)
+	- Extensions encoded once and cached by content hash (support/extension_cache.py)
 
 The examples build options objects and print capabilities, so the file is
 executable without requiring Selenium Grid.
@@ -19,11 +21,19 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.common.proxy import Proxy, ProxyType
 
+if __package__ in (None, ''):
+	# Allow running this file directly: python selenium_v4/browsers/chrome/options.py
+	sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support.extension_cache import add_cached_extension  # noqa: E402
+from selenium_v4.support.fast_launch import fast_launch_options  # noqa: E402
+
 
 def common_w3c_options() -> webdriver.ChromeOptions:
 	"""Common W3C capabilities supported by Selenium options classes."""
@@ -116,6 +126,19 @@ def chrome_extensions_examples() -> webdriver.ChromeOptions:
 	return options
 
 
+def chrome_cached_extensions() -> webdriver.ChromeOptions:
+	"""
+	Same extension as chrome_extensions_examples(), base64-encoded once per
+	content hash: later options objects and to_capabilities() calls reuse
+	the cached text instead of re-reading and re-encoding the .crx.
+	"""
+	options = webdriver.ChromeOptions()
+	extension_path = os.getenv('CHROME_EXTENSION_CRX')
+	if extension_path and Path(extension_path).exists():
+		add_cached_extension(options, extension_path)
+	return options
+
+
 def chrome_proxy_example() -> webdriver.ChromeOptions:
 	"""Proxy capability via selenium Proxy object."""
 	options = webdriver.ChromeOptions()
@@ -152,6 +175,16 @@ def chrome_custom_capabilities() -> webdriver.ChromeOptions:
 	return options
 
 
+def chrome_fast_launch() -> webdriver.ChromeOptions:
+	"""
+	Fastest cold start for CI: --headless=new plus switches that turn off
+	GPU, extensions, background networking, sync and first-run work.
+	"""
+	options = webdriver.ChromeOptions()
+	options.add_argument('--window-size=1366,768')
+	return fast_launch_options('chrome', options)
+
+
 def all_examples() -> dict[str, webdriver.ChromeOptions]:
 	"""Collect all option builders in one place."""
 	return {
@@ -160,9 +193,11 @@ def all_examples() -> dict[str, webdriver.ChromeOptions]:
 		'chrome_binary_and_debugger': chrome_binary_and_debugger(),
 		'chrome_experimental_options': chrome_experimental_options(),
 		'chrome_extensions_examples': chrome_extensions_examples(),
+		'chrome_cached_extensions': chrome_cached_extensions(),
 		'chrome_proxy_example': chrome_proxy_example(),
 		'chrome_mobile_android_example': chrome_mobile_android_example(),
 		'chrome_custom_capabilities': chrome_custom_capabilities(),
+		'chrome_fast_launch': chrome_fast_launch(),
 	}
 
 
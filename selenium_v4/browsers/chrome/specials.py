@@ -6,24 +6,34 @@ Reference:
 https://www.selenium.dev/documentation/webdriver/browsers/chrome/
 
 Topics covered:
-    - Starting Chrome (basic, headless, keep open, incognito)
+    - Starting Chrome (basic, headless, keep open, incognito, fast launch, brokered long-lived browsers)
     - Network conditions (slow network, offline) via CDP
     - Download behaviour (custom directory, headless downloads)
     - Permissions (CDP Browser.grantPermissions + Selenium set_permissions)
     - Console logs (browser log capture)
     - Cast / screen mirroring (list sinks, start/stop tab mirroring)
     - DevTools Protocol (CDP): performance metrics, block URLs, geolocation
+    - Resource-blocking categories and the bytes/requests they save
     - Print page to PDF
 """
 
 from __future__ import annotations
 
 import os
+import sys
+import time
 from pathlib import Path
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/browsers/chrome/specials.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver, shared_server  # noqa: E402
+from selenium_v4.support.fast_launch import fast_launch_options, measure_cold_start  # noqa: E402
+from selenium_v4.support.resource_blocking import block_resources, measure_savings, print_savings_report  # noqa: E402
+from selenium_v4.support.session_broker import SessionBroker, attach_driver  # noqa: E402
 
 EXAMPLE_URL = 'https://www.example.com/'
 OUTPUT_DIR = Path(__file__).parents[3] / 'output'
@@ -31,8 +41,7 @@ OUTPUT_DIR = Path(__file__).parents[3] / 'output'
 
 def _build_driver(options: webdriver.ChromeOptions | None = None) -> webdriver.Chrome:
     """Helper: build a local Chrome driver."""
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options or webdriver.ChromeOptions())
+    return build_driver('chrome', options)
 
 
 # ---------------------------------------------------------------------------
@@ -89,6 +98,35 @@ def start_keep_browser_open():
     # Intentionally NOT calling driver.quit()
 
 
+def compare_cold_start(runs: int = 3):
+    """
+    Time session start, first navigation and quit of fresh Chrome sessions
+    with default options and with the fast-launch switch set.
+    """
+    default = measure_cold_start('chrome', webdriver.ChromeOptions(), runs, label='default')
+    fast = measure_cold_start('chrome', fast_launch_options('chrome'), runs, label='fast launch')
+    print(default)
+    print(fast)
+    print(f'Saved per session: {(default.median_total - fast.median_total) * 1000:.0f} ms')
+
+
+def reuse_brokered_browsers(runs: int = 4):
+    """
+    Launch two long-lived Chrome browsers once and attach successive sessions
+    to them through debuggerAddress, as _build_driver() does for every example
+    with SELENIUM_EXAMPLES_BROKER=1 while `session_broker start` is running.
+    quit() resets the browser and releases it; it keeps running.
+    """
+    state_file = OUTPUT_DIR / 'broker-example.json'
+    with SessionBroker('chrome', size=2, state_file=state_file):
+        for _ in range(runs):
+            started = time.perf_counter()
+            driver = attach_driver('chrome', state_file=state_file)
+            driver.get(EXAMPLE_URL)
+            print(f'{driver.title!r} on {driver.brokered_browser.address}: {time.perf_counter() - started:.2f}s')
+            driver.quit()
+
+
 # ---------------------------------------------------------------------------
 # 2. Network conditions (CDP)
 # ---------------------------------------------------------------------------
@@ -313,6 +351,26 @@ def block_resource_urls():
     driver.quit()
 
 
+def block_resource_categories():
+    """
+    Block whole categories (images, media, fonts, analytics, ads) with the
+    shared pattern lists, then report the requests and bytes avoided per
+    navigation on the fixture site's heavy page and on example.com.
+    """
+    server = shared_server()
+    driver = _build_driver()
+    patterns = block_resources(driver, ('images', 'media', 'fonts', 'analytics', 'ads'))
+    print(f'{len(patterns)} URL patterns blocked')
+
+    report = measure_savings(
+        driver,
+        [server.url('heavy?images=12&delay=100&size=40000'), EXAMPLE_URL],
+        ('images', 'media', 'fonts', 'analytics', 'ads'),
+    )
+    print_savings_report(report)
+    driver.quit()
+
+
 # ---------------------------------------------------------------------------
 # 8. Print page to PDF
 # ---------------------------------------------------------------------------
@@ -342,6 +400,8 @@ def print_page_to_pdf():
 if __name__ == '__main__':
     start_basic()
     start_headless()
+    compare_cold_start()
     list_log_types()
+    block_resource_categories()
     print_page_to_pdf()
 
@@ -9,6 +9,7 @@ This module focuses on:
     - W3C common capabilities
     - Edge-specific options (ms:edgeOptions)
     - Local and remote-ready option building
+    - Fast-launch switch set (support/fast_launch.py)
 
 The examples build options objects and print capabilities, so the file is
 executable without requiring Selenium Grid.
@@ -18,11 +19,18 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.common.proxy import Proxy, ProxyType
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/browsers/edge/options.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support.fast_launch import fast_launch_options  # noqa: E402
+
 
 def common_w3c_options() -> webdriver.EdgeOptions:
     """Common W3C capabilities supported by Selenium options classes."""
@@ -143,6 +151,13 @@ def edge_custom_capabilities() -> webdriver.EdgeOptions:
     return options
 
 
+def edge_fast_launch() -> webdriver.EdgeOptions:
+    """Fastest cold start for CI: the Chromium fast-launch switches on Edge."""
+    options = webdriver.EdgeOptions()
+    options.add_argument('--window-size=1366,768')
+    return fast_launch_options('edge', options)
+
+
 def all_examples() -> dict[str, webdriver.EdgeOptions]:
     """Collect all option builders in one place."""
     return {
@@ -155,6 +170,7 @@ def all_examples() -> dict[str, webdriver.EdgeOptions]:
         'edge_webview2_example': edge_webview2_example(),
         'edge_mobile_android_example': edge_mobile_android_example(),
         'edge_custom_capabilities': edge_custom_capabilities(),
+        'edge_fast_launch': edge_fast_launch(),
     }
 
 
@@ -23,12 +23,19 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/browsers/edge/service.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support.driver_cache import resolve_driver_path  # noqa: E402
+
 EXAMPLE_URL = 'https://www.example.com/'
 OUTPUT_DIR = Path(__file__).parents[3] / 'output'
 
@@ -82,7 +89,7 @@ def service_custom_port():
     Defaults to 0 (OS picks a free port automatically).
     """
     service = Service(
-        executable_path=EdgeChromiumDriverManager().install(),
+        executable_path=resolve_driver_path('edge'),
         port=17564,
     )
     driver = _build_driver(service)
@@ -101,7 +108,7 @@ def service_log_to_file():
     """
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     service = Service(
-        executable_path=EdgeChromiumDriverManager().install(),
+        executable_path=resolve_driver_path('edge'),
         log_path=str(OUTPUT_DIR / 'msedgedriver.log'),
     )
     driver = _build_driver(service)
@@ -115,7 +122,7 @@ def service_log_to_stdout():
     Useful for CI environments where logs are captured from stdout.
     """
     service = Service(
-        executable_path=EdgeChromiumDriverManager().install(),
+        executable_path=resolve_driver_path('edge'),
         log_path=subprocess.STDOUT,
     )
     driver = _build_driver(service)
@@ -133,7 +140,7 @@ def service_log_level():
     Valid values: ALL, DEBUG, INFO, WARNING, SEVERE, OFF
     """
     service = Service(
-        executable_path=EdgeChromiumDriverManager().install(),
+        executable_path=resolve_driver_path('edge'),
         service_args=['--log-level=DEBUG'],
         log_path=str(OUTPUT_DIR / 'msedgedriver.log'),
     )
@@ -148,7 +155,7 @@ def service_append_log():
     """
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     service = Service(
-        executable_path=EdgeChromiumDriverManager().install(),
+        executable_path=resolve_driver_path('edge'),
         service_args=['--append-log'],
         log_path=str(OUTPUT_DIR / 'msedgedriver.log'),
     )
@@ -163,7 +170,7 @@ def service_readable_log():
     """
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     service = Service(
-        executable_path=EdgeChromiumDriverManager().install(),
+        executable_path=resolve_driver_path('edge'),
         service_args=['--readable-timestamp'],
         log_path=str(OUTPUT_DIR / 'msedgedriver.log'),
     )
@@ -178,7 +185,7 @@ def service_disable_build_check():
     Useful when testing with a patched or non-standard Edge build.
     """
     service = Service(
-        executable_path=EdgeChromiumDriverManager().install(),
+        executable_path=resolve_driver_path('edge'),
         service_args=['--disable-build-check'],
     )
     driver = _build_driver(service)
@@ -197,7 +204,7 @@ def service_custom_env():
     """
     custom_env = {**os.environ, 'MY_CUSTOM_VAR': 'selenium_example'}
     service = Service(
-        executable_path=EdgeChromiumDriverManager().install(),
+        executable_path=resolve_driver_path('edge'),
         env=custom_env,
     )
     driver = _build_driver(service)
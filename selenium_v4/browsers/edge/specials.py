@@ -19,19 +19,23 @@ Topics covered:
 from __future__ import annotations
 
 import os
+import sys
 from pathlib import Path
 
 from selenium import webdriver
-from selenium.webdriver.edge.service import Service
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/browsers/edge/specials.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver  # noqa: E402
 
 EXAMPLE_URL = 'https://www.example.com/'
 
 
 def _build_driver(options: webdriver.EdgeOptions | None = None) -> webdriver.Edge:
     """Helper: build a local Edge driver."""
-    service = Service(executable_path=EdgeChromiumDriverManager().install())
-    return webdriver.Edge(service=service, options=options or webdriver.EdgeOptions())
+    return build_driver('edge', options)
 
 
 # ---------------------------------------------------------------------------
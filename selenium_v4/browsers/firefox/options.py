@@ -9,6 +9,8 @@ This module focuses on:
     - W3C common capabilities
     - Firefox-specific options (moz:firefoxOptions)
     - Local and remote-ready option building
+    - Resource blocking through preferences (support/resource_blocking.py)
+    - Fast-launch arguments and preferences (support/fast_launch.py)
 
 The examples build options objects and print capabilities, so the file is
 executable without requiring Selenium Grid.
@@ -18,12 +20,20 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.common.proxy import Proxy, ProxyType
 from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/browsers/firefox/options.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support.fast_launch import fast_launch_options  # noqa: E402
+from selenium_v4.support.resource_blocking import firefox_block_prefs  # noqa: E402
+
 
 def common_w3c_options() -> webdriver.FirefoxOptions:
     """Common W3C capabilities supported by Selenium options classes."""
@@ -125,6 +135,23 @@ def firefox_custom_capabilities() -> webdriver.FirefoxOptions:
     return options
 
 
+def firefox_resource_blocking() -> webdriver.FirefoxOptions:
+    """
+    Firefox counterpart of the Chromium URL-pattern blocking: preferences that
+    stop images, web fonts, media preloading and tracker/ad requests.
+    """
+    options = webdriver.FirefoxOptions()
+    options.page_load_strategy = 'eager'
+    for name, value in firefox_block_prefs(('images', 'media', 'fonts', 'analytics', 'ads')).items():
+        options.set_preference(name, value)
+    return options
+
+
+def firefox_fast_launch() -> webdriver.FirefoxOptions:
+    """Fastest cold start for CI: -headless plus prefs that skip first-run, telemetry and update checks."""
+    return fast_launch_options('firefox', webdriver.FirefoxOptions())
+
+
 def all_examples() -> dict[str, webdriver.FirefoxOptions]:
     """Collect all option builders in one place."""
     return {
@@ -136,6 +163,8 @@ def all_examples() -> dict[str, webdriver.FirefoxOptions]:
         'firefox_proxy_example': firefox_proxy_example(),
         'firefox_mobile_android_example': firefox_mobile_android_example(),
         'firefox_custom_capabilities': firefox_custom_capabilities(),
+        'firefox_resource_blocking': firefox_resource_blocking(),
+        'firefox_fast_launch': firefox_fast_launch(),
     }
 
 
@@ -21,12 +21,19 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.firefox.service import Service
 from webdriver_manager.firefox import GeckoDriverManager
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/browsers/firefox/service.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support.driver_cache import resolve_driver_path  # noqa: E402
+
 EXAMPLE_URL = 'https://www.example.com/'
 OUTPUT_DIR = Path(__file__).parents[3] / 'output'
 GECKODRIVER_LOG = GECKODRIVER_LOG
@@ -82,7 +89,7 @@ def service_custom_port():
     Defaults to 0 (OS picks a free port automatically).
     """
     service = Service(
-        executable_path=GeckoDriverManager().install(),
+        executable_path=resolve_driver_path('firefox'),
         port=4444,
     )
     driver = _build_driver(service)
@@ -101,7 +108,7 @@ def service_log_to_file():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     log_file = OUTPUT_DIR / GECKODRIVER_LOG
     service = Service(
-        executable_path=GeckoDriverManager().install(),
+        executable_path=resolve_driver_path('firefox'),
         log_output=str(log_file),
     )
     driver = _build_driver(service)
@@ -116,7 +123,7 @@ def service_log_to_stdout():
     Useful in CI environments where logs are captured from stdout.
     """
     service = Service(
-        executable_path=GeckoDriverManager().install(),
+        executable_path=resolve_driver_path('firefox'),
         log_output=subprocess.STDOUT,
     )
     driver = _build_driver(service)
@@ -135,7 +142,7 @@ def service_log_level():
     """
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     service = Service(
-        executable_path=GeckoDriverManager().install(),
+        executable_path=resolve_driver_path('firefox'),
         service_args=['--log', 'debug'],
         log_output=str(OUTPUT_DIR / GECKODRIVER_LOG),
     )
@@ -151,7 +158,7 @@ def service_log_no_truncate():
     """
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     service = Service(
-        executable_path=GeckoDriverManager().install(),
+        executable_path=resolve_driver_path('firefox'),
         service_args=['--log-no-truncate'],
         log_output=str(OUTPUT_DIR / GECKODRIVER_LOG),
     )
@@ -171,7 +178,7 @@ def service_custom_env():
     """
     custom_env = {**os.environ, 'MY_CUSTOM_VAR': 'selenium_example'}
     service = Service(
-        executable_path=GeckoDriverManager().install(),
+        executable_path=resolve_driver_path('firefox'),
         env=custom_env,
     )
     driver = _build_driver(service)
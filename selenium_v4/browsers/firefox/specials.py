@@ -8,9 +8,9 @@ https://www.selenium.dev/documentation/webdriver/browsers/firefox/
 Topics covered:
     - Starting Firefox (basic, headless, private, keep open)
     - Custom binary location
-    - Firefox Profile (preferences, custom profile directory)
-    - Install / uninstall add-ons at runtime (signed xpi, temporary/unsigned)
-    - Full page screenshot
+    - Firefox Profile (preferences, custom profile directory, warmed profile snapshots)
+    - Install / uninstall add-ons at runtime (signed xpi, temporary/unsigned, cached payloads)
+    - Full page screenshot (plain, and stored once per distinct frame)
     - Contexts (chrome vs content)
     - Permissions (Selenium set_permissions)
     - Print page to PDF
@@ -20,12 +20,21 @@ from __future__ import annotations
 
 import base64
 import os
+import sys
+import time
 from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
-from selenium.webdriver.firefox.service import Service
-from webdriver_manager.firefox import GeckoDriverManager
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/browsers/firefox/specials.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver  # noqa: E402
+from selenium_v4.support.extension_cache import default_cache, install_cached_addon  # noqa: E402
+from selenium_v4.support.profile_snapshots import ProfileSnapshot, SnapshotSpec  # noqa: E402
+from selenium_v4.support.screenshots import ScreenshotService  # noqa: E402
 
 EXAMPLE_URL = 'https://www.example.com/'
 OUTPUT_DIR = Path(__file__).parents[3] / 'output'
@@ -33,8 +42,7 @@ OUTPUT_DIR = Path(__file__).parents[3] / 'output'
 
 def _build_driver(options: webdriver.FirefoxOptions | None = None) -> webdriver.Firefox:
     """Helper: build a local Firefox driver via webdriver-manager."""
-    service = Service(executable_path=GeckoDriverManager().install())
-    return webdriver.Firefox(service=service, options=options or webdriver.FirefoxOptions())
+    return build_driver('firefox', options)
 
 
 # ---------------------------------------------------------------------------
@@ -143,6 +151,46 @@ def start_with_profile_preferences():
     driver.quit()
 
 
+def start_with_profile_snapshot():
+    """
+    Prepare a warmed profile once and start every session from a clone of it.
+    Preferences, the signed add-on in FIREFOX_ADDON_XPI (if set) and a primed
+    cache are set up by the first run only; later sessions and later runs
+    skip profile generation and add-on installation.
+    """
+    prefs = {
+        'browser.download.folderList': 2,
+        'browser.download.dir': str(OUTPUT_DIR.resolve()),
+        'pdfjs.disabled': True,
+        'intl.accept_languages': 'en-US',
+    }
+    addon_path = os.getenv('FIREFOX_ADDON_XPI')
+    addons = (addon_path,) if addon_path and Path(addon_path).exists() else ()
+
+    # Baseline: generated profile, add-on installed into every session.
+    started = time.perf_counter()
+    options = webdriver.FirefoxOptions()
+    for name, value in prefs.items():
+        options.set_preference(name, value)
+    driver = _build_driver(options)
+    for addon in addons:
+        driver.install_addon(addon)
+    driver.get(EXAMPLE_URL)
+    driver.quit()
+    print(f'Generated profile: {time.perf_counter() - started:.2f}s')
+
+    snapshot = ProfileSnapshot('firefox-specials', SnapshotSpec('firefox', prefs, addons, warm_urls=(EXAMPLE_URL,)))
+    started = time.perf_counter()
+    snapshot.prepare()
+    print(f'Snapshot {snapshot.path} ready in {time.perf_counter() - started:.2f}s')
+
+    for _ in range(3):
+        started = time.perf_counter()
+        with snapshot.session() as driver:
+            driver.get(EXAMPLE_URL)
+        print(f'Snapshot clone: {time.perf_counter() - started:.2f}s')
+
+
 # ---------------------------------------------------------------------------
 # 4. Add-ons at runtime
 # ---------------------------------------------------------------------------
@@ -182,6 +230,25 @@ def install_unsigned_addon():
     driver.quit()
 
 
+def install_cached_addons():
+    """
+    Install the add-ons of FIREFOX_ADDON_XPI / FIREFOX_ADDON_DIR in several
+    sessions; the directory is zipped and both are base64-encoded once,
+    later sessions (and later runs) reuse the cached payload.
+    Unpooled: an installed add-on would otherwise stay in the pooled session.
+    """
+    xpi = os.getenv('FIREFOX_ADDON_XPI')
+    addon_dir = os.getenv('FIREFOX_ADDON_DIR')
+    for _ in range(3):
+        driver = build_driver('firefox', pooled=False)
+        if xpi and Path(xpi).exists():
+            print(f'Installed addon ID: {install_cached_addon(driver, xpi)}')
+        if addon_dir and Path(addon_dir).exists():
+            print(f'Installed temporary addon ID: {install_cached_addon(driver, addon_dir, temporary=True)}')
+        driver.quit()
+    print(default_cache().stats)
+
+
 # ---------------------------------------------------------------------------
 # 5. Full page screenshot
 # ---------------------------------------------------------------------------
@@ -202,6 +269,22 @@ def full_page_screenshot():
     driver.quit()
 
 
+def full_page_screenshots_stored_once():
+    """
+    Full-page captures through ScreenshotService: decoded and written on a
+    worker thread, a page captured again unchanged costs no disk write.
+    """
+    driver = _build_driver()
+    driver.get(EXAMPLE_URL)
+
+    with ScreenshotService(OUTPUT_DIR / 'screenshots') as shots:
+        for _ in range(3):
+            shots.capture(driver, 'firefox-full-page', full_page=True)
+    print(shots.stats)
+
+    driver.quit()
+
+
 # ---------------------------------------------------------------------------
 # 6. Contexts (chrome vs content)
 # ---------------------------------------------------------------------------
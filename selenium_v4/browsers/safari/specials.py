@@ -21,17 +21,25 @@ Topics covered:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
 from selenium.webdriver.safari.options import Options as SafariOptions
 from selenium.webdriver.safari.service import Service
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/browsers/safari/specials.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver  # noqa: E402
+
 EXAMPLE_URL = 'https://www.example.com/'
 
 
 def _build_driver(options: SafariOptions | None = None) -> webdriver.Safari:
     """Helper: build a local Safari driver."""
-    service = Service()  # safaridriver is in /usr/bin/safaridriver by default
-    return webdriver.Safari(service=service, options=options or SafariOptions())
+    return build_driver('safari', options)
 
 
 # ---------------------------------------------------------------------------
@@ -56,7 +56,17 @@ strictFileInteractability - This new capability indicates if strict interactabil
 type=file elements. As strict interactability checks are off by default, there is a change in behavior when using
 Element Send Keys with hidden file upload controls.
 
+Load profiles - selenium_v4/support/load_profiles.py bundles pageLoadStrategy with resource blocking into named
+profiles ("strict": normal; "fast": eager + images blocked) that every _build_driver() applies when
+SELENIUM_EXAMPLES_LOAD_PROFILE is set. benchmark_load_profiles() measures driver.get() per page for each profile on the
+local fixture site.
+
 """
+import statistics
+import sys
+import time
+from pathlib import Path
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -66,6 +76,21 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/drivers/local/capabilities.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver, shared_server  # noqa: E402
+from selenium_v4.support.load_profiles import PROFILES  # noqa: E402
+
+BENCHMARK_PAGES = (
+    'heavy?images=12&delay=300',
+    'www.example.com/',
+    'www.selenium.dev/selenium/web/web-form.html',
+    'www.selenium.dev/selenium/web/dynamic.html',
+)
+BENCHMARK_ROUNDS = 5
+
 
 # Configuring driver capabilities.
 def general_capabilities_att():
@@ -164,6 +189,38 @@ def edge_capabilities_att():
     driver.quit()
 
 
+# Page-load profiles measured on the fixture site.
+def benchmark_load_profiles():
+    """
+    Time driver.get() of every BENCHMARK_PAGES fixture page under each load
+    profile (one fresh session per profile, first visit discarded as warm-up)
+    and report the median per page and the time saved against "strict".
+    """
+    server = shared_server()
+    timings = {}
+    for name in PROFILES:
+        driver = build_driver('chrome', pooled=False, profile=name)
+        for page in BENCHMARK_PAGES:
+            driver.get(server.url(page))
+            samples = []
+            for _ in range(BENCHMARK_ROUNDS):
+                start = time.perf_counter()
+                driver.get(server.url(page))
+                samples.append(time.perf_counter() - start)
+            timings[name, page] = statistics.median(samples)
+        driver.quit()
+
+    width = max(len(page) for page in BENCHMARK_PAGES)
+    print(f'{"page":<{width}}  ' + '  '.join(f'{name:>9}' for name in PROFILES) + '  saved by fast')
+    for page in BENCHMARK_PAGES:
+        row = '  '.join(f'{timings[name, page] * 1000:7.1f}ms' for name in PROFILES)
+        saved = timings['strict', page] - timings['fast', page]
+        print(f'{page:<{width}}  {row}  {saved * 1000:+9.1f}ms')
+    total = sum(timings['strict', page] - timings['fast', page] for page in BENCHMARK_PAGES)
+    print(f'Mean saved per page: {total / len(BENCHMARK_PAGES) * 1000:.1f} ms')
+
+
 if __name__ == '__main__':
     general_capabilities_att()
+    benchmark_load_profiles()
 
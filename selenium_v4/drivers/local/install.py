@@ -37,11 +37,19 @@ Download link for drivers:
     - Safari: Built in
 """
 import os
+import sys
+from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/drivers/local/install.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support.driver_cache import resolve_driver_path  # noqa: E402
+
 URL = 'https://www.example.com/'
 
 
@@ -68,6 +76,21 @@ def driver_management_software():
     driver.quit()
 
 
+# second way, resolved once per process and cached on disk
+def driver_management_software_cached():
+    """
+    Same as driver_management_software(), but the resolved path is cached.
+
+    The first call runs ChromeDriverManager().install(); later calls (also from other processes, until the TTL
+    expires) return the cached path. Set SELENIUM_EXAMPLES_OFFLINE_DRIVERS=1 to never contact the network.
+    """
+    service = Service(executable_path=resolve_driver_path('chrome'))
+    driver = webdriver.Chrome(service=service)
+    driver.get(URL)
+    # do something
+    driver.quit()
+
+
 # third way to use the driver
 def driver_environment_variable():
     """
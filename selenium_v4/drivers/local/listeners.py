@@ -28,15 +28,41 @@ AbstractEventListener has the methods to implement:
     - after_quit
     - on_exception
 
+MetricsListener (selenium_v4/support/metrics_listener.py) implements all of
+them to record per-command duration histograms and exception counts,
+exported as Prometheus text or JSON.
+
+attach_listeners() (selenium_v4/support/listener_dispatch.py) fires the same
+callbacks without EventFiringWebDriver's wrapping: it hooks only the
+callbacks a listener implements and returns elements unwrapped.
+benchmark_event_dispatch() compares the two on an element-heavy flow.
+
 Relevant module:
 selenium/webdriver/support/events.py
 """
+import sys
+import time
+from pathlib import Path
+
 from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.events import AbstractEventListener, EventFiringWebDriver
 from webdriver_manager.chrome import ChromeDriverManager
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/drivers/local/listeners.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver  # noqa: E402
+from selenium_v4.support.listener_dispatch import attach_listeners, detach_listeners  # noqa: E402
+from selenium_v4.support.metrics_listener import CommandMetrics, MetricsListener  # noqa: E402
+
+OUTPUT_DIR = Path(__file__).parents[3] / 'output'
+BENCHMARK_ELEMENTS = 300
+BENCHMARK_ROUNDS = 3
+
 # AbstractEventListener subclass declaration
 class WebDriverListener(AbstractEventListener):
     """
@@ -83,6 +109,92 @@ def listeners():
     listener_driver.quit()
 
 
+class ScriptEventCounter(AbstractEventListener):
+    """
+    Counts execute_script events; element getters (atoms) must not produce any.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def before_execute_script(self, script, driver) -> None:
+        self.count += 1
+
+
+# Per-command latency metrics
+def metrics_listener():
+    """
+    Record how long each command takes with MetricsListener, then export
+    the histograms as a Prometheus textfile and as JSON.
+    """
+    metrics = CommandMetrics()
+    driver = EventFiringWebDriver(build_driver('chrome', pooled=False), MetricsListener(metrics))
+
+    driver.get('https://www.example.com/')
+    for _ in range(5):
+        driver.find_element(By.TAG_NAME, 'h1')
+    try:
+        driver.find_element(By.ID, 'missing')
+    except NoSuchElementException:
+        pass
+    driver.execute_script('return document.readyState')
+    driver.find_element(By.TAG_NAME, 'a').click()
+    driver.quit()
+
+    metrics.print_report()
+    print(f"Prometheus: {metrics.write_prometheus(OUTPUT_DIR / 'selenium_commands.prom')}")
+    print(f"JSON: {metrics.write_json(OUTPUT_DIR / 'selenium_commands.json')}")
+
+
+# EventFiringWebDriver against attach_listeners()
+def _element_heavy_flow(driver) -> float:
+    start = time.perf_counter()
+    items = driver.find_elements(By.CSS_SELECTOR, 'li.bench')
+    for item in items:
+        item.text
+        item.get_attribute('data-index')
+    items[0].click()
+    return time.perf_counter() - start
+
+
+def benchmark_event_dispatch():
+    """
+    Run the same find_elements + per-element reads three ways on one session:
+    no listener, EventFiringWebDriver(MetricsListener) and
+    attach_listeners(MetricsListener). Reports the best of BENCHMARK_ROUNDS.
+    """
+    driver = build_driver('chrome', pooled=False)
+    driver.get('https://www.example.com/')
+    driver.execute_script(
+        "const list = document.body.appendChild(document.createElement('ul'));"
+        "for (let i = 0; i < arguments[0]; i++) {"
+        "  const li = list.appendChild(document.createElement('li'));"
+        "  li.className = 'bench'; li.dataset.index = i; li.textContent = 'item ' + i;"
+        "}",
+        BENCHMARK_ELEMENTS,
+    )
+
+    timings = {}
+    timings['plain driver'] = min(_element_heavy_flow(driver) for _ in range(BENCHMARK_ROUNDS))
+    wrapped = EventFiringWebDriver(driver, MetricsListener())
+    timings['EventFiringWebDriver'] = min(_element_heavy_flow(wrapped) for _ in range(BENCHMARK_ROUNDS))
+    script_events = ScriptEventCounter()
+    attach_listeners(driver, MetricsListener(), script_events)
+    timings['attach_listeners'] = min(_element_heavy_flow(driver) for _ in range(BENCHMARK_ROUNDS))
+    detach_listeners(driver)
+    # get_attribute() runs a JavaScript atom; it is not a user script and must not be reported as one.
+    if script_events.count:
+        raise AssertionError(f'element getters fired {script_events.count} execute_script event(s)')
+    driver.quit()
+
+    baseline = timings['plain driver']
+    print(f'{BENCHMARK_ELEMENTS} elements, 2 reads each, best of {BENCHMARK_ROUNDS}:')
+    for name, seconds in timings.items():
+        print(f'  {name:<22} {seconds:7.3f} s  ({(seconds - baseline) * 1000:+.1f} ms vs plain)')
+
+
 if __name__ == '__main__':
     listeners()
+    metrics_listener()
+    benchmark_event_dispatch()
 
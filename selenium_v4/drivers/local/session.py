@@ -1,11 +1,27 @@
 # -*- coding: utf-8 -*-
 """
 Starting and stopping local sessions (open/close browser) with Selenium 4.
+
+Reusing a session is cheaper than starting a new one only if the reuse is
+safe: compare_reset_and_relaunch() times reset_session()
+(selenium_v4/support/session_reset.py, what pooled and brokered sessions
+get on quit()) against quitting and relaunching the browser, and reports
+any state the reset left behind.
 """
+import sys
+from pathlib import Path
+
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/drivers/local/session.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import shared_server  # noqa: E402
+from selenium_v4.support.session_reset import measure_reset  # noqa: E402
+
 
 # Creating session with local driver
 def local_driver():
@@ -18,10 +34,18 @@ def local_driver():
     driver.quit()
 
 
+# Reusing a session instead of relaunching it
+def compare_reset_and_relaunch(runs: int = 5):
+    """
+    Leave cookies, storage, an IndexedDB and a second tab behind on a local
+    fixture page, then compare a full reset with a browser relaunch.
+    """
+    url = shared_server().url('www.example.com/')
+    print(measure_reset('chrome', runs=runs, url=url))
+
+
 # TODO: add example configuration for firefox and edge.
 
 if __name__ == '__main__':
     local_driver()
-
-
-
+    compare_reset_and_relaunch()
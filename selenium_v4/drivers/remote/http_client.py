@@ -13,17 +13,34 @@ Notes:
     - In Selenium 4.9.x, RemoteConnection is the primary customization API.
     - Newer Selenium releases also expose ClientConfig. This file includes a
       compatibility helper that only runs that example when available.
+    - support/http_pool.py adds PooledRemoteConnection: one kept-alive
+      connection pool per hub shared by every session, with a configurable
+      size and hit/miss/wait counters.
+    - support/async_driver.py adds an asyncio client (AsyncWebDriver) that
+      sends the same commands from one event loop, without a thread per session.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from urllib.parse import urlparse
 
 from selenium import webdriver
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.command import Command
 from selenium.webdriver.remote.remote_connection import RemoteConnection
 
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/drivers/remote/http_client.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support.async_driver import AsyncHttpClient, AsyncWebDriver  # noqa: E402
+from selenium_v4.support.http_pool import PooledRemoteConnection, pool_stats  # noqa: E402
+
 GRID_URL = os.getenv('SELENIUM_GRID_URL', 'http://127.0.0.1:4444/wd/hub')
 EXAMPLE_URL = 'https://www.example.com/'
 
@@ -83,6 +100,60 @@ def remote_with_custom_http_client() -> None:
     driver.quit()
 
 
+def pooled_remote_connection(pool_size: int = 16) -> PooledRemoteConnection:
+    """
+    RemoteConnection drawing on one process-wide pool per hub.
+
+    pool_size connections per host are kept alive and shared by every session to
+    GRID_URL; with block=True, requests beyond that wait for a free connection
+    instead of opening (and then discarding) extra sockets.
+    """
+    return PooledRemoteConnection(GRID_URL, pool_size=pool_size, block=True, pool_timeout=30)
+
+
+def parallel_sessions_on_shared_pool(sessions: int = 4) -> dict:
+    """Drive several remote sessions from threads over the shared pool and return its counters."""
+
+    def run_session(_index: int) -> str:
+        driver = webdriver.Remote(command_executor=pooled_remote_connection(), options=webdriver.ChromeOptions())
+        try:
+            driver.get(EXAMPLE_URL)
+            return driver.title
+        finally:
+            driver.quit()
+
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        titles = list(executor.map(run_session, range(sessions)))
+    print(f'Titles: {titles}')
+    stats = pool_stats()
+    print(f'Connection pool: {stats}')
+    return stats
+
+
+async def _async_session_title(client: AsyncHttpClient) -> str:
+    async with await AsyncWebDriver.create(client, webdriver.ChromeOptions()) as driver:
+        await driver.get(EXAMPLE_URL)
+        heading = await driver.wait_until(lambda d: d.find_element(By.TAG_NAME, 'h1'), timeout=10)
+        return f'{await driver.title()} / {await heading.text()}'
+
+
+def async_sessions(sessions: int = 20) -> list[str]:
+    """
+    Drive many sessions from one thread: AsyncWebDriver commands are awaitables over a
+    shared asyncio connection pool, so asyncio.gather() overlaps all their round trips.
+    """
+
+    async def main() -> list[str]:
+        async with AsyncHttpClient(GRID_URL, max_connections=sessions) as client:
+            titles = await asyncio.gather(*(_async_session_title(client) for _ in range(sessions)))
+            print(f'connections opened: {client.opened}, reused: {client.reused}')
+            return titles
+
+    titles = asyncio.run(main())
+    print(f'Titles: {titles}')
+    return titles
+
+
 def client_config_example_if_available() -> str:
     """Show whether selenium.webdriver.remote.client_config is available."""
     try:
@@ -105,6 +176,8 @@ def print_documentation_examples() -> None:
     print(f'- timeout: {connection.get_timeout()}')
     print(f'- certificate bundle: {connection.get_certificate_bundle_path()}')
     print(f'- headers preview: {headers}')
+    pooled = pooled_remote_connection()
+    print(f'- pooled transport: hub={pooled.hub}, pool_size={pooled.pool_size}, block={pooled.block}')
     print(f'- {client_config_example_if_available()}')
 
 
@@ -112,6 +185,8 @@ def run_live_remote_examples() -> None:
     """Run real remote sessions (requires a reachable Selenium Grid)."""
     basic_remote_with_keep_alive()
     remote_with_custom_http_client()
+    parallel_sessions_on_shared_pool()
+    async_sessions()
 
 
 if __name__ == '__main__':
@@ -21,26 +21,36 @@ Covered topics:
     - Waiting for element visibility, clickability, text, title, URL
     - Waiting for multiple elements
     - Handling TimeoutException
+    - Mutation-driven waits: wake on DOM changes instead of polling (support.mutation_wait)
+    - Composite waits: several conditions in one script per poll (support.composite_wait)
 """
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
 
-DYNAMIC_PAGE = 'https://www.selenium.dev/selenium/web/dynamic.html'
-EXAMPLE_URL = 'https://www.example.com/'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/elements/waits/explicit_waits.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+from selenium_v4.support.composite_wait import all_of, first_of  # noqa: E402
+from selenium_v4.support.mutation_wait import MutationWait  # noqa: E402
+
+DYNAMIC_PAGE = target_url('https://www.selenium.dev/selenium/web/dynamic.html')
+EXAMPLE_URL = target_url('https://www.example.com/')
 DEFAULT_TIMEOUT = 5  # seconds
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -219,7 +229,71 @@ def explicit_wait_timeout_handling():
         driver.quit()
 
 
+# ---------------------------------------------------------------------------
+# 4. Mutation-driven waits
+# ---------------------------------------------------------------------------
+
+def explicit_wait_on_mutation():
+    """
+    MutationWait accepts the same conditions as WebDriverWait but re-evaluates them
+    only when the DOM changed: a MutationObserver in the page answers one
+    execute_async_script per change (or per poll_frequency), instead of one
+    condition evaluation every 0.5 seconds.
+    """
+    driver = _build_driver()
+    driver.get(DYNAMIC_PAGE)
+
+    driver.find_element(By.ID, 'adder').click()
+
+    wait = MutationWait(driver, DEFAULT_TIMEOUT)
+    box = wait.until(EC.presence_of_element_located((By.ID, 'box0')))
+    print(f'Element present in DOM: {box.get_attribute("class")}')
+    print(f'Wait cost: {wait.last_stats}')
+
+    driver.quit()
+
+
+# ---------------------------------------------------------------------------
+# 5. Composite waits — many conditions, one round trip per poll
+# ---------------------------------------------------------------------------
+
+def explicit_wait_composite():
+    """
+    all_of() / any_of() / first_of() accept the usual EC helpers but evaluate them
+    together in one execute_script per poll, instead of one or more commands per
+    condition. Conditions that cannot be compiled (lambdas, alerts, ...) still work
+    and run in Python after the script.
+    """
+    driver = _build_driver()
+    driver.get(DYNAMIC_PAGE)
+
+    driver.find_element(By.ID, 'adder').click()
+    driver.find_element(By.ID, 'adder').click()
+    driver.find_element(By.ID, 'reveal').click()
+
+    wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
+    ready = all_of(
+        EC.presence_of_all_elements_located((By.CLASS_NAME, 'redbox')),
+        EC.visibility_of_element_located((By.ID, 'revealed')),
+        EC.element_to_be_clickable((By.ID, 'adder')),
+    )
+    boxes, revealed, _ = wait.until(ready)
+    print(f'Boxes: {len(boxes)}, revealed visible: {revealed.is_displayed()}')
+    print(f'{ready!r}: {ready.stats}')
+
+    # first_of() tells which outcome happened first.
+    index, _ = wait.until(first_of(
+        EC.presence_of_element_located((By.ID, 'box2')),
+        EC.presence_of_element_located((By.ID, 'box1')),
+    ))
+    print(f'First satisfied condition: #{index}')
+
+    driver.quit()
+
+
 if __name__ == '__main__':
     explicit_wait_lambda()
     explicit_wait_element_visible()
     explicit_wait_element_present()
+    explicit_wait_on_mutation()
+    explicit_wait_composite()
@@ -21,12 +21,15 @@ Covered topics:
     - FluentWait with a callable condition
     - FluentWait with ExpectedConditions
     - Polling with side effects (performing actions inside the condition)
+    - Adaptive polling: back-off schedule and learned latency (support.adaptive_wait)
 """
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -36,15 +39,20 @@ from selenium.common.exceptions import (
     StaleElementReferenceException,
     TimeoutException,
 )
-from webdriver_manager.chrome import ChromeDriverManager
 
-DYNAMIC_PAGE = 'https://www.selenium.dev/selenium/web/dynamic.html'
-EXAMPLE_URL = 'https://www.example.com/'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/elements/waits/fluent_waits.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+from selenium_v4.support.adaptive_wait import AdaptiveWait, BackoffSchedule, print_poll_report  # noqa: E402
+
+DYNAMIC_PAGE = target_url('https://www.selenium.dev/selenium/web/dynamic.html')
+EXAMPLE_URL = target_url('https://www.example.com/')
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -206,7 +214,36 @@ def fluent_wait_with_ec():
     driver.quit()
 
 
+# ---------------------------------------------------------------------------
+# 7. Adaptive polling — back-off schedule and learned latency
+# ---------------------------------------------------------------------------
+
+def fluent_wait_adaptive():
+    """
+    AdaptiveWait replaces the fixed poll_frequency with a schedule that starts at
+    50ms and backs off to at most 1s. After the first wait it knows roughly how long
+    the condition takes and stays at the slow interval until shortly before that,
+    so repeated waits on the same condition cost fewer polls without noticing the
+    change later. print_poll_report() shows polls per wait for each condition.
+    """
+    driver = _build_driver()
+    schedule = BackoffSchedule(initial=0.05, factor=1.6, maximum=1.0)
+
+    for _ in range(3):
+        driver.get(DYNAMIC_PAGE)
+        driver.find_element(By.ID, 'adder').click()
+
+        wait = AdaptiveWait(driver, timeout=5, schedule=schedule)
+        wait.until(EC.presence_of_element_located((By.ID, 'box0')))
+        print(f'polls: {wait.last_stats.polls}, seconds: {wait.last_stats.seconds:.2f}')
+
+    print_poll_report()
+
+    driver.quit()
+
+
 if __name__ == '__main__':
     fluent_wait_basic()
     fluent_wait_ignore_exceptions()
     fluent_wait_dynamic_element()
+    fluent_wait_adaptive()
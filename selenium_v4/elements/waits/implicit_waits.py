@@ -23,17 +23,23 @@ WARNING:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 
-DYNAMIC_PAGE = 'https://www.selenium.dev/selenium/web/dynamic.html'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/elements/waits/implicit_waits.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+
+DYNAMIC_PAGE = target_url('https://www.selenium.dev/selenium/web/dynamic.html')
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -66,8 +72,7 @@ def implicit_wait_via_options():
     options = webdriver.ChromeOptions()
     options.timeouts = {'implicit': 2000}  # milliseconds in capabilities
 
-    service = Service(executable_path=ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    driver = build_driver('chrome', options)
     driver.get(DYNAMIC_PAGE)
 
     driver.find_element(By.ID, 'adder').click()
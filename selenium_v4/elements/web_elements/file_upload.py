@@ -20,22 +20,26 @@ Topics:
 from __future__ import annotations
 
 import os
+import sys
 from pathlib import Path
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
-UPLOAD_PAGE = 'https://the-internet.herokuapp.com/upload'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/elements/web_elements/file_upload.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+
+UPLOAD_PAGE = target_url('https://the-internet.herokuapp.com/upload')
 RESOURCES_DIR = Path(__file__).parents[3] / 'resources'
 
 
 def _build_driver(options: webdriver.ChromeOptions | None = None) -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options or webdriver.ChromeOptions())
+    return build_driver('chrome', options)
 
 
 def _get_upload_file() -> str:
@@ -15,6 +15,7 @@ Topics:
     - All matching elements (find_elements)
     - Get element from a collection by index
     - Find elements from element (scoped search)
+    - Projecting attributes of all matches in one round trip (support.projection)
     - Get active element
 
 HTML reference used in finders documentation:
@@ -28,19 +29,26 @@ HTML reference used in finders documentation:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 
-FINDERS_PAGE = 'https://www.selenium.dev/selenium/web/locators_tests/locators.html'
-EXAMPLE_URL = 'https://www.example.com/'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/elements/web_elements/finders.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+from selenium_v4.support.projection import iter_project, project  # noqa: E402
+
+FINDERS_PAGE = target_url('https://www.selenium.dev/selenium/web/locators_tests/locators.html')
+EXAMPLE_URL = target_url('https://www.example.com/')
 GOOGLE_URL = 'https://www.google.com/'
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -163,7 +171,43 @@ def find_elements_from_element():
 
 
 # ---------------------------------------------------------------------------
-# 4. Get active element
+# 4. Projecting attributes of all matches — support.projection
+# ---------------------------------------------------------------------------
+
+def find_all_elements_projected():
+    """
+    Same output as find_all_elements(), but the locator and both get_attribute() reads
+    run in the page in one execute_script: 1 round trip instead of 2N + 1.
+    """
+    driver = _build_driver()
+    driver.get(FINDERS_PAGE)
+
+    inputs = project(driver, By.TAG_NAME, 'input', ['attribute:type', 'attribute:name'])
+    print(f'Total <input> elements found: {len(inputs)}')
+    for inp in inputs:
+        print(f'  type={inp["attribute:type"]}, name={inp["attribute:name"]}')
+
+    driver.quit()
+
+
+def find_elements_from_element_projected():
+    """
+    Scoped projection (root=form), streamed in chunks. For collections of tens of
+    thousands of nodes, iter_project() keeps the matches in the page and fetches
+    chunk_size rows per round trip.
+    """
+    driver = _build_driver()
+    driver.get(FINDERS_PAGE)
+
+    form = driver.find_element(By.TAG_NAME, 'form')
+    for radio in iter_project(driver, By.CSS_SELECTOR, 'input[type="radio"]', ['attribute:value'], chunk_size=2, root=form):
+        print(f'  value: {radio["attribute:value"]}')
+
+    driver.quit()
+
+
+# ---------------------------------------------------------------------------
+# 5. Get active element
 # ---------------------------------------------------------------------------
 
 def get_active_element():
@@ -187,5 +231,6 @@ def get_active_element():
 if __name__ == '__main__':
     find_first_element()
     find_all_elements()
+    find_all_elements_projected()
     find_element_subset_of_dom()
     get_active_element()
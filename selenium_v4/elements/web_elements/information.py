@@ -16,23 +16,31 @@ What you can learn about a located element:
     - get_attribute()   — HTML attribute value
     - get_property()    — DOM property value
     - get_dom_attribute() — Explicit HTML attribute (not property)
+    - Batched retrieval — many fields of many elements in one round trip
 """
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 
-FORM_PAGE = 'https://www.selenium.dev/selenium/web/locators_tests/locators.html'
-DYNAMIC_PAGE = 'https://www.selenium.dev/selenium/web/dynamic.html'
-EXAMPLE_URL = 'https://www.example.com/'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/elements/web_elements/information.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+from selenium_v4.support.element_info import query_elements  # noqa: E402
+
+FORM_PAGE = target_url('https://www.selenium.dev/selenium/web/locators_tests/locators.html')
+DYNAMIC_PAGE = target_url('https://www.selenium.dev/selenium/web/dynamic.html')
+EXAMPLE_URL = target_url('https://www.example.com/')
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -221,6 +229,34 @@ def get_attribute_vs_property():
     driver.quit()
 
 
+# ---------------------------------------------------------------------------
+# 9. Batched retrieval
+# ---------------------------------------------------------------------------
+
+def get_information_batched():
+    """
+    Every getter above is a separate HTTP round trip to the driver.
+    query_elements() fetches many fields of many elements with a single
+    execute_script call: one round trip instead of elements x fields.
+
+    The values come from DOM APIs rather than Selenium's atoms; see
+    selenium_v4/support/element_info.py for the (small) differences.
+    """
+    driver = _build_driver()
+    driver.get(FORM_PAGE)
+
+    inputs = driver.find_elements(By.TAG_NAME, 'input')
+    rows = query_elements(
+        driver,
+        inputs,
+        ['tag_name', 'displayed', 'enabled', 'selected', 'rect', 'attribute:type', 'property:value', 'css:color'],
+    )
+    for row in rows:
+        print(row)
+
+    driver.quit()
+
+
 if __name__ == '__main__':
     is_displayed()
     is_enabled()
@@ -229,3 +265,4 @@ if __name__ == '__main__':
     get_size_and_position()
     get_text_content()
     get_attribute_vs_property()
+    get_information_batched()
@@ -34,20 +34,26 @@ HTML reference used in examples:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.relative_locator import locate_with
-from webdriver_manager.chrome import ChromeDriverManager
 
-LOCATORS_PAGE = 'https://www.selenium.dev/selenium/web/locators_tests/locators.html'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/elements/web_elements/locators.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+
+LOCATORS_PAGE = target_url('https://www.selenium.dev/selenium/web/locators_tests/locators.html')
 RELATIVE_PAGE = 'https://www.selenium.dev/selenium/web/relative_locators.html'
-EXAMPLE_URL = 'https://www.example.com/'
+EXAMPLE_URL = target_url('https://www.example.com/')
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
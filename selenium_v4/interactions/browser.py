@@ -8,20 +8,28 @@ https://www.selenium.dev/documentation/webdriver/interactions/
 Topics covered:
     - Get page title
     - Get current URL
+    - Read title and URL as one batch
 """
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
-SELENIUM_URL = 'https://www.selenium.dev/'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/interactions/browser.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+from selenium_v4.support.command_batch import CommandBatch  # noqa: E402
+
+SELENIUM_URL = target_url('https://www.selenium.dev/')
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -75,5 +83,29 @@ def get_title_and_url():
     driver.quit()
 
 
+# ---------------------------------------------------------------------------
+# 3. Batched reads
+# ---------------------------------------------------------------------------
+
+def get_title_and_url_batched():
+    """
+    Read title and URL in one round trip: inside a CommandBatch both reads
+    return futures and are coalesced into a single script on flush.
+    """
+    driver = _build_driver()
+    driver.get(SELENIUM_URL)
+
+    with CommandBatch(driver) as batch:
+        title = batch.title()
+        url = batch.current_url()
+
+    print(f'Title: {title.result()}')
+    print(f'URL: {url.result()}')
+    print(f'Round trips: {batch.stats.round_trips}')
+
+    driver.quit()
+
+
 if __name__ == '__main__':
     get_title_and_url()
+    get_title_and_url_batched()
@@ -19,16 +19,22 @@ Topics covered:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
-EXAMPLE_URL = 'https://www.example.com/'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/interactions/cookies.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+
+EXAMPLE_URL = target_url('https://www.example.com/')
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
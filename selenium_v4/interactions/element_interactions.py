@@ -21,22 +21,28 @@ Topics covered:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
-from webdriver_manager.chrome import ChromeDriverManager
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/interactions/element_interactions.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
 
 INPUTS_PAGE = 'https://www.selenium.dev/selenium/web/inputs.html'
-FORM_PAGE = 'https://www.selenium.dev/selenium/web/locators_tests/locators.html'
+FORM_PAGE = target_url('https://www.selenium.dev/selenium/web/locators_tests/locators.html')
 DROPDOWN_PAGE = 'https://www.selenium.dev/selenium/web/formPage.html'
-EXAMPLE_URL = 'https://www.example.com/'
+EXAMPLE_URL = target_url('https://www.example.com/')
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -22,19 +22,25 @@ top-level document, or driver.switch_to.parent_frame() to go one level up.
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
-IFRAME_PAGE = 'https://www.selenium.dev/selenium/web/iframes.html'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/interactions/frames.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+
+IFRAME_PAGE = target_url('https://www.selenium.dev/selenium/web/iframes.html')
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -14,17 +14,23 @@ Topics covered:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
-SELENIUM_URL = 'https://www.selenium.dev/'
-INDEX_URL = 'https://www.selenium.dev/selenium/web/index.html'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/interactions/navigation.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+
+SELENIUM_URL = target_url('https://www.selenium.dev/')
+INDEX_URL = target_url('https://www.selenium.dev/selenium/web/index.html')
 
 
 def _build_driver() -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service)
+    return build_driver('chrome')
 
 
 # ---------------------------------------------------------------------------
@@ -16,31 +16,44 @@ Topics covered:
     - Close a window or tab
     - Quit the browser
     - Window management (size, position, maximize, minimize, fullscreen)
+    - Batched window reads (size, position, handles in one flush)
     - Take screenshot (full page and element)
+    - Screenshot service (background decode/storage, duplicate and delta storage)
+    - Visual comparison of screenshots (NumPy pixel diff, ignore regions, changed boxes)
     - Execute JavaScript
     - Print page to PDF
+    - Batch printing to PDF (pooled sessions, streamed to disk, pages/sec)
 """
 
 from __future__ import annotations
 
 import base64
+import sys
 from pathlib import Path
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.print_page_options import PrintOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
-EXAMPLE_URL = 'https://www.example.com/'
-SELENIUM_URL = 'https://www.selenium.dev/'
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/interactions/windows.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support import build_driver, target_url  # noqa: E402
+from selenium_v4.support.command_batch import CommandBatch  # noqa: E402
+from selenium_v4.support.pdf_batch import print_batch  # noqa: E402
+from selenium_v4.support.screenshots import ScreenshotService  # noqa: E402
+from selenium_v4.support.visual_diff import compare, highlight  # noqa: E402
+
+EXAMPLE_URL = target_url('https://www.example.com/')
+SELENIUM_URL = target_url('https://www.selenium.dev/')
 OUTPUT_DIR = Path(__file__).parents[3] / 'output'
 
 
 def _build_driver(options: webdriver.ChromeOptions | None = None) -> webdriver.Chrome:
-    service = Service(executable_path=ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options or webdriver.ChromeOptions())
+    return build_driver('chrome', options)
 
 
 # ---------------------------------------------------------------------------
@@ -218,6 +231,28 @@ def set_window_position():
     driver.quit()
 
 
+def get_window_geometry_batched():
+    """
+    Read size, position and handles as one batch instead of three round trips.
+    Size and position are coalesced into one script; the handles request is
+    sent concurrently with it. Each value comes back as a future.
+    """
+    driver = _build_driver()
+    driver.get(EXAMPLE_URL)
+
+    with CommandBatch(driver) as batch:
+        size = batch.window_size()
+        position = batch.window_position()
+        handles = batch.window_handles()
+
+    print(f'Width: {size.result()["width"]}, Height: {size.result()["height"]}')
+    print(f'X: {position.result()["x"]}, Y: {position.result()["y"]}')
+    print(f'Handles: {handles.result()}')
+    print(f'Batch: {batch.stats.queued} reads in {batch.stats.round_trips} round trip(s)')
+
+    driver.quit()
+
+
 def maximize_window():
     """Maximize the browser window to fill the screen."""
     driver = _build_driver()
@@ -287,6 +322,55 @@ def take_element_screenshot():
     driver.quit()
 
 
+def capture_with_screenshot_service():
+    """
+    Capture many screenshots without waiting for PNG decoding and disk writes.
+    Identical frames are stored once; with delta=True later captures of a
+    name keep only the pixel rows that differ from its first capture.
+    """
+    driver = _build_driver()
+    driver.get(EXAMPLE_URL)
+
+    with ScreenshotService(OUTPUT_DIR / 'screenshots', delta=True) as shots:
+        for _ in range(5):
+            shots.capture(driver, 'example-viewport')
+        shots.capture(driver, 'example-heading', element=driver.find_element(By.TAG_NAME, 'h1'))
+        driver.execute_script("document.querySelector('h1').textContent = 'Changed heading';")
+        shots.capture(driver, 'example-viewport')
+    print(shots.stats)
+
+    path = shots.export('example-viewport', OUTPUT_DIR / 'viewport_latest.png')
+    print(f'Latest viewport capture: {path}')
+    driver.quit()
+
+
+def compare_screenshots():
+    """
+    Diff two in-memory screenshots of the same page (needs requirements-visual.txt).
+    The heading is changed between captures; the paragraph is ignored.
+    """
+    driver = _build_driver()
+    driver.get(EXAMPLE_URL)
+    before = driver.get_screenshot_as_png()
+
+    driver.execute_script("document.querySelector('h1').textContent = 'Changed heading';")
+    driver.execute_script("document.querySelector('p').style.color = 'red';")
+    after = driver.get_screenshot_as_png()
+    paragraph = driver.find_element(By.TAG_NAME, 'p')
+    scale = driver.execute_script('return window.devicePixelRatio;')
+
+    result = compare(before, after, tolerance=2, threshold=0.1, ignore=[paragraph.rect], scale=scale)
+    print(f'Changed pixels: {result.changed} ({result.ratio:.2%})')
+    for box in result.boxes:
+        print(f'  changed area at ({box.x}, {box.y}) size {box.width}x{box.height}')
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    path = OUTPUT_DIR / 'screenshot_diff.png'
+    path.write_bytes(highlight(after, result))
+    print(f'Highlighted differences: {path}')
+    driver.quit()
+
+
 # ---------------------------------------------------------------------------
 # 7. Execute JavaScript
 # ---------------------------------------------------------------------------
@@ -349,9 +433,26 @@ def print_page_to_pdf():
     driver.quit()
 
 
+def print_pages_in_batch():
+    """
+    Print several pages to PDF with two headless sessions from the pool.
+    Each PDF is streamed to disk instead of being decoded in memory.
+    """
+    print_options = PrintOptions()
+    print_options.background = True
+    urls = [EXAMPLE_URL, SELENIUM_URL]
+
+    report = print_batch(urls, print_options, OUTPUT_DIR / 'pdf', browser='chrome', workers=2)
+    for result in report.results:
+        print(f'{result.path.name}: {result.error or f"{result.pages} page(s) in {result.seconds:.2f}s"}')
+    print(report)
+
+
 if __name__ == '__main__':
     get_window_handle()
     switch_to_window()
+    get_window_geometry_batched()
     open_new_tab()
     take_screenshot()
+    capture_with_screenshot_service()
     execute_script()
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""Shared infrastructure for the example modules (driver factory, pooling, driver path cache, fixtures)."""
+
+from selenium_v4.support.driver_cache import DriverNotResolved, clear_driver_cache, resolve_driver_path
+from selenium_v4.support.drivers import build_driver, new_driver, pool_for
+from selenium_v4.support.fixture_server import FixtureServer, shared_server, target_url
+from selenium_v4.support.pool import DriverPool, PoolTimeout, close_all_pools, get_pool
+
+__all__ = [
+    'DriverNotResolved',
+    'DriverPool',
+    'FixtureServer',
+    'PoolTimeout',
+    'build_driver',
+    'clear_driver_cache',
+    'close_all_pools',
+    'get_pool',
+    'new_driver',
+    'pool_for',
+    'resolve_driver_path',
+    'shared_server',
+    'target_url',
+]
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+Explicit waits with a back-off polling schedule and learned condition latency.
+
+WebDriverWait sleeps a fixed poll_frequency between evaluations. A short
+interval floods the driver with commands during long waits; a long one
+adds up to poll_frequency of latency to short ones. AdaptiveWait instead:
+
+    - polls quickly at first (initial) and backs off geometrically (factor)
+      up to maximum, with +/- jitter so parallel waits do not poll in step;
+    - remembers how long each condition took to become true (an EWMA per
+      condition key) and, once it has an estimate, spends the time before
+      it at the maximum interval and restarts the fast schedule just before
+      the expected moment;
+    - counts the polls of every wait, per condition key, so the schedule can
+      be tuned toward fewer commands without slower detection
+      (print_poll_report()).
+
+Worst-case detection delay is bounded by maximum in every phase.
+
+Condition keys default to the expected_conditions factory and its simple
+arguments (e.g. "visibility_of_element_located(('id', 'revealed'))"), or to
+the callable's qualified name and source line for lambdas and functions.
+
+Example:
+    wait = AdaptiveWait(driver, timeout=10)
+    element = wait.until(EC.visibility_of_element_located((By.ID, 'revealed')))
+    print(wait.last_stats)
+    print_poll_report()
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+
+EC_MODULE = 'selenium.webdriver.support.expected_conditions'
+SIMPLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _simple(value: Any) -> bool:
+    if isinstance(value, tuple):
+        return all(_simple(item) for item in value)
+    return isinstance(value, SIMPLE_TYPES)
+
+
+def condition_key(method: Callable) -> str:
+    """Stable name of a wait condition, used to share latency estimates across waits."""
+    qualname = getattr(method, '__qualname__', type(method).__qualname__)
+    if getattr(method, '__module__', None) == EC_MODULE:
+        name = qualname.split('.<locals>')[0]
+    else:
+        code = getattr(method, '__code__', None)
+        name = f'{method.__module__}.{qualname}' if code is None else f'{qualname}@{code.co_filename}:{code.co_firstlineno}'
+    args = [cell.cell_contents for cell in getattr(method, '__closure__', None) or ()]
+    args = [repr(arg) for arg in args if _simple(arg)]
+    return f'{name}({", ".join(args)})' if args else name
+
+
+@dataclass
+class BackoffSchedule:
+    """
+    Polling intervals in seconds.
+
+    Args:
+        initial: first interval, and the interval again near an expected success.
+        factor: growth per poll.
+        maximum: upper bound of every interval (the worst-case detection delay).
+        jitter: relative random spread applied to every interval (0.2 = +/-20%).
+        lead: fraction of the expected latency at which fast polling restarts.
+    """
+
+    initial: float = 0.05
+    factor: float = 1.6
+    maximum: float = 1.0
+    jitter: float = 0.2
+    lead: float = 0.8
+
+    def delay(self, polls: int, elapsed: float, expected: float | None) -> float:
+        """Sleep before the next evaluation, after polls evaluations and elapsed seconds."""
+        if expected is not None:
+            window = expected * self.lead
+            if elapsed < window:
+                return min(self.maximum, window - elapsed)
+            step = self.initial * self.factor ** self._polls_in_window(elapsed - window)
+        else:
+            step = self.initial * self.factor ** (polls - 1)
+        step = min(self.maximum, step)
+        return step * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _polls_in_window(self, seconds: float) -> int:
+        # Number of back-off steps that fit in the seconds spent past the lead point.
+        polls, total, step = 0, 0.0, self.initial
+        while total + step <= seconds and step < self.maximum:
+            total += step
+            step *= self.factor
+            polls += 1
+        return polls
+
+
+@dataclass
+class ConditionStats:
+    """Totals of every wait on one condition key."""
+
+    waits: int = 0
+    timeouts: int = 0
+    polls: int = 0
+    seconds: float = 0.0
+    expected: float | None = None
+
+
+@dataclass
+class PollStats:
+    """What one until() call cost."""
+
+    key: str
+    polls: int
+    seconds: float
+    expected: float | None
+    timed_out: bool = False
+
+
+class LatencyModel:
+    """
+    Per-condition EWMA of the time until success, plus poll totals.
+
+    Only successful waits update the estimate; a timeout says nothing about
+    when the condition would have become true.
+    """
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._stats: dict[str, ConditionStats] = {}
+
+    def expected(self, key: str) -> float | None:
+        with self._lock:
+            stats = self._stats.get(key)
+            return stats.expected if stats else None
+
+    def record(self, result: PollStats) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(result.key, ConditionStats())
+            stats.waits += 1
+            stats.polls += result.polls
+            stats.seconds += result.seconds
+            if result.timed_out:
+                stats.timeouts += 1
+            elif stats.expected is None:
+                stats.expected = result.seconds
+            else:
+                stats.expected = self.alpha * result.seconds + (1 - self.alpha) * stats.expected
+
+    def report(self) -> dict[str, ConditionStats]:
+        with self._lock:
+            return {key: ConditionStats(**vars(stats)) for key, stats in self._stats.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+DEFAULT_MODEL = LatencyModel()
+
+
+class AdaptiveWait(WebDriverWait):
+    """
+    WebDriverWait with a BackoffSchedule instead of a fixed poll_frequency.
+
+    Args:
+        driver: the session (or element) to wait on.
+        timeout: seconds before TimeoutException.
+        ignored_exceptions: as for WebDriverWait.
+        schedule: polling intervals; BackoffSchedule() by default.
+        model: where latency estimates and poll counts are kept; shared
+            module-wide by default so every wait on a condition learns from
+            the previous ones.
+        key: condition key override, for conditions whose default key is
+            not stable (e.g. closures over a different WebElement each run).
+    """
+
+    def __init__(
+        self,
+        driver,
+        timeout: float,
+        ignored_exceptions: Iterable[type[Exception]] | None = None,
+        schedule: BackoffSchedule | None = None,
+        model: LatencyModel | None = None,
+        key: str | None = None,
+    ) -> None:
+        schedule = schedule or BackoffSchedule()
+        super().__init__(driver, timeout, schedule.maximum, ignored_exceptions)
+        self.schedule = schedule
+        self.model = model or DEFAULT_MODEL
+        self.key = key
+        self.last_stats: PollStats | None = None
+
+    def until(self, method: Callable, message: str = '') -> Any:
+        """Return method(driver) once it is truthy; TimeoutException after timeout seconds."""
+        return self._wait(method, message, negate=False)
+
+    def until_not(self, method: Callable, message: str = '') -> Any:
+        """Return once method(driver) is falsy; an ignored exception counts as falsy (returns True)."""
+        return self._wait(method, message, negate=True)
+
+    def _wait(self, method, message, negate):
+        key = self.key or condition_key(method)
+        if negate:
+            key = f'not {key}'
+        expected = self.model.expected(key)
+        screen = stacktrace = None
+        polls = 0
+        start = time.monotonic()
+        end = start + self._timeout
+
+        while True:
+            polls += 1
+            try:
+                value = method(self._driver)
+                if bool(value) != negate:
+                    self._record(key, polls, start, expected)
+                    return value
+            except self._ignored_exceptions as exc:
+                if negate:
+                    self._record(key, polls, start, expected)
+                    return True
+                screen = getattr(exc, 'screen', None)
+                stacktrace = getattr(exc, 'stacktrace', None)
+            now = time.monotonic()
+            if now > end:
+                break
+            time.sleep(min(end - now, self.schedule.delay(polls, now - start, expected)))
+
+        self._record(key, polls, start, expected, timed_out=True)
+        raise TimeoutException(message, screen, stacktrace)
+
+    def _record(self, key: str, polls: int, start: float, expected: float | None, timed_out: bool = False) -> None:
+        self.last_stats = PollStats(key, polls, time.monotonic() - start, expected, timed_out)
+        self.model.record(self.last_stats)
+
+
+def print_poll_report(model: LatencyModel | None = None) -> None:
+    """Print waits, polls per wait and the learned latency of every condition key."""
+    report = (model or DEFAULT_MODEL).report()
+    if not report:
+        print('No adaptive waits recorded.')
+        return
+    width = max(len('condition'), *(len(key) for key in report))
+    print(f'{"condition":<{width}}  {"waits":>5}  {"timeouts":>8}  {"polls/wait":>10}  {"mean s":>7}  {"expected s":>10}')
+    for key, stats in sorted(report.items(), key=lambda item: item[1].polls, reverse=True):
+        expected = f'{stats.expected:10.3f}' if stats.expected is not None else f'{"-":>10}'
+        print(
+            f'{key:<{width}}  {stats.waits:5d}  {stats.timeouts:8d}  {stats.polls / stats.waits:10.1f}  '
+            f'{stats.seconds / stats.waits:7.3f}  {expected}'
+        )
@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio client for remote WebDriver sessions.
+
+webdriver.Remote blocks its thread for every command, so driving N
+sessions at once takes N threads. AsyncWebDriver sends the same W3C
+commands (the command table of RemoteConnection, remote_commands) over an
+asyncio HTTP/1.1 client with kept-alive connections, so one event loop can
+drive hundreds of sessions on a Grid; every command, navigation and wait is
+awaitable.
+
+    AsyncHttpClient    stdlib asyncio streams, keep-alive connection pool per
+                       hub, max_connections in flight
+    AsyncRemoteConnection
+                       RemoteConnection.execute() equivalent: command name +
+                       params -> HTTP request; errors raised by Selenium's
+                       ErrorHandler, so callers see the usual exceptions
+    AsyncWebDriver     session commands (get, title, find_element,
+                       execute_script, screenshots, wait_until, quit)
+    AsyncWebElement    element commands (click, send_keys, text, attributes)
+
+Only the commands the examples use are wrapped; anything else in
+remote_commands is reachable through AsyncWebDriver.execute(Command.X, params).
+Local drivers work too: point the client at a running chromedriver
+(e.g. http://127.0.0.1:9515).
+
+Example:
+    async def title(client):
+        async with await AsyncWebDriver.create(client, webdriver.ChromeOptions()) as driver:
+            await driver.get('https://www.example.com/')
+            return await driver.title()
+
+    async def main():
+        async with AsyncHttpClient(GRID_URL, max_connections=100) as client:
+            print(await asyncio.gather(*(title(client) for _ in range(50))))
+
+    asyncio.run(main())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import ssl
+import string
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.utils import keys_to_typing
+from selenium.webdriver.remote import webelement
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.remote_connection import RemoteConnection, remote_commands
+
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+
+def _locator(by: str, value: str) -> dict:
+    # Same rewrites as WebDriver.find_element().
+    if by == By.ID:
+        by, value = By.CSS_SELECTOR, f'[id="{value}"]'
+    elif by == By.CLASS_NAME:
+        by, value = By.CSS_SELECTOR, f'.{value}'
+    elif by == By.NAME:
+        by, value = By.CSS_SELECTOR, f'[name="{value}"]'
+    elif by == By.TAG_NAME:
+        by = By.CSS_SELECTOR
+    return {'using': by, 'value': value}
+
+
+class AsyncHttpClient:
+    """
+    Minimal HTTP/1.1 client over asyncio streams with a keep-alive pool for one host.
+
+    Args:
+        base_url: hub or driver URL, e.g. http://127.0.0.1:4444/wd/hub.
+        max_connections: concurrent requests (and open connections) to the host.
+        timeout: seconds for one request, connect included.
+    """
+
+    def __init__(self, base_url: str, max_connections: int = 64, timeout: float = 120.0) -> None:
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or '127.0.0.1'
+        self.tls = parts.scheme == 'https'
+        self.port = parts.port or (443 if self.tls else 80)
+        self.prefix = parts.path.rstrip('/')
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots: asyncio.Semaphore | None = None
+        self.opened = 0
+        self.reused = 0
+
+    async def __aenter__(self) -> AsyncHttpClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def request(self, method: str, path: str, body: bytes | None = None) -> tuple[int, dict, bytes]:
+        """Send one request; returns (status, lower-cased headers, body)."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        async with self._slots:
+            reader, writer = await self._acquire()
+            try:
+                status, headers, data = await asyncio.wait_for(
+                    self._roundtrip(reader, writer, method, self.prefix + path, body), self.timeout
+                )
+            except BaseException:
+                writer.close()
+                raise
+            if headers.get('connection', '').lower() == 'close' or reader.at_eof():
+                writer.close()
+            else:
+                self._idle.append((reader, writer))
+            return status, headers, data
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+    async def _acquire(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if reader.at_eof() or writer.is_closing():
+                writer.close()
+                continue
+            self.reused += 1
+            return reader, writer
+        self.opened += 1
+        return await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=ssl.create_default_context() if self.tls else None),
+            self.timeout,
+        )
+
+    async def _roundtrip(self, reader, writer, method: str, path: str, body: bytes | None) -> tuple[int, dict, bytes]:
+        headers = {
+            'Host': f'{self.host}:{self.port}',
+            'Accept': 'application/json',
+            'Content-Type': 'application/json;charset=UTF-8',
+            'User-Agent': RemoteConnection.user_agent,
+            'Connection': 'keep-alive',
+            'Content-Length': str(len(body or b'')),
+        }
+        head = f'{method} {path} HTTP/1.1\r\n' + ''.join(f'{k}: {v}\r\n' for k, v in headers.items()) + '\r\n'
+        writer.write(head.encode('latin-1') + (body or b''))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('Connection closed before the response')
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while size := int((await reader.readline()).split(b';')[0], 16):
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            await reader.readline()
+            data = b''.join(chunks)
+        elif 'content-length' in response_headers:
+            data = await reader.readexactly(int(response_headers['content-length']))
+        else:
+            data = await reader.read()
+        return status, response_headers, data
+
+
+class AsyncRemoteConnection:
+    """Async counterpart of RemoteConnection.execute() on top of an AsyncHttpClient."""
+
+    def __init__(self, client: AsyncHttpClient) -> None:
+        self.client = client
+        self._errors = ErrorHandler()
+
+    async def execute(self, command: str, params: dict) -> dict:
+        method, template = remote_commands[command]
+        params = dict(params)
+        path = string.Template(template).substitute(params)
+        for word in template.split('/'):
+            if word.startswith('$'):
+                params.pop(word[1:], None)
+        body = json.dumps(params).encode('utf-8') if method == 'POST' else None
+
+        status, headers, data = await self.client.request(method, path, body)
+        response = self._decode(status, headers, data)
+        self._errors.check_response(response)
+        return response
+
+    @staticmethod
+    def _decode(status: int, headers: dict, data: bytes) -> dict:
+        text = data.decode('utf-8').strip()
+        if status >= 400:
+            return {'status': status, 'value': text or str(status)}
+        try:
+            response = json.loads(text)
+        except ValueError:
+            return {'status': 0, 'value': text}
+        response.setdefault('value', None)
+        return response
+
+
+class AsyncWebDriver:
+    """One remote session driven through awaitable commands."""
+
+    def __init__(self, connection: AsyncRemoteConnection, session_id: str, capabilities: dict) -> None:
+        self.connection = connection
+        self.session_id = session_id
+        self.capabilities = capabilities
+
+    @classmethod
+    async def create(cls, client: AsyncHttpClient, options: ArgOptions) -> AsyncWebDriver:
+        """Start a new session with the capabilities of options."""
+        connection = AsyncRemoteConnection(client)
+        payload = {'capabilities': {'firstMatch': [{}], 'alwaysMatch': options.to_capabilities()}}
+        response = await connection.execute(Command.NEW_SESSION, payload)
+        value = response['value']
+        return cls(connection, value['sessionId'], value.get('capabilities', {}))
+
+    async def __aenter__(self) -> AsyncWebDriver:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.quit()
+
+    # -- plumbing ----------------------------------------------------------
+
+    async def execute(self, command: str, params: dict | None = None) -> Any:
+        """Run any command of remote_commands for this session and return its unwrapped value."""
+        response = await self.connection.execute(command, {**(params or {}), 'sessionId': self.session_id})
+        return self._unwrap(response.get('value'))
+
+    def _unwrap(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+    @classmethod
+    def _wrap(cls, value: Any) -> Any:
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, dict):
+            return {key: cls._wrap(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._wrap(item) for item in value]
+        return value
+
+    # -- session commands --------------------------------------------------
+
+    async def get(self, url: str) -> None:
+        await self.execute(Command.GET, {'url': url})
+
+    async def title(self) -> str:
+        return await self.execute(Command.GET_TITLE)
+
+    async def current_url(self) -> str:
+        return await self.execute(Command.GET_CURRENT_URL)
+
+    async def back(self) -> None:
+        await self.execute(Command.GO_BACK)
+
+    async def forward(self) -> None:
+        await self.execute(Command.GO_FORWARD)
+
+    async def refresh(self) -> None:
+        await self.execute(Command.REFRESH)
+
+    async def find_element(self, by: str = By.ID, value: str | None = None) -> AsyncWebElement:
+        return await self.execute(Command.FIND_ELEMENT, _locator(by, value))
+
+    async def find_elements(self, by: str = By.ID, value: str | None = None) -> list[AsyncWebElement]:
+        return await self.execute(Command.FIND_ELEMENTS, _locator(by, value)) or []
+
+    async def execute_script(self, script: str, *args) -> Any:
+        return await self.execute(Command.W3C_EXECUTE_SCRIPT, {'script': script, 'args': self._wrap(list(args))})
+
+    async def execute_async_script(self, script: str, *args) -> Any:
+        return await self.execute(Command.W3C_EXECUTE_SCRIPT_ASYNC, {'script': script, 'args': self._wrap(list(args))})
+
+    async def get_window_rect(self) -> dict:
+        return await self.execute(Command.GET_WINDOW_RECT)
+
+    async def set_window_rect(self, x=None, y=None, width=None, height=None) -> dict:
+        rect = {'x': x, 'y': y, 'width': width, 'height': height}
+        return await self.execute(Command.SET_WINDOW_RECT, {k: v for k, v in rect.items() if v is not None})
+
+    async def get_screenshot_as_png(self) -> bytes:
+        return base64.b64decode((await self.execute(Command.SCREENSHOT)).encode('ascii'))
+
+    async def quit(self) -> None:
+        await self.execute(Command.QUIT)
+
+    async def wait_until(
+        self,
+        condition: Callable[[AsyncWebDriver], Awaitable[Any]],
+        timeout: float = 10,
+        poll_frequency: float = 0.5,
+        ignored_exceptions: Iterable[type[Exception]] = (NoSuchElementException,),
+        message: str = '',
+    ) -> Any:
+        """Await condition(driver) until it returns a truthy value, like WebDriverWait.until()."""
+        ignored = tuple(ignored_exceptions)
+        end = time.monotonic() + timeout
+        while True:
+            try:
+                value = await condition(self)
+                if value:
+                    return value
+            except ignored:
+                pass
+            if time.monotonic() > end:
+                raise TimeoutException(message)
+            await asyncio.sleep(poll_frequency)
+
+
+class AsyncWebElement:
+    """Element reference of an AsyncWebDriver session."""
+
+    def __init__(self, parent: AsyncWebDriver, element_id: str) -> None:
+        self.parent = parent
+        self.id = element_id
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (session="{self.parent.session_id}", element="{self.id}")>'
+
+    async def _execute(self, command: str, params: dict | None = None) -> Any:
+        return await self.parent.execute(command, {**(params or {}), 'id': self.id})
+
+    async def click(self) -> None:
+        await self._execute(Command.CLICK_ELEMENT)
+
+    async def clear(self) -> None:
+        await self._execute(Command.CLEAR_ELEMENT)
+
+    async def send_keys(self, *value) -> None:
+        typing = keys_to_typing(value)
+        await self._execute(Command.SEND_KEYS_TO_ELEMENT, {'text': ''.join(typing), 'value': typing})
+
+    async def text(self) -> str:
+        return await self._execute(Command.GET_ELEMENT_TEXT)
+
+    async def tag_name(self) -> str:
+        return await self._execute(Command.GET_ELEMENT_TAG_NAME)
+
+    async def rect(self) -> dict:
+        return await self._execute(Command.GET_ELEMENT_RECT)
+
+    async def get_property(self, name: str) -> Any:
+        return await self._execute(Command.GET_ELEMENT_PROPERTY, {'name': name})
+
+    async def get_dom_attribute(self, name: str) -> str | None:
+        return await self._execute(Command.GET_ELEMENT_ATTRIBUTE, {'name': name})
+
+    async def get_attribute(self, name: str) -> str | None:
+        # Same atom as WebElement.get_attribute().
+        if webelement.getAttribute_js is None:
+            webelement._load_js()  # pylint: disable=protected-access
+        script = f'/* getAttribute */return ({webelement.getAttribute_js}).apply(null, arguments);'
+        return await self.parent.execute_script(script, self, name)
+
+    async def is_displayed(self) -> bool:
+        if webelement.isDisplayed_js is None:
+            webelement._load_js()  # pylint: disable=protected-access
+        script = f'/* isDisplayed */return ({webelement.isDisplayed_js}).apply(null, arguments);'
+        return await self.parent.execute_script(script, self)
+
+    async def is_enabled(self) -> bool:
+        return await self._execute(Command.IS_ELEMENT_ENABLED)
+
+    async def is_selected(self) -> bool:
+        return await self._execute(Command.IS_ELEMENT_SELECTED)
+
+    async def find_element(self, by: str = By.ID, value: str | None = None) -> AsyncWebElement:
+        return await self._execute(Command.FIND_CHILD_ELEMENT, _locator(by, value))
+
+    async def find_elements(self, by: str = By.ID, value: str | None = None) -> list[AsyncWebElement]:
+        return await self._execute(Command.FIND_CHILD_ELEMENTS, _locator(by, value)) or []
+
+    async def screenshot_as_png(self) -> bytes:
+        return base64.b64decode((await self._execute(Command.ELEMENT_SCREENSHOT)).encode('ascii'))
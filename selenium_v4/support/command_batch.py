@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+Batched read-only WebDriver commands whose latencies overlap.
+
+driver.title, driver.current_url, driver.get_window_size() and friends are
+each one blocking HTTP round trip, so reading five independent values costs
+five sequential round trips. Inside a CommandBatch those reads are queued
+and return concurrent.futures.Future objects; on flush() (or leaving the
+with block) the batch:
+
+    - coalesces title, current URL and window rect/size/position into a
+      single execute_script that reads them from the top-level window;
+    - sends every other queued read (window handles, cookies, page source,
+      element text/rect...) concurrently from a thread pool, together with
+      the coalesced script.
+
+Only commands in READ_ONLY_COMMANDS are accepted: they do not change
+browser state, so their order does not matter. Anything that navigates,
+types or switches context must stay outside the batch.
+
+What overlaps depends on the other end. A Grid or cloud hub serves the
+requests of one session in parallel up to the driver, so network latency
+is paid once; a local chromedriver executes one session's commands one at
+a time, so there the saving comes mostly from coalescing. Concurrent
+requests need as many HTTP connections; use PooledRemoteConnection
+(http_pool.py) with pool_size >= max_workers to keep them alive.
+
+Coalesced values follow the W3C definitions (window rect is screenX,
+screenY, outerWidth, outerHeight of the top-level window). If the script
+cannot read them (e.g. the current frame is cross-origin to the top
+window) the batch falls back to the individual commands, counted in
+BatchStats.fallbacks. coalesce=False always sends the individual commands.
+
+Example:
+    with CommandBatch(driver) as batch:
+        title = batch.title()
+        url = batch.current_url()
+        size = batch.window_size()
+        handles = batch.window_handles()
+    print(title.result(), url.result(), size.result(), handles.result())
+    print(batch.stats)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+DEFAULT_WORKERS = 8
+
+READ_ONLY_COMMANDS = frozenset({
+    Command.GET_TITLE,
+    Command.GET_CURRENT_URL,
+    Command.GET_WINDOW_RECT,
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE,
+    Command.W3C_GET_WINDOW_HANDLES,
+    Command.GET_PAGE_SOURCE,
+    Command.GET_ALL_COOKIES,
+    Command.GET_COOKIE,
+    Command.GET_TIMEOUTS,
+    Command.SCREENSHOT,
+    Command.W3C_GET_ACTIVE_ELEMENT,
+    Command.GET_ELEMENT_TEXT,
+    Command.GET_ELEMENT_TAG_NAME,
+    Command.GET_ELEMENT_RECT,
+    Command.GET_ELEMENT_PROPERTY,
+    Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.GET_ELEMENT_ARIA_ROLE,
+    Command.GET_ELEMENT_ARIA_LABEL,
+    Command.IS_ELEMENT_ENABLED,
+    Command.IS_ELEMENT_SELECTED,
+    Command.ELEMENT_SCREENSHOT,
+})
+
+# Command -> key of the value in COALESCE_SCRIPT's result.
+COALESCED_COMMANDS = {
+    Command.GET_TITLE: 'title',
+    Command.GET_CURRENT_URL: 'url',
+    Command.GET_WINDOW_RECT: 'rect',
+}
+
+# Reads the top-level browsing context, as the commands do; throws when it is cross-origin.
+COALESCE_SCRIPT = """
+const top = window.top;
+const out = {};
+for (const key of arguments[0]) {
+  if (key === 'title') out.title = top.document.title;
+  else if (key === 'url') out.url = top.location.href;
+  else if (key === 'rect') out.rect = {x: top.screenX, y: top.screenY, width: top.outerWidth, height: top.outerHeight};
+}
+return out;
+"""
+
+
+def _size(rect: dict) -> dict:
+    return {'width': rect['width'], 'height': rect['height']}
+
+
+def _position(rect: dict) -> dict:
+    return {'x': rect['x'], 'y': rect['y']}
+
+
+@dataclass
+class BatchStats:
+    """Totals of every flush() of one batch."""
+
+    queued: int = 0
+    coalesced: int = 0
+    round_trips: int = 0
+    fallbacks: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class _Queued:
+    command: str
+    params: dict | None
+    future: Future
+    transform: Any = None
+
+
+class CommandBatch:
+    """
+    Queue of independent read-only commands, sent together on flush().
+
+    Args:
+        driver: the session to read from.
+        max_workers: concurrent requests per flush.
+        executor: thread pool to send them from; a private one (closed with
+            the batch) by default.
+        coalesce: combine title, URL and window rect into one execute_script.
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        max_workers: int = DEFAULT_WORKERS,
+        executor: ThreadPoolExecutor | None = None,
+        coalesce: bool = True,
+    ) -> None:
+        self.driver = driver
+        self.coalesce = coalesce
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='command-batch')
+        self._queue: list[_Queued] = []
+        self.stats = BatchStats()
+        self._stats_lock = threading.Lock()
+
+    # -- queueing ---------------------------------------------------------
+
+    def execute(self, command: str, params: dict | None = None, transform=None) -> Future:
+        """Queue a read-only command; the future resolves to its (unwrapped) value, passed through transform."""
+        if command not in READ_ONLY_COMMANDS:
+            raise ValueError(f'{command!r} is not a read-only command and cannot be batched')
+        future: Future = Future()
+        self._queue.append(_Queued(command, params, future, transform))
+        return future
+
+    def title(self) -> Future:
+        return self.execute(Command.GET_TITLE)
+
+    def current_url(self) -> Future:
+        return self.execute(Command.GET_CURRENT_URL)
+
+    def window_rect(self) -> Future:
+        return self.execute(Command.GET_WINDOW_RECT)
+
+    def window_size(self) -> Future:
+        return self.execute(Command.GET_WINDOW_RECT, transform=_size)
+
+    def window_position(self) -> Future:
+        return self.execute(Command.GET_WINDOW_RECT, transform=_position)
+
+    def window_handle(self) -> Future:
+        return self.execute(Command.W3C_GET_CURRENT_WINDOW_HANDLE)
+
+    def window_handles(self) -> Future:
+        return self.execute(Command.W3C_GET_WINDOW_HANDLES)
+
+    def page_source(self) -> Future:
+        return self.execute(Command.GET_PAGE_SOURCE)
+
+    def cookies(self) -> Future:
+        return self.execute(Command.GET_ALL_COOKIES)
+
+    def text(self, element: WebElement) -> Future:
+        return self.execute(Command.GET_ELEMENT_TEXT, {'id': element.id})
+
+    def rect(self, element: WebElement) -> Future:
+        return self.execute(Command.GET_ELEMENT_RECT, {'id': element.id})
+
+    def dom_property(self, element: WebElement, name: str) -> Future:
+        return self.execute(Command.GET_ELEMENT_PROPERTY, {'id': element.id, 'name': name})
+
+    # -- sending ----------------------------------------------------------
+
+    def flush(self) -> BatchStats:
+        """Send everything queued and wait until every future is resolved."""
+        queued, self._queue = self._queue, []
+        if not queued:
+            return self.stats
+        start = time.perf_counter()
+        self.stats.queued += len(queued)
+
+        coalesced = [item for item in queued if self.coalesce and item.command in COALESCED_COMMANDS]
+        if len(coalesced) < 2:
+            coalesced = []
+        separate = [item for item in queued if not any(item is other for other in coalesced)]
+
+        pending = [self._executor.submit(self._send, item) for item in separate]
+        if coalesced:
+            pending.append(self._executor.submit(self._send_coalesced, coalesced))
+        wait(pending)
+
+        self.stats.seconds += time.perf_counter() - start
+        return self.stats
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self.stats, name, getattr(self.stats, name) + amount)
+
+    def _send(self, item: _Queued) -> None:
+        self._count('round_trips')
+        try:
+            value = self.driver.execute(item.command, dict(item.params or {}))['value']
+            item.future.set_result(item.transform(value) if item.transform else value)
+        except Exception as exc:
+            item.future.set_exception(exc)
+
+    def _send_coalesced(self, items: list[_Queued]) -> None:
+        keys = sorted({COALESCED_COMMANDS[item.command] for item in items})
+        self._count('round_trips')
+        try:
+            values = self.driver.execute_script(COALESCE_SCRIPT, keys)
+        except WebDriverException:
+            # Cross-origin frame, closed window...: let each command report for itself.
+            self._count('fallbacks')
+            for item in items:
+                self._send(item)
+            return
+        except Exception as exc:
+            for item in items:
+                item.future.set_exception(exc)
+            return
+        self._count('coalesced', len(items))
+        for item in items:
+            try:
+                value = values[COALESCED_COMMANDS[item.command]]
+                item.future.set_result(item.transform(value) if item.transform else value)
+            except Exception as exc:
+                item.future.set_exception(exc)
+
+    def close(self) -> None:
+        """Cancel anything still queued and release the private thread pool."""
+        for item in self._queue:
+            item.future.cancel()
+        self._queue = []
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> CommandBatch:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self.close()
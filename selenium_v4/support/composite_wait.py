@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Composite wait conditions evaluated in one execute_script per poll.
+
+EC.all_of(a, b, c) evaluates a, then b, then c on every poll, and each
+expected condition is one or more WebDriver commands (find_element, then
+is_displayed, text, get_attribute...). all_of(), any_of() and first_of()
+here take the same expected_conditions, compile the ones they recognise
+into a single in-page predicate, and evaluate all of them in one round trip
+regardless of how many are awaited.
+
+Compiled (read from the EC closure, see COMPILED_CONDITIONS):
+    title_is, title_contains, url_to_be, url_contains, url_changes,
+    presence_of_element_located, presence_of_all_elements_located,
+    visibility_of_element_located, visibility_of, visibility_of_any_elements_located,
+    visibility_of_all_elements_located, invisibility_of_element_located,
+    invisibility_of_element, element_to_be_clickable, element_to_be_selected,
+    element_located_to_be_selected, element_selection_state_to_be,
+    element_located_selection_state_to_be, text_to_be_present_in_element,
+    text_to_be_present_in_element_value, text_to_be_present_in_element_attribute,
+    element_attribute_to_include, and EC.all_of / any_of / none_of of those.
+
+Anything else (lambdas, alert_is_present, url_matches, relative locators,
+number_of_windows_to_be, frame switching...) stays a Python callable and is
+evaluated after the script, in order, only when its result can still change
+the outcome. If the script itself fails (stale element argument, invalid
+selector), that poll falls back to evaluating every condition in Python, so
+the result is what EC.all_of / EC.any_of would have returned.
+
+Values follow expected_conditions: elements come back as WebElements,
+visibility uses the element_info displayed check and clickability tests
+!element.disabled, so the edge cases noted in element_info.py apply.
+
+Example:
+    ready = all_of(
+        EC.visibility_of_element_located((By.ID, 'revealed')),
+        EC.presence_of_element_located((By.ID, 'box0')),
+        EC.title_contains('Selenium'),
+    )
+    revealed, box, _ = WebDriverWait(driver, 10).until(ready)
+    print(ready.stats)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from selenium.common.exceptions import JavascriptException, StaleElementReferenceException, WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+
+from selenium_v4.support.element_info import READ_FIELD_JS
+from selenium_v4.support.projection import LOCATE_JS, dom_locator
+
+EC_MODULE = 'selenium.webdriver.support.expected_conditions'
+
+# EC factory name -> closure variables passed to the page, in order.
+# 'locator', 'mark' and 'element' are encoded as targets (see _target()).
+COMPILED_CONDITIONS = {
+    'title_is': ('title',),
+    'title_contains': ('title',),
+    'url_to_be': ('url',),
+    'url_contains': ('url',),
+    'url_changes': ('url',),
+    'presence_of_element_located': ('locator',),
+    'presence_of_all_elements_located': ('locator',),
+    'visibility_of_element_located': ('locator',),
+    'visibility_of': ('element',),
+    'visibility_of_any_elements_located': ('locator',),
+    'visibility_of_all_elements_located': ('locator',),
+    'invisibility_of_element_located': ('locator',),
+    'invisibility_of_element': ('locator',),
+    'element_to_be_clickable': ('mark',),
+    'element_to_be_selected': ('element',),
+    'element_located_to_be_selected': ('locator',),
+    'element_selection_state_to_be': ('element', 'is_selected'),
+    'element_located_selection_state_to_be': ('locator', 'is_selected'),
+    'text_to_be_present_in_element': ('locator', 'text_'),
+    'text_to_be_present_in_element_value': ('locator', 'text_'),
+    'text_to_be_present_in_element_attribute': ('locator', 'attribute_', 'text_'),
+    'element_attribute_to_include': ('locator', 'attribute_'),
+}
+GROUP_CONDITIONS = ('all_of', 'any_of', 'none_of')
+TARGET_ARGS = ('locator', 'mark', 'element')
+
+CHECK_JS = """
+function target(spec) {
+  if (spec[0] === 'element') return spec[1];
+  const nodes = locate(spec[1], spec[2], null);
+  return nodes.length ? nodes[0] : null;
+}
+
+function all(spec) { return locate(spec[1], spec[2], null); }
+
+function topUrl() {
+  try { return window.top.location.href; } catch (e) { return window.location.href; }
+}
+
+function includes(value, text) { return value !== null && value !== undefined && String(value).indexOf(text) !== -1; }
+
+function check(c) {
+  const a = c[1];
+  let el;
+  switch (c[0]) {
+    case 'title_is': return document.title === a[0];
+    case 'title_contains': return document.title.indexOf(a[0]) !== -1;
+    case 'url_to_be': return topUrl() === a[0];
+    case 'url_contains': return topUrl().indexOf(a[0]) !== -1;
+    case 'url_changes': return topUrl() !== a[0];
+    case 'presence_of_element_located': return target(a[0]) || false;
+    case 'presence_of_all_elements_located': return all(a[0]);
+    case 'visibility_of_element_located':
+    case 'visibility_of':
+      el = target(a[0]);
+      return el && displayed(el) ? el : false;
+    case 'visibility_of_any_elements_located': return all(a[0]).filter(displayed);
+    case 'visibility_of_all_elements_located': {
+      const nodes = all(a[0]);
+      return nodes.every(displayed) ? nodes : false;
+    }
+    case 'invisibility_of_element_located':
+    case 'invisibility_of_element':
+      el = target(a[0]);
+      return el ? (displayed(el) ? false : el) : true;
+    case 'element_to_be_clickable':
+      el = target(a[0]);
+      return el && displayed(el) && read(el, 'enabled') ? el : false;
+    case 'element_to_be_selected':
+    case 'element_located_to_be_selected':
+      el = target(a[0]);
+      return Boolean(el) && read(el, 'selected');
+    case 'element_selection_state_to_be':
+    case 'element_located_selection_state_to_be':
+      el = target(a[0]);
+      return Boolean(el) && read(el, 'selected') === a[1];
+    case 'text_to_be_present_in_element':
+      el = target(a[0]);
+      return Boolean(el) && includes(read(el, 'text'), a[1]);
+    case 'text_to_be_present_in_element_value':
+      el = target(a[0]);
+      return Boolean(el) && includes(read(el, 'attribute', 'value'), a[1]);
+    case 'text_to_be_present_in_element_attribute':
+      el = target(a[0]);
+      return Boolean(el) && includes(read(el, 'attribute', a[1]), a[2]);
+    case 'element_attribute_to_include':
+      el = target(a[0]);
+      return Boolean(el) && read(el, 'attribute', a[1]) !== null;
+    case 'all_of': {
+      const results = [];
+      for (const child of a) {
+        const value = safe(child);
+        if (!truthy(value)) return false;
+        results.push(value);
+      }
+      return results;
+    }
+    case 'any_of':
+      for (const child of a) {
+        const value = safe(child);
+        if (truthy(value)) return value;
+      }
+      return false;
+    case 'none_of':
+      return !a.some(function (child) { return truthy(safe(child)); });
+  }
+  throw new Error('Unknown condition ' + c[0]);
+}
+
+// Python truthiness of what the condition returns (an empty list is falsy).
+function truthy(value) { return Array.isArray(value) ? value.length > 0 : Boolean(value); }
+
+// EC.all_of/any_of/none_of swallow WebDriverException from their children.
+function safe(c) { try { return check(c); } catch (e) { return false; } }
+"""
+
+COMPOSITE_SCRIPT = READ_FIELD_JS + LOCATE_JS + CHECK_JS + """
+return arguments[0].map(function (c) { return c === null ? null : check(c); });
+"""
+
+
+def _target(value: Any) -> list | None:
+    if isinstance(value, WebElement):
+        return ['element', value]
+    if isinstance(value, tuple) and len(value) == 2 and all(isinstance(part, str) for part in value):
+        try:
+            return ['locator', *dom_locator(*value)]
+        except ValueError:
+            return None
+    return None
+
+
+def compile_condition(condition: Callable) -> list | None:
+    """
+    Page-side form of an expected_conditions callable, or None if it must stay in Python.
+
+    The factory name and its arguments are read from the closure that
+    expected_conditions returns (its __qualname__ and free variables).
+    """
+    if getattr(condition, '__module__', None) != EC_MODULE or not hasattr(condition, '__code__'):
+        return None
+    name = condition.__qualname__.split('.<locals>')[0]
+    free = dict(zip(condition.__code__.co_freevars, (cell.cell_contents for cell in condition.__closure__ or ())))
+
+    if name in GROUP_CONDITIONS:
+        children = [compile_condition(child) for child in free.get('expected_conditions', ())]
+        return None if None in children else [name, children]
+
+    spec = COMPILED_CONDITIONS.get(name)
+    if spec is None or not set(spec) <= free.keys():
+        return None
+    args = []
+    for arg in spec:
+        value = free[arg]
+        if arg in TARGET_ARGS:
+            value = _target(value)
+            if value is None:
+                return None
+        args.append(value)
+    return [name, args]
+
+
+@dataclass
+class CompositeStats:
+    """Round trips spent by one composite condition across all its polls."""
+
+    polls: int = 0
+    scripts: int = 0
+    script_fallbacks: int = 0
+    python_calls: int = 0
+
+
+class CompositeCondition:
+    """
+    Callable wait condition combining several expected conditions.
+
+    Args:
+        mode: 'all' (list of every value once all are truthy), 'any' (the first
+            truthy value) or 'first' ((index, value) of the first truthy one).
+        conditions: expected_conditions or any callables taking the driver.
+    """
+
+    MODES = ('all', 'any', 'first')
+
+    def __init__(self, mode: str, conditions: list[Callable]) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f'mode must be one of {self.MODES}, not {mode!r}')
+        if not conditions:
+            raise ValueError('at least one condition is required')
+        self.mode = mode
+        self.conditions = list(conditions)
+        self.specs = [compile_condition(condition) for condition in self.conditions]
+        self.stats = CompositeStats()
+
+    @property
+    def compiled(self) -> int:
+        """How many of the conditions are evaluated in the page."""
+        return sum(spec is not None for spec in self.specs)
+
+    def __call__(self, driver) -> Any:
+        self.stats.polls += 1
+        values = [None] * len(self.conditions)
+        in_page = [False] * len(self.conditions)
+        if self.compiled:
+            try:
+                values = driver.execute_script(COMPOSITE_SCRIPT, self.specs)
+                in_page = [spec is not None for spec in self.specs]
+                self.stats.scripts += 1
+            except (JavascriptException, StaleElementReferenceException):
+                self.stats.script_fallbacks += 1
+
+        results = []
+        for index, condition in enumerate(self.conditions):
+            if in_page[index]:
+                value = values[index]
+            else:
+                value = self._call(condition, driver)
+            if self.mode == 'all':
+                if not value:
+                    return False
+                results.append(value)
+            elif value:
+                return value if self.mode == 'any' else (index, value)
+        return results if self.mode == 'all' else False
+
+    def _call(self, condition: Callable, driver) -> Any:
+        # Like EC.all_of / EC.any_of, a failing condition counts as not (yet) satisfied.
+        self.stats.python_calls += 1
+        try:
+            return condition(driver)
+        except WebDriverException:
+            return False
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.mode} of {len(self.conditions)}, {self.compiled} compiled>'
+
+
+def all_of(*conditions: Callable) -> CompositeCondition:
+    """Truthy (the list of every value) once every condition is; like EC.all_of."""
+    return CompositeCondition('all', list(conditions))
+
+
+def any_of(*conditions: Callable) -> CompositeCondition:
+    """The value of the first truthy condition, in argument order; like EC.any_of."""
+    return CompositeCondition('any', list(conditions))
+
+
+def first_of(*conditions: Callable) -> CompositeCondition:
+    """(index, value) of the first truthy condition, to branch on which outcome happened."""
+    return CompositeCondition('first', list(conditions))
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Resolver cache for driver binary paths.
+
+ChromeDriverManager().install() (and the Edge/Firefox equivalents) probes the
+installed browser version, may query the vendor's release endpoint and scans
+its own download cache on every call. The examples used to pay that on every
+driver creation.
+
+resolve_driver_path() memoizes the resolved binary path at two levels:
+    - process-wide: a dict lookup after the first resolution.
+    - on disk: a JSON file shared by every process (e.g. runner workers), so a
+      fresh interpreter does not probe again until the entry expires.
+
+Entries are keyed by browser and requested driver version and expire after a
+TTL. Entries whose binary has disappeared are ignored. The browser may update
+itself within the TTL and outgrow the cached driver: new_driver() then gets
+a version-mismatch SessionNotCreatedException, drops the entry with
+forget_driver_path() and resolves again (never in offline mode).
+
+Offline mode never calls webdriver-manager: it serves the on-disk entry even
+when it has expired, then falls back to a driver found on PATH. This is what
+air-gapped CI nodes need once the cache file (or PATH) has been provisioned.
+
+Environment:
+    SELENIUM_EXAMPLES_DRIVER_CACHE    cache file (default ~/.cache/selenium-examples/drivers.json)
+    SELENIUM_EXAMPLES_DRIVER_TTL      seconds before an entry is re-resolved (default 86400)
+    SELENIUM_EXAMPLES_OFFLINE_DRIVERS=1   never download or probe, see above
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+CACHE_FILE = Path(
+    os.getenv('SELENIUM_EXAMPLES_DRIVER_CACHE', Path.home() / '.cache' / 'selenium-examples' / 'drivers.json')
+)
+TTL_SECONDS = float(os.getenv('SELENIUM_EXAMPLES_DRIVER_TTL', str(24 * 60 * 60)))
+OFFLINE = os.getenv('SELENIUM_EXAMPLES_OFFLINE_DRIVERS') == '1'
+
+# browser name -> (webdriver-manager class, binary name looked up on PATH in offline mode)
+DRIVER_MANAGERS = {
+    'chrome': (ChromeDriverManager, 'chromedriver'),
+    'edge': (EdgeChromiumDriverManager, 'msedgedriver'),
+    'firefox': (GeckoDriverManager, 'geckodriver'),
+}
+
+_memory: dict[str, str] = {}
+_lock = threading.Lock()
+
+
+class DriverNotResolved(RuntimeError):
+    """Raised in offline mode when neither the cache nor PATH provides a driver."""
+
+
+def _key(browser: str, version: str | None) -> str:
+    return f'{browser}:{version or "latest"}'
+
+
+def _usable(path: str | None) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _read_disk() -> dict:
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_disk(key: str, path: str | None) -> None:
+    """Merge one entry into (or with path None, remove it from) the cache file; the rename keeps concurrent readers safe."""
+    entries = _read_disk()
+    if path is None:
+        if entries.pop(key, None) is None:
+            return
+    else:
+        entries[key] = {'path': path, 'resolved_at': time.time()}
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=CACHE_FILE.parent, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+        json.dump(entries, fh, indent=2, sort_keys=True)
+    os.replace(tmp, CACHE_FILE)
+
+
+def resolve_driver_path(browser: str, version: str | None = None, offline: bool | None = None) -> str:
+    """
+    Return the driver binary path for browser, resolving it at most once per TTL.
+
+    Args:
+        browser: 'chrome', 'edge' or 'firefox'.
+        version: driver version passed to webdriver-manager; None means the
+            version matching the installed browser.
+        offline: never call webdriver-manager; defaults to SELENIUM_EXAMPLES_OFFLINE_DRIVERS.
+    """
+    try:
+        manager_cls, binary_name = DRIVER_MANAGERS[browser]
+    except KeyError:
+        raise ValueError(f'No driver manager for {browser!r}; expected one of {sorted(DRIVER_MANAGERS)}') from None
+    offline = OFFLINE if offline is None else offline
+    key = _key(browser, version)
+
+    cached = _memory.get(key)
+    if cached:
+        return cached
+
+    with _lock:
+        if key in _memory:
+            return _memory[key]
+
+        entry = _read_disk().get(key, {})
+        fresh = time.time() - entry.get('resolved_at', 0) < TTL_SECONDS
+        if _usable(entry.get('path')) and (fresh or offline):
+            path = entry['path']
+        elif offline:
+            path = shutil.which(binary_name)
+            if not path:
+                raise DriverNotResolved(
+                    f'Offline mode: no cached {binary_name} in {CACHE_FILE} and none on PATH'
+                )
+        else:
+            # First positional argument is the driver version for every manager class.
+            path = manager_cls(version).install()
+            _write_disk(key, path)
+
+        _memory[key] = path
+        return path
+
+
+def forget_driver_path(browser: str, version: str | None = None) -> None:
+    """Drop one entry from memory and disk, so the next resolution probes the browser again."""
+    key = _key(browser, version)
+    with _lock:
+        _memory.pop(key, None)
+        _write_disk(key, None)
+
+
+def clear_driver_cache(disk: bool = False) -> None:
+    """Forget every resolved path; with disk=True also delete the cache file."""
+    with _lock:
+        _memory.clear()
+        if disk:
+            CACHE_FILE.unlink(missing_ok=True)
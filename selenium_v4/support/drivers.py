@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Driver factory used by the _build_driver() helpers of the example modules.
+
+build_driver() either starts a fresh local browser (the default, identical to
+what every module used to do inline) or leases a session from a DriverPool
+when pooling is switched on:
+
+    SELENIUM_EXAMPLES_POOL=1        lease sessions instead of launching browsers
+    SELENIUM_EXAMPLES_POOL_SIZE=2   sessions per browser/options combination
+    SELENIUM_EXAMPLES_POOL_TIMEOUT  seconds to wait for a free session before
+                                    PoolTimeout (default 300)
+
+Every session gets the page-load profile named by
+SELENIUM_EXAMPLES_LOAD_PROFILE (see load_profiles.py) unless the caller
+passes one explicitly, and the fast-launch switches (fast_launch.py) when
+SELENIUM_EXAMPLES_FAST_LAUNCH=1 or fast_launch=True. With
+SELENIUM_EXAMPLES_BROKER=1, Chrome and Edge sessions attach to the
+long-lived browsers of a running session broker (session_broker.py)
+instead of launching one, unless the caller asked for pooled=False or for
+options a broker browser cannot honour (broker_accepts()).
+
+Pools are keyed by browser name and the capabilities payload of the options,
+so sessions are only shared between callers that asked for the same browser
+configuration.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.safari.options import Options as SafariOptions
+from selenium.webdriver.safari.service import Service as SafariService
+
+from selenium_v4.support import driver_cache
+from selenium_v4.support.driver_cache import forget_driver_path, resolve_driver_path
+from selenium_v4.support.fast_launch import FAST_LAUNCH, fast_launch_options
+from selenium_v4.support.load_profiles import LOAD_PROFILE, LoadProfile, apply_profile, apply_session_profile
+from selenium_v4.support.pool import DriverPool, get_pool
+
+POOL_ENABLED = os.getenv('SELENIUM_EXAMPLES_POOL') == '1'
+POOL_SIZE = int(os.getenv('SELENIUM_EXAMPLES_POOL_SIZE', '1'))
+# Bounded, so a session leaked by a failed borrower raises PoolTimeout instead of deadlocking.
+POOL_TIMEOUT = float(os.getenv('SELENIUM_EXAMPLES_POOL_TIMEOUT', '300'))
+BROKER_ENABLED = os.getenv('SELENIUM_EXAMPLES_BROKER') == '1'
+# chromedriver / msedgedriver: "This version of ChromeDriver only supports Chrome version 120
+# Current browser version is 122...".
+VERSION_MISMATCH = re.compile(r'only supports .*version|current browser version', re.IGNORECASE)
+
+# browser name -> (driver class, options class, service class)
+BROWSERS = {
+    'chrome': (webdriver.Chrome, webdriver.ChromeOptions, ChromeService),
+    'edge': (webdriver.Edge, webdriver.EdgeOptions, EdgeService),
+    'firefox': (webdriver.Firefox, webdriver.FirefoxOptions, FirefoxService),
+    'safari': (webdriver.Safari, SafariOptions, SafariService),
+}
+
+
+def _browser_spec(browser: str) -> tuple:
+    try:
+        return BROWSERS[browser]
+    except KeyError:
+        raise ValueError(f'Unsupported browser {browser!r}; expected one of {sorted(BROWSERS)}') from None
+
+
+def new_driver(browser: str = 'chrome', options: ArgOptions | None = None) -> WebDriver:
+    """
+    Start a new local browser session; the driver binary path comes from the resolver cache.
+
+    A cached driver the browser has outgrown (auto-update) fails with a
+    version-mismatch SessionNotCreatedException: the entry is dropped and the
+    session retried once with a freshly resolved driver. Other failures, and
+    any failure in offline mode (the cached path is all there is), are raised.
+    """
+    driver_cls, options_cls, service_cls = _browser_spec(browser)
+    options = options or options_cls()
+    # safaridriver ships with macOS, there is nothing to resolve.
+    if browser == 'safari':
+        return driver_cls(service=service_cls(), options=options)
+    try:
+        return driver_cls(service=service_cls(executable_path=resolve_driver_path(browser)), options=options)
+    except SessionNotCreatedException as exc:
+        if driver_cache.OFFLINE or not VERSION_MISMATCH.search(exc.msg or ''):
+            raise
+        forget_driver_path(browser)
+    return driver_cls(service=service_cls(executable_path=resolve_driver_path(browser)), options=options)
+
+
+def pool_for(browser: str = 'chrome', options: ArgOptions | None = None) -> DriverPool:
+    """Return the pool shared by every caller asking for this browser configuration."""
+    options = options or _browser_spec(browser)[1]()
+    fingerprint = json.dumps(options.to_capabilities(), sort_keys=True, default=str)
+    return get_pool(
+        (browser, fingerprint),
+        lambda: new_driver(browser, options),
+        max_size=POOL_SIZE,
+    )
+
+
+def build_driver(
+    browser: str = 'chrome',
+    options: ArgOptions | None = None,
+    pooled: bool | None = None,
+    profile: str | LoadProfile | None = None,
+    fast_launch: bool | None = None,
+) -> WebDriver:
+    """
+    Return a driver for the examples.
+
+    Args:
+        browser: 'chrome', 'edge', 'firefox' or 'safari'.
+        options: browser options; defaults to an empty options object.
+        pooled: lease from the shared pool; defaults to SELENIUM_EXAMPLES_POOL.
+            A leased driver goes back to the pool when driver.quit() is called.
+            False also keeps the session off the broker browsers.
+        profile: page-load profile ('fast', 'strict' or a LoadProfile);
+            defaults to SELENIUM_EXAMPLES_LOAD_PROFILE.
+        fast_launch: add the fast-launch switches (headless, no GPU, no
+            extensions...); defaults to SELENIUM_EXAMPLES_FAST_LAUNCH.
+    """
+    profile = LOAD_PROFILE if profile is None else profile
+    options = apply_profile(options or _browser_spec(browser)[1](), browser, profile)
+    if FAST_LAUNCH if fast_launch is None else fast_launch:
+        options = fast_launch_options(browser, options)
+    if BROKER_ENABLED and pooled is not False and browser in ('chrome', 'edge'):
+        # Not at module level: `python -m ...session_broker` would import itself twice.
+        from selenium_v4.support import session_broker  # pylint: disable=import-outside-toplevel
+    else:
+        session_broker = None
+    if session_broker is not None and session_broker.broker_accepts(browser, options):
+        driver = session_broker.attach_driver(browser, options)
+    elif POOL_ENABLED if pooled is None else pooled:
+        driver = pool_for(browser, options).checkout(timeout=POOL_TIMEOUT)
+    else:
+        driver = new_driver(browser, options)
+    return apply_session_profile(driver, browser, profile)
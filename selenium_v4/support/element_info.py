@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Batched element information in a single execute_script round trip.
+
+is_displayed(), tag_name, rect, value_of_css_property(), text and the
+attribute getters are one WebDriver command each. Inspecting F fields on N
+elements costs N * F HTTP round trips to the driver. query_elements() sends
+the element references and the field list in one execute_script call and
+gets every value back in one response.
+
+Field names:
+    displayed, enabled, selected, tag_name, rect, text
+    attribute:<name>       like get_attribute(): property first, then HTML attribute
+    property:<name>        like get_property()
+    dom_attribute:<name>   like get_dom_attribute()
+    css:<name>             like value_of_css_property()
+
+The values are computed by plain DOM APIs, not by the Selenium atoms the
+individual commands use, so edge cases can differ:
+    - displayed uses Element.checkVisibility() (opacity and visibility aware)
+      where available and falls back to "has layout boxes and is not hidden".
+    - text is innerText, which matches the WebDriver visible text for typical
+      content but not for every whitespace and shadow DOM corner case.
+Use the individual commands when an exact WebDriver answer matters.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+SIMPLE_FIELDS = ('displayed', 'enabled', 'selected', 'tag_name', 'rect', 'text')
+PARAMETERIZED_FIELDS = ('attribute', 'property', 'dom_attribute', 'css')
+
+# Defines read(el, kind, name) for one parsed field; shared with projection.py.
+READ_FIELD_JS = """
+function displayed(el) {
+  if (typeof el.checkVisibility === 'function') {
+    return el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true});
+  }
+  const style = window.getComputedStyle(el);
+  return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+}
+
+function read(el, kind, name) {
+  switch (kind) {
+    case 'displayed': return displayed(el);
+    case 'enabled': return !el.matches(':disabled');
+    case 'selected': return Boolean(el.checked || el.selected);
+    case 'tag_name': return el.tagName.toLowerCase();
+    case 'rect': {
+      const r = el.getBoundingClientRect();
+      return {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height};
+    }
+    case 'text': return el.innerText === undefined ? el.textContent : el.innerText;
+    case 'property': {
+      const value = el[name];
+      return value === undefined ? null : value;
+    }
+    case 'dom_attribute': return el.getAttribute(name);
+    case 'attribute': {
+      const value = el[name];
+      if (value !== undefined && value !== null && typeof value !== 'object' && typeof value !== 'function') {
+        return typeof value === 'boolean' ? (value ? 'true' : null) : String(value);
+      }
+      return el.getAttribute(name);
+    }
+    case 'css': return window.getComputedStyle(el).getPropertyValue(name);
+  }
+  return null;
+}
+"""
+
+QUERY_SCRIPT = READ_FIELD_JS + """
+const elements = arguments[0];
+const fields = arguments[1];
+return elements.map(function (el) {
+  return fields.map(function (field) { return read(el, field[0], field[1]); });
+});
+"""
+
+
+def parse_field(field: str) -> tuple[str, str | None]:
+    """Split 'kind:name' into the (kind, name) pair the page script expects."""
+    kind, _, name = field.partition(':')
+    if kind in SIMPLE_FIELDS and not name:
+        return kind, None
+    if kind in PARAMETERIZED_FIELDS and name:
+        return kind, name
+    raise ValueError(
+        f'Unknown field {field!r}; expected one of {SIMPLE_FIELDS} or '
+        f'<{"|".join(PARAMETERIZED_FIELDS)}>:<name>'
+    )
+
+
+def query_elements(driver: WebDriver, elements: Sequence[WebElement], fields: Iterable[str]) -> list[dict]:
+    """
+    Return the requested fields of every element, fetched with one execute_script.
+
+    Args:
+        driver: the session owning the elements.
+        elements: located WebElements.
+        fields: field names, see the module docstring.
+
+    Returns:
+        One dict per element, in the order of elements, keyed by field name.
+    """
+    fields = list(fields)
+    parsed = [parse_field(field) for field in fields]
+    if not elements:
+        return []
+    rows = driver.execute_script(QUERY_SCRIPT, list(elements), parsed)
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def query_element(driver: WebDriver, element: WebElement, fields: Iterable[str]) -> dict:
+    """Single-element form of query_elements()."""
+    return query_elements(driver, [element], fields)[0]
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Packed and base64-encoded browser extensions cached by content hash.
+
+Selenium sends extensions inside JSON payloads, base64-encoded:
+ChromiumOptions.to_capabilities() re-reads and re-encodes every
+add_extension() file each time it is called (build_driver() calls it for
+the pool key and again for the new session), and Firefox install_addon()
+reads the .xpi, or zips an unpacked directory, on every call.
+ExtensionCache does that work once per extension content:
+
+    digest()   SHA-256 of the content (a directory hashes its sorted
+               relative paths and file contents); memoized on path, size
+               and modification time, so unchanged files are not re-read.
+    packed()   the file itself, or for a directory a deterministic zip
+               written once to the cache directory.
+    encoded()  the base64 text, kept in memory (LRU, bounded by
+               MAX_MEMORY_BYTES) and on disk next to the packed file, so
+               other processes (runner workers) read it instead of encoding.
+
+add_cached_extension() puts the cached text on ChromiumOptions through
+add_encoded_extension(), which to_capabilities() passes through as is;
+install_cached_addon() sends Firefox's INSTALL_ADDON command with it.
+
+Environment:
+    SELENIUM_EXAMPLES_EXTENSION_CACHE   cache directory (default ~/.cache/selenium-examples/extensions)
+
+Example:
+    options = webdriver.ChromeOptions()
+    add_cached_extension(options, 'extension.crx')
+    addon_id = install_cached_addon(driver, 'addon-dir/', temporary=True)
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from selenium.webdriver.chromium.options import ChromiumOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+CACHE_DIR = Path(
+    os.getenv('SELENIUM_EXAMPLES_EXTENSION_CACHE', Path.home() / '.cache' / 'selenium-examples' / 'extensions')
+)
+MAX_MEMORY_BYTES = 64 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+# Fixed entry timestamp: the same directory always packs to the same bytes.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+@dataclass
+class CacheStats:
+    """Where encoded() found its results."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bytes_encoded: int = 0
+
+
+class ExtensionCache:
+    """
+    Thread-safe cache of packed and encoded extensions.
+
+    Args:
+        directory: where packed directories and encoded payloads are stored.
+        max_memory_bytes: size of the in-memory LRU of encoded payloads.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_memory_bytes: int = MAX_MEMORY_BYTES) -> None:
+        self.directory = Path(directory) if directory is not None else CACHE_DIR
+        self.max_memory_bytes = max_memory_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._digests: dict[tuple, str] = {}
+        self._encoded: OrderedDict[str, str] = OrderedDict()
+        self._memory_bytes = 0
+
+    @staticmethod
+    def _files(path: Path) -> list[Path]:
+        return sorted(child for child in path.rglob('*') if child.is_file())
+
+    def _identity(self, path: Path) -> tuple:
+        if path.is_dir():
+            return (str(path), *((str(child.relative_to(path)), *_stat(child)) for child in self._files(path)))
+        if not path.is_file():
+            raise FileNotFoundError(f'Extension {path} does not exist')
+        return (str(path), *_stat(path))
+
+    def digest(self, path: str | Path) -> str:
+        """Content hash of an extension file or unpacked directory."""
+        path = Path(path).expanduser().resolve()
+        identity = self._identity(path)
+        with self._lock:
+            cached = self._digests.get(identity)
+        if cached is not None:
+            return cached
+        sha = hashlib.sha256()
+        if path.is_dir():
+            for child in self._files(path):
+                sha.update(child.relative_to(path).as_posix().encode('utf-8') + b'\0')
+                _update(sha, child)
+        else:
+            _update(sha, path)
+        digest = sha.hexdigest()
+        with self._lock:
+            self._digests[identity] = digest
+        return digest
+
+    def packed(self, path: str | Path) -> Path:
+        """The extension as one archive: the file itself, or a cached zip of a directory."""
+        path = Path(path).expanduser().resolve()
+        if not path.is_dir():
+            return path
+        archive = self.directory / f'{self.digest(path)}.zip'
+        if not archive.is_file():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix='.pack-', dir=self.directory)
+            with os.fdopen(fd, 'wb') as handle, zipfile.ZipFile(handle, 'w', zipfile.ZIP_DEFLATED) as zipped:
+                for child in self._files(path):
+                    info = zipfile.ZipInfo(child.relative_to(path).as_posix(), ZIP_DATE_TIME)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    zipped.writestr(info, child.read_bytes())
+            os.replace(tmp, archive)
+        return archive
+
+    def encoded(self, path: str | Path) -> str:
+        """Base64 text of packed(path), as Selenium's payloads expect it."""
+        digest = self.digest(path)
+        with self._lock:
+            text = self._encoded.get(digest)
+            if text is not None:
+                self._encoded.move_to_end(digest)
+                self.stats.memory_hits += 1
+                return text
+
+        stored = self.directory / f'{digest}.b64'
+        if stored.is_file():
+            text = stored.read_text(encoding='ascii')
+            with self._lock:
+                self.stats.disk_hits += 1
+        else:
+            text = base64.b64encode(self.packed(path).read_bytes()).decode('ascii')
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix='.b64-', dir=self.directory)
+            with os.fdopen(fd, 'w', encoding='ascii') as handle:
+                handle.write(text)
+            os.replace(tmp, stored)
+            with self._lock:
+                self.stats.misses += 1
+                self.stats.bytes_encoded += len(text)
+
+        with self._lock:
+            if digest not in self._encoded:
+                self._encoded[digest] = text
+                self._memory_bytes += len(text)
+            while self._memory_bytes > self.max_memory_bytes and len(self._encoded) > 1:
+                _, evicted = self._encoded.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+        return text
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._digests.clear()
+            self._encoded.clear()
+            self._memory_bytes = 0
+
+
+def _stat(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _update(sha, path: Path) -> None:
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(CHUNK_SIZE), b''):
+            sha.update(chunk)
+
+
+_default_cache: ExtensionCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> ExtensionCache:
+    """The process-wide cache used when no cache is passed."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ExtensionCache()
+        return _default_cache
+
+
+def add_cached_extension(options: ChromiumOptions, path: str | Path, cache: ExtensionCache | None = None) -> str:
+    """add_extension() with the encoded payload taken from the cache; returns the digest."""
+    cache = cache or default_cache()
+    options.add_encoded_extension(cache.encoded(path))
+    return cache.digest(path)
+
+
+def install_cached_addon(
+    driver: WebDriver,
+    path: str | Path,
+    temporary: bool = False,
+    cache: ExtensionCache | None = None,
+) -> str:
+    """Firefox install_addon() with the packed, encoded add-on taken from the cache; returns the add-on id."""
+    if not hasattr(driver, 'install_addon'):
+        raise ValueError(f'{type(driver).__name__} cannot install add-ons; use add_cached_extension() on Chrome/Edge options')
+    cache = cache or default_cache()
+    return driver.execute('INSTALL_ADDON', {'addon': cache.encoded(path), 'temporary': temporary})['value']
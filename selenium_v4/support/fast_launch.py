@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Fast-launch browser options and cold-start measurement.
+
+Most of a new session's start-up time is the browser doing things a test
+run does not need: drawing a window, initialising the GPU process, first-run
+and default-browser checks, component and extension updates, sync, safe
+browsing and telemetry downloads. fast_launch_options() adds a curated set
+of switches that turn those off:
+
+    Chrome / Edge   --headless=new, --disable-gpu, --disable-extensions,
+                    --disable-background-networking, --disable-sync,
+                    --no-first-run, --no-default-browser-check,
+                    --disable-default-apps, --disable-component-update, ...
+    Firefox         -headless, plus preferences disabling the default-browser
+                    check, welcome/what's-new pages, telemetry and data
+                    reporting, add-on and app updates, Normandy experiments,
+                    safe-browsing list downloads and the captive-portal probe
+    Safari          nothing: safaridriver has no headless mode or switches
+
+Arguments the caller already set take precedence: a switch is skipped when
+the options already carry one with the same name (so an explicit
+--headless=old or --disable-features=... stays as it is).
+--disable-extensions is also skipped when the options load extensions
+(add_extension(), add_encoded_extension() / add_cached_extension() or
+--load-extension=), which it would otherwise switch off.
+
+SELENIUM_EXAMPLES_FAST_LAUNCH=1 makes every _build_driver() apply it, e.g.
+on CI. measure_cold_start() times session creation, first navigation to
+about:blank and quit for any options, to compare configurations.
+
+Example:
+    options = fast_launch_options('chrome')
+    print(measure_cold_start('chrome', options, runs=5))
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+
+from selenium.webdriver.common.options import ArgOptions
+
+from selenium_v4.support.driver_cache import resolve_driver_path
+
+FAST_LAUNCH = os.getenv('SELENIUM_EXAMPLES_FAST_LAUNCH') == '1'
+
+CHROMIUM_FAST_ARGS = (
+    '--headless=new',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-default-apps',
+    '--disable-component-update',
+    '--disable-client-side-phishing-detection',
+    '--disable-domain-reliability',
+    '--disable-breakpad',
+    '--disable-features=Translate,OptimizationHints,MediaRouter,InterestFeedContentSuggestions',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--password-store=basic',
+    '--use-mock-keychain',
+)
+
+FIREFOX_FAST_ARGS = ('-headless',)
+FIREFOX_FAST_PREFS = {
+    'browser.shell.checkDefaultBrowser': False,
+    'browser.startup.homepage_override.mstone': 'ignore',
+    'startup.homepage_welcome_url': 'about:blank',
+    'startup.homepage_welcome_url.additional': '',
+    'browser.aboutwelcome.enabled': False,
+    'datareporting.policy.dataSubmissionEnabled': False,
+    'datareporting.healthreport.uploadEnabled': False,
+    'toolkit.telemetry.enabled': False,
+    'toolkit.telemetry.unified': False,
+    'app.update.auto': False,
+    'app.normandy.enabled': False,
+    'extensions.update.enabled': False,
+    'extensions.getAddons.cache.enabled': False,
+    'browser.safebrowsing.update.enabled': False,
+    'browser.safebrowsing.downloads.remote.enabled': False,
+    'network.captive-portal-service.enabled': False,
+    'network.connectivity-service.enabled': False,
+}
+
+# browser -> (arguments, preferences)
+FAST_LAUNCH_SETTINGS = {
+    'chrome': (CHROMIUM_FAST_ARGS, {}),
+    'edge': (CHROMIUM_FAST_ARGS, {}),
+    'firefox': (FIREFOX_FAST_ARGS, FIREFOX_FAST_PREFS),
+    'safari': ((), {}),
+}
+
+
+def _switch_name(argument: str) -> str:
+    return argument.split('=', 1)[0].lstrip('-')
+
+
+def _has_extensions(options: ArgOptions) -> bool:
+    # The private lists, not the .extensions property, which reads and encodes every file.
+    if getattr(options, '_extension_files', None) or getattr(options, '_extensions', None):
+        return True
+    return 'load-extension' in {_switch_name(argument) for argument in getattr(options, 'arguments', ())}
+
+
+def fast_launch_options(browser: str, options: ArgOptions | None = None) -> ArgOptions:
+    """
+    Return a copy of options (a new options object when None) with the fast-launch switches added.
+
+    Args:
+        browser: 'chrome', 'edge', 'firefox' or 'safari'.
+        options: options to start from; not modified.
+    """
+    try:
+        arguments, prefs = FAST_LAUNCH_SETTINGS[browser]
+    except KeyError:
+        raise ValueError(f'Unsupported browser {browser!r}; expected one of {sorted(FAST_LAUNCH_SETTINGS)}') from None
+    if options is None:
+        # drivers.py imports this module, so not at module level.
+        from selenium_v4.support.drivers import BROWSERS  # pylint: disable=import-outside-toplevel
+        options = BROWSERS[browser][1]()
+    else:
+        options = copy.deepcopy(options)
+
+    present = {_switch_name(argument) for argument in getattr(options, 'arguments', ())}
+    if _has_extensions(options):
+        present.add('disable-extensions')
+    for argument in arguments:
+        if _switch_name(argument) not in present:
+            options.add_argument(argument)
+    existing = options.preferences if prefs else {}
+    for name, value in prefs.items():
+        if name not in existing:
+            options.set_preference(name, value)
+    return options
+
+
+@dataclass
+class ColdStart:
+    """Timings of measure_cold_start(), in seconds, one entry per run."""
+
+    browser: str
+    label: str
+    start: list[float] = field(default_factory=list)
+    first_navigation: list[float] = field(default_factory=list)
+    quit: list[float] = field(default_factory=list)
+
+    @property
+    def median_start(self) -> float:
+        return statistics.median(self.start)
+
+    @property
+    def median_total(self) -> float:
+        return statistics.median(s + n + q for s, n, q in zip(self.start, self.first_navigation, self.quit))
+
+    def __str__(self) -> str:
+        return (
+            f'{self.browser} {self.label}: start {self.median_start * 1000:.0f} ms, '
+            f'first navigation {statistics.median(self.first_navigation) * 1000:.0f} ms, '
+            f'quit {statistics.median(self.quit) * 1000:.0f} ms (median of {len(self.start)})'
+        )
+
+
+def measure_cold_start(browser: str, options: ArgOptions | None = None, runs: int = 3, label: str = '') -> ColdStart:
+    """
+    Launch and quit runs fresh sessions (never pooled) and time each phase.
+
+    The driver binary path is resolved once before timing, so the numbers
+    cover the driver process, the browser and the WebDriver session only.
+    """
+    from selenium_v4.support.drivers import new_driver  # pylint: disable=import-outside-toplevel
+
+    if runs < 1:
+        raise ValueError('runs must be at least 1')
+    if browser != 'safari':
+        resolve_driver_path(browser)
+    result = ColdStart(browser, label or ('default' if options is None else 'custom'))
+    for _ in range(runs):
+        started = time.perf_counter()
+        driver = new_driver(browser, copy.deepcopy(options) if options is not None else None)
+        ready = time.perf_counter()
+        try:
+            driver.get('about:blank')
+        finally:
+            navigated = time.perf_counter()
+            driver.quit()
+        result.start.append(ready - started)
+        result.first_navigation.append(navigated - ready)
+        result.quit.append(time.perf_counter() - navigated)
+    return result
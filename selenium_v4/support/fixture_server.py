@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""
+Local fixture HTTP server.
+
+Serves offline copies of the public pages the examples use, from a
+ThreadingHTTPServer running in a daemon thread, bound to 127.0.0.1 on a free
+port. Benchmarks use it so that they measure WebDriver round trips instead of
+internet latency; the examples use it when SELENIUM_EXAMPLES_LOCAL=1.
+
+Fixture layout mirrors the public URLs, host name first, so that
+https://www.selenium.dev/selenium/web/dynamic.html is served locally as
+http://127.0.0.1:<port>/www.selenium.dev/selenium/web/dynamic.html. Static
+pages live in support/fixtures/; pages that need server-side behaviour are
+routes of FixtureRequestHandler:
+
+    /the-internet.herokuapp.com/basic_auth   HTTP basic auth, admin / admin
+    /the-internet.herokuapp.com/upload       file upload form and its POST target
+    /cookies                                 JSON of the cookies sent by the browser
+    /cookies/set?name=value                  Set-Cookie for every query parameter
+    /heavy?images=8&delay=300&size=20000     DOM ready at once; load event waits for
+                                             images, a web font and an analytics-style
+                                             script, each served late and padded to size bytes
+    /delayed?type=image&delay=300&size=0     one asset (image, font, script, css) after delay
+                                             ms; a trailing file= names it for URL patterns
+
+Example:
+    with FixtureServer() as server:
+        driver.get(server.url('www.selenium.dev/selenium/web/web-form.html'))
+
+    DYNAMIC_PAGE = target_url('https://www.selenium.dev/selenium/web/dynamic.html')
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import email.parser
+import email.policy
+import functools
+import html
+import json
+import os
+import threading
+import time
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+LOCAL_FIXTURES = os.getenv('SELENIUM_EXAMPLES_LOCAL') == '1'
+
+BASIC_AUTH_CREDENTIALS = ('admin', 'admin')
+
+UPLOAD_FORM = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>The Internet</title></head>
+<body>
+  <h3>File Uploader</h3>
+  <form method="POST" enctype="multipart/form-data" action="upload">
+    <input id="file-upload" type="file" name="file" multiple>
+    <input id="file-submit" class="button" type="submit" value="Upload">
+  </form>
+</body>
+</html>
+"""
+
+UPLOAD_RESULT = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>The Internet</title></head>
+<body>
+  <h3>File Uploaded!</h3>
+  <div id="uploaded-files" class="panel text-center">{files}</div>
+</body>
+</html>
+"""
+
+HEAVY_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<title>Heavy page</title>
+<style>
+@font-face {{ font-family: Heavy; src: url("{base}&type=font&file=heavy.woff2"); }}
+body {{ font-family: Heavy, sans-serif; }}
+</style>
+</head>
+<body>
+<h1 id="heading">Heavy page</h1>
+<p id="summary">{images} images, one font and one analytics script, each served after {delay} ms.</p>
+{tags}
+<script async src="{base}&type=script&file=/gtag/js"></script>
+</body>
+</html>
+"""
+
+# 1x1 transparent PNG.
+PIXEL_PNG = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII='
+)
+DELAYED_ASSETS = {
+    'image': (PIXEL_PNG, 'image/png'),
+    'font': (b'wOF2', 'font/woff2'),
+    'script': (b'window.delayedScriptLoaded = true;', 'text/javascript'),
+    'css': (b'body { margin: 1em; }', 'text/css'),
+}
+MAX_DELAY_MS = 10000
+MAX_ASSET_SIZE = 10_000_000
+
+BASIC_AUTH_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>The Internet</title></head>
+<body>
+  <h3>Basic Auth</h3>
+  <p>Congratulations! You must have the proper credentials.</p>
+</body>
+</html>
+"""
+
+
+class FixtureRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler for the fixtures directory plus a few dynamic routes."""
+
+    routes = {
+        ('GET', '/the-internet.herokuapp.com/basic_auth'): 'basic_auth',
+        ('GET', '/the-internet.herokuapp.com/upload'): 'upload_form',
+        ('POST', '/the-internet.herokuapp.com/upload'): 'upload',
+        ('GET', '/cookies'): 'cookies',
+        ('GET', '/cookies/set'): 'set_cookies',
+        ('GET', '/heavy'): 'heavy',
+        ('GET', '/delayed'): 'delayed',
+    }
+
+    def do_GET(self):
+        if not self._dispatch('GET'):
+            super().do_GET()
+
+    def do_POST(self):
+        if not self._dispatch('POST'):
+            self.send_error(HTTPStatus.METHOD_NOT_ALLOWED)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    # -- routes ------------------------------------------------------------
+
+    def basic_auth(self, query: dict) -> None:
+        expected = base64.b64encode(':'.join(BASIC_AUTH_CREDENTIALS).encode()).decode()
+        if self.headers.get('Authorization') != f'Basic {expected}':
+            self.send_response(HTTPStatus.UNAUTHORIZED)
+            self.send_header('WWW-Authenticate', 'Basic realm="Restricted Area"')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self._send_html(BASIC_AUTH_PAGE)
+
+    def upload_form(self, query: dict) -> None:
+        self._send_html(UPLOAD_FORM)
+
+    def upload(self, query: dict) -> None:
+        length = int(self.headers.get('Content-Length', 0))
+        head = f'Content-Type: {self.headers.get("Content-Type", "")}\r\n\r\n'.encode()
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(head + self.rfile.read(length))
+        names = [part.get_filename() for part in message.iter_parts() if part.get_filename()]
+        self._send_html(UPLOAD_RESULT.format(files='\n'.join(html.escape(name) for name in names)))
+
+    def cookies(self, query: dict) -> None:
+        jar = SimpleCookie(self.headers.get('Cookie', ''))
+        self._send(json.dumps({name: morsel.value for name, morsel in jar.items()}), 'application/json')
+
+    def set_cookies(self, query: dict) -> None:
+        self.send_response(HTTPStatus.FOUND)
+        for name, value in query.items():
+            self.send_header('Set-Cookie', f'{name}={value}; Path=/')
+        self.send_header('Location', '/cookies')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def heavy(self, query: dict) -> None:
+        images = int(query.get('images', 8))
+        delay = int(query.get('delay', 300))
+        # Plain '&' everywhere: the URLs also appear in CSS, where entities are not decoded.
+        base = f'/delayed?delay={delay}&size={int(query.get("size", 0))}'
+        tags = '\n'.join(
+            f'<img src="{base}&type=image&file=pixel{index}.png" width="32" height="32" alt="">'
+            for index in range(images)
+        )
+        self._send_html(HEAVY_PAGE.format(images=images, delay=delay, tags=tags, base=base))
+
+    def delayed(self, query: dict) -> None:
+        body, content_type = DELAYED_ASSETS.get(query.get('type', 'image'), DELAYED_ASSETS['image'])
+        # Padding after the payload (past a PNG's IEND chunk) is ignored by the browser.
+        body = body.ljust(min(int(query.get('size', 0)), MAX_ASSET_SIZE), b'\0')
+        time.sleep(min(int(query.get('delay', 300)), MAX_DELAY_MS) / 1000)
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    # -- helpers -----------------------------------------------------------
+
+    def _dispatch(self, method: str) -> bool:
+        parts = urlsplit(self.path)
+        handler = self.routes.get((method, parts.path.rstrip('/') or '/'))
+        if handler is None:
+            return False
+        getattr(self, handler)(dict(parse_qsl(parts.query)))
+        return True
+
+    def _send_html(self, body: str) -> None:
+        self._send(body, 'text/html; charset=utf-8')
+
+    def _send(self, body: str, content_type: str) -> None:
+        payload = body.encode('utf-8')
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class FixtureServer:
+    """
+    Threaded HTTP server for the fixture pages.
+
+    Args:
+        host: interface to bind; loopback by default.
+        port: port to bind; 0 picks a free port.
+        root: directory served as the document root.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, root: Path = FIXTURES_DIR) -> None:
+        self.host = host
+        self.port = port
+        self.root = root
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError('FixtureServer is not running')
+        return f'http://{self.host}:{self._httpd.server_address[1]}/'
+
+    def url(self, path: str = '') -> str:
+        """Absolute URL of a fixture page."""
+        return self.base_url + path.lstrip('/')
+
+    def local_url(self, public_url: str) -> str:
+        """Local URL of the fixture mirroring public_url (host name first)."""
+        parts = urlsplit(public_url)
+        return self.url(parts.netloc + (parts.path or '/'))
+
+    def start(self) -> FixtureServer:
+        if self._httpd is None:
+            handler = functools.partial(FixtureRequestHandler, directory=str(self.root))
+            self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+            self._httpd.daemon_threads = True
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name='fixture-server', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = self._thread = None
+
+    def __enter__(self) -> FixtureServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+_shared: FixtureServer | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_server() -> FixtureServer:
+    """The process-wide fixture server, started on first use and stopped at exit."""
+    global _shared  # pylint: disable=global-statement
+    with _shared_lock:
+        if _shared is None:
+            _shared = FixtureServer().start()
+            atexit.register(_shared.stop)
+        return _shared
+
+
+def target_url(public_url: str, local: bool | None = None) -> str:
+    """
+    URL an example should open: public_url, or its local fixture copy.
+
+    Args:
+        public_url: the page on the internet, as the examples reference it.
+        local: use the fixture server; defaults to SELENIUM_EXAMPLES_LOCAL.
+    """
+    if not (LOCAL_FIXTURES if local is None else local):
+        return public_url
+    return shared_server().local_url(public_url)
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Shared, instrumented HTTP connection pools for remote WebDriver sessions.
+
+Every RemoteConnection builds its own urllib3.PoolManager, with urllib3's
+default of one kept-alive connection per host. Dozens of threads driving
+sessions on one Grid therefore open a new TCP (and TLS) connection whenever
+two commands of a session overlap, and every new session starts with a cold
+pool. PooledRemoteConnection keeps one PoolManager per hub for the whole
+process, shared by every session to that hub, with:
+
+    pool_size     connections kept alive per host (urllib3 maxsize)
+    block         True: at most pool_size concurrent requests per host; others
+                  wait for a free connection (counted as waits). False: open
+                  extra connections under load and drop them afterwards.
+    pool_timeout  seconds a blocked request waits before EmptyPoolError
+
+Counters per hub (pool_stats()):
+    hits          request served by an idle kept-alive connection
+    misses        request that had to open a new connection
+    reconnects    idle connection found closed by the server, reopened
+    waits         request that found no idle connection in a full pool
+    wait_seconds  total time spent in those waits
+
+Pools are released by close_http_pools(), registered with atexit; quitting
+a session leaves its hub's pool warm for the next one. Connections through
+an HTTP or SOCKS proxy use the stock, per-connection manager.
+
+Example:
+    connection = PooledRemoteConnection(GRID_URL, pool_size=32)
+    driver = webdriver.Remote(command_executor=connection, options=options)
+    ...
+    print(pool_stats())
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import urllib3
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ClosedPoolError, EmptyPoolError
+from urllib3.util.connection import is_connection_dropped
+
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+DEFAULT_POOL_SIZE = int(os.getenv('SELENIUM_EXAMPLES_HTTP_POOL_SIZE', '16'))
+
+
+@dataclass
+class HttpPoolStats:
+    """Connection checkout counters of one hub's pool."""
+
+    hits: int = 0
+    misses: int = 0
+    reconnects: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, reused: bool, dropped: bool, waited: float | None) -> None:
+        with self._lock:
+            if not reused:
+                self.misses += 1
+            elif dropped:
+                self.reconnects += 1
+            else:
+                self.hits += 1
+            if waited is not None:
+                self.waits += 1
+                self.wait_seconds += waited
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'reconnects': self.reconnects,
+                'waits': self.waits,
+                'wait_seconds': self.wait_seconds,
+            }
+
+
+class _CountingPoolMixin:
+    """urllib3 connection pool that records every checkout in an HttpPoolStats."""
+
+    stats: HttpPoolStats
+    pool_timeout: float | None = None
+
+    def _get_conn(self, timeout=None):
+        # Same flow as HTTPConnectionPool._get_conn, with counters.
+        if self.pool is None:
+            raise ClosedPoolError(self, 'Pool is closed.')
+        timeout = self.pool_timeout if timeout is None else timeout
+        conn = None
+        waited = None
+        try:
+            conn = self.pool.get(block=False)
+        except queue.Empty:
+            if self.block:
+                start = time.perf_counter()
+                try:
+                    conn = self.pool.get(block=True, timeout=timeout)
+                except queue.Empty:
+                    raise EmptyPoolError(self, 'Pool is empty and a new connection cannot be opened in blocking mode.') from None
+                finally:
+                    waited = time.perf_counter() - start
+        except AttributeError:
+            raise ClosedPoolError(self, 'Pool is closed.') from None
+
+        dropped = bool(conn) and is_connection_dropped(conn)
+        if dropped:
+            conn.close()
+        self.stats.record(reused=conn is not None, dropped=dropped, waited=waited)
+        return conn or self._new_conn()
+
+
+class CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class CountingPoolManager(urllib3.PoolManager):
+    """PoolManager whose per-host pools share one HttpPoolStats."""
+
+    def __init__(self, stats: HttpPoolStats, pool_timeout: float | None = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.stats = stats
+        self.pool_timeout = pool_timeout
+        self.pool_classes_by_scheme = {'http': CountingHTTPConnectionPool, 'https': CountingHTTPSConnectionPool}
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.stats = self.stats
+        pool.pool_timeout = self.pool_timeout
+        return pool
+
+
+_managers: dict[tuple, CountingPoolManager] = {}
+_managers_lock = threading.Lock()
+
+
+def _hub_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'
+
+
+class PooledRemoteConnection(RemoteConnection):
+    """
+    RemoteConnection using the process-wide pool of its hub.
+
+    Args:
+        remote_server_addr: hub URL; ignored when client_config is given.
+        pool_size: connections kept alive per host.
+        block: cap concurrent requests per host at pool_size.
+        pool_timeout: seconds to wait for a free connection when block is set.
+        client_config: full ClientConfig; keep_alive must not be disabled.
+        ignore_proxy: as for RemoteConnection.
+    """
+
+    def __init__(
+        self,
+        remote_server_addr: str | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        block: bool = True,
+        pool_timeout: float | None = None,
+        client_config: ClientConfig | None = None,
+        ignore_proxy: bool = False,
+    ) -> None:
+        if client_config is None:
+            if not remote_server_addr:
+                raise ValueError('remote_server_addr or client_config is required')
+            client_config = ClientConfig(remote_server_addr=remote_server_addr, keep_alive=True)
+        elif not client_config.keep_alive:
+            raise ValueError('PooledRemoteConnection requires keep_alive; without it nothing is pooled')
+        self.pool_size = pool_size
+        self.block = block
+        self.pool_timeout = pool_timeout
+        super().__init__(client_config=client_config, ignore_proxy=ignore_proxy)
+
+    @property
+    def hub(self) -> str:
+        return _hub_key(self._client_config.remote_server_addr)
+
+    def _get_connection_manager(self):
+        if self._proxy_url:
+            return super()._get_connection_manager()
+
+        config = self._client_config
+        key = (self.hub, self.pool_size, self.block, self.pool_timeout, bool(config.ignore_certificates), config.ca_certs)
+        with _managers_lock:
+            manager = _managers.get(key)
+            if manager is None:
+                init_args = {'maxsize': self.pool_size, 'block': self.block, 'timeout': config.timeout}
+                init_args.update((config.init_args_for_pool_manager or {}).get('init_args_for_pool_manager', {}))
+                if config.ignore_certificates:
+                    init_args['cert_reqs'] = 'CERT_NONE'
+                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                elif config.ca_certs:
+                    init_args['cert_reqs'] = 'CERT_REQUIRED'
+                    init_args['ca_certs'] = config.ca_certs
+                manager = _managers[key] = CountingPoolManager(HttpPoolStats(), self.pool_timeout, **init_args)
+            return manager
+
+    def close(self) -> None:
+        # The pool outlives the session: the next session to this hub reuses its connections.
+        if self._proxy_url:
+            super().close()
+
+
+def pool_stats() -> dict[str, dict]:
+    """Counters of every shared pool, keyed by hub (summed over pool configurations)."""
+    totals: dict[str, dict] = {}
+    with _managers_lock:
+        items = list(_managers.items())
+    for key, manager in items:
+        snapshot = manager.stats.snapshot()
+        total = totals.setdefault(key[0], dict.fromkeys(snapshot, 0))
+        for name, value in snapshot.items():
+            total[name] += value
+    return totals
+
+
+def close_http_pools() -> None:
+    """Close every shared pool and forget its counters."""
+    with _managers_lock:
+        managers = list(_managers.values())
+        _managers.clear()
+    for manager in managers:
+        manager.clear()
+
+
+atexit.register(close_http_pools)
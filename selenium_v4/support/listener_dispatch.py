@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+AbstractEventListener callbacks without EventFiringWebDriver's wrapping.
+
+EventFiringWebDriver proxies every attribute of the driver and of every
+element through __getattr__, and wraps each element (and each item of
+every find_elements() list) in an EventFiringWebElement, whether or not a
+listener cares. attach_listeners() keeps the driver object and its
+elements as they are and intercepts only the hooks some listener overrides:
+
+    navigate_to / navigate_back / navigate_forward / execute_script /
+    close / quit / find   method overridden on this driver instance
+    click / change_value_of / find (on elements)
+                          methods of a per-driver WebElement subclass set
+                          as driver._web_element_cls, so find_elements()
+                          returns plain lists of ready-to-use elements
+    on_exception          driver.execute, the one path every command takes
+
+Selenium's element getters run JavaScript atoms through the driver's
+execute_script (get_attribute, get_property, is_displayed, submit). Those
+are not user scripts, and EventFiringWebDriver does not report them either
+(its elements point back at the unwrapped driver): the per-driver element
+class runs them with the execute_script hook bypassed.
+
+A listener "overrides" a hook when its class defines the method itself
+rather than inheriting the no-op from AbstractEventListener, so a listener
+with only before_click adds nothing to navigation, finds or attribute
+reads. Listeners need not subclass AbstractEventListener at all.
+
+Differences from EventFiringWebDriver:
+    - hooks receive the driver and the element themselves (there is no
+      wrapper to unwrap), and isinstance(driver, webdriver.Chrome) holds;
+    - on_exception fires for every failed command, including ones Selenium
+      catches internally (e.g. get_cookie() of a missing cookie), but not
+      for Python errors raised before a command is sent.
+
+Example:
+    driver = attach_listeners(webdriver.Chrome(), MetricsListener(metrics))
+    driver.get(url)                    # before/after_navigate_to
+    items = driver.find_elements(...)  # one before/after_find, plain list
+    detach_listeners(driver)
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from collections.abc import Callable
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.abstract_event_listener import AbstractEventListener
+
+# Hook -> driver methods it covers, with the hook arguments they supply.
+DRIVER_HOOKS = {
+    'navigate_to': {'get': lambda url: (url,)},
+    'navigate_back': {'back': lambda: ()},
+    'navigate_forward': {'forward': lambda: ()},
+    'find': {'find_element': lambda by='id', value=None: (by, value), 'find_elements': lambda by='id', value=None: (by, value)},
+    'execute_script': {'execute_script': lambda script, *args: (script,), 'execute_async_script': lambda script, *args: (script,)},
+    'close': {'close': lambda: ()},
+    'quit': {'quit': lambda: ()},
+}
+# Same for WebElement methods; the hook arguments also receive the element.
+ELEMENT_HOOKS = {
+    'click': {'click': lambda element: (element,)},
+    'change_value_of': {'clear': lambda element: (element,), 'send_keys': lambda element, *value: (element,)},
+    'find': {
+        'find_element': lambda element, by='id', value=None: (by, value),
+        'find_elements': lambda element, by='id', value=None: (by, value),
+    },
+}
+HOOKS = (*DRIVER_HOOKS, 'click', 'change_value_of')
+# WebElement methods implemented with execute_script atoms.
+ELEMENT_ATOMS = ('get_attribute', 'get_property', 'is_displayed', 'submit')
+
+
+def overrides(listener: object, callback: str) -> bool:
+    """True when the listener implements callback (rather than inheriting AbstractEventListener's no-op)."""
+    method = getattr(type(listener), callback, None)
+    return callable(method) and method is not getattr(AbstractEventListener, callback, None)
+
+
+class EventDispatcher:
+    """The callbacks of a list of listeners, grouped by hook; only overridden ones are kept."""
+
+    def __init__(self, listeners: list[object]) -> None:
+        self.listeners = list(listeners)
+        self.callbacks: dict[str, list[Callable]] = {}
+        for name in (*(f'{when}_{hook}' for hook in HOOKS for when in ('before', 'after')), 'on_exception'):
+            self.callbacks[name] = [getattr(listener, name) for listener in self.listeners if overrides(listener, name)]
+        self._atoms = threading.local()
+
+    def subscribed(self, hook: str) -> bool:
+        return bool(self.callbacks[f'before_{hook}'] or self.callbacks[f'after_{hook}'])
+
+    def hooked(self, hook: str, method: Callable, hook_args: Callable, driver: WebDriver) -> Callable:
+        """Wrap method (bound for the driver, plain function for elements) with the hook's callbacks."""
+        before = self.callbacks[f'before_{hook}']
+        after = self.callbacks[f'after_{hook}']
+
+        @functools.wraps(method)
+        def call(*args, **kwargs):
+            if getattr(self._atoms, 'depth', 0):
+                return method(*args, **kwargs)
+            values = (*hook_args(*args, **kwargs), driver)
+            for callback in before:
+                callback(*values)
+            result = method(*args, **kwargs)
+            for callback in after:
+                callback(*values)
+            return result
+
+        return call
+
+    def unhooked(self, method: Callable) -> Callable:
+        """Wrap an element method so the scripts it runs fire no execute_script callbacks."""
+
+        @functools.wraps(method)
+        def call(*args, **kwargs):
+            self._atoms.depth = getattr(self._atoms, 'depth', 0) + 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._atoms.depth -= 1
+
+        return call
+
+
+def attach_listeners(driver: WebDriver, *listeners: object) -> WebDriver:
+    """
+    Fire the listeners' callbacks for commands of driver; returns the same driver.
+
+    Attaching again replaces the previous listeners.
+    """
+    detach_listeners(driver)
+    dispatcher = EventDispatcher(list(listeners))
+    patched: list[str] = []
+
+    for hook, methods in DRIVER_HOOKS.items():
+        if dispatcher.subscribed(hook):
+            for name, hook_args in methods.items():
+                setattr(driver, name, dispatcher.hooked(hook, getattr(driver, name), hook_args, driver))
+                patched.append(name)
+
+    on_exception = dispatcher.callbacks['on_exception']
+    if on_exception:
+        execute = driver.execute
+
+        @functools.wraps(execute)
+        def execute_reporting(driver_command, params=None):
+            try:
+                return execute(driver_command, params)
+            except Exception as exc:
+                for callback in on_exception:
+                    callback(exc, driver)
+                raise
+
+        driver.execute = execute_reporting
+        patched.append('execute')
+
+    element_cls = driver._web_element_cls
+    members = {}
+    for hook, methods in ELEMENT_HOOKS.items():
+        if dispatcher.subscribed(hook):
+            for name, hook_args in methods.items():
+                members[name] = dispatcher.hooked(hook, getattr(element_cls, name), hook_args, driver)
+    if dispatcher.subscribed('execute_script'):
+        for name in ELEMENT_ATOMS:
+            members[name] = dispatcher.unhooked(getattr(element_cls, name))
+    if members:
+        driver._web_element_cls = type(f'Listened{element_cls.__name__}', (element_cls,), members)
+
+    driver._listener_dispatch = (dispatcher, patched, element_cls)
+    return driver
+
+
+def detach_listeners(driver: WebDriver) -> None:
+    """Remove what attach_listeners() installed; elements found while attached keep their hooks."""
+    state = driver.__dict__.pop('_listener_dispatch', None)
+    if state is None:
+        return
+    _, patched, element_cls = state
+    for name in patched:
+        driver.__dict__.pop(name, None)
+    driver._web_element_cls = element_cls
+
+
+def listeners_of(driver: WebDriver) -> list[object]:
+    """Listeners attached to driver, in dispatch order."""
+    state = driver.__dict__.get('_listener_dispatch')
+    return state[0].listeners if state else []
+
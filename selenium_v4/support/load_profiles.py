@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Named page-load profiles applied to the options of every build_driver() session.
+
+driver.get() returns when the page reaches the readiness the session's
+pageLoadStrategy asks for: 'normal' waits for the load event (every image,
+stylesheet, font and iframe), 'eager' for DOMContentLoaded. Examples that
+only read the DOM do not need the load event, nor the images at all.
+
+    strict  pageLoadStrategy normal, nothing blocked: what a user sees
+    fast    pageLoadStrategy eager, images, media, fonts, analytics and ads
+            blocked (see resource_blocking.py): on Chrome/Edge by the images
+            content setting plus CDP URL patterns set right after session
+            creation, on Firefox by preferences; Safari has no blocking
+            switch and only gets the strategy
+
+SELENIUM_EXAMPLES_LOAD_PROFILE=fast (or strict) makes every _build_driver()
+use that profile; unset, options are left exactly as the example built
+them. Options that already ask for a non-default strategy (an example
+demonstrating 'eager' or 'none') keep it. Pools are keyed by the resulting
+capabilities, so sessions of different profiles are never shared.
+
+Example:
+    driver = build_driver('chrome', profile='fast')
+    options = apply_profile(webdriver.FirefoxOptions(), 'firefox', 'strict')
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+from dataclasses import dataclass
+
+from selenium.webdriver.common.options import ArgOptions, PageLoadStrategy
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from selenium_v4.support.resource_blocking import DEFAULT_CATEGORIES, block_resources, firefox_block_prefs
+
+LOAD_PROFILE = os.getenv('SELENIUM_EXAMPLES_LOAD_PROFILE', '')
+
+CHROMIUM_BROWSERS = ('chrome', 'edge')
+# Content setting value meaning "block".
+CHROMIUM_IMAGES_PREF = 'profile.managed_default_content_settings.images'
+BLOCKED = 2
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """
+    How sessions load pages.
+
+    Args:
+        name: profile name, as used by SELENIUM_EXAMPLES_LOAD_PROFILE.
+        page_load_strategy: 'normal', 'eager' or 'none'.
+        block: resource categories not to fetch (resource_blocking.BLOCK_CATEGORIES).
+        page_load_timeout: seconds before driver.get() raises TimeoutException;
+            the browser default (300) when None.
+    """
+
+    name: str
+    page_load_strategy: str
+    block: tuple[str, ...] = ()
+    page_load_timeout: float | None = None
+
+
+PROFILES = {
+    'strict': LoadProfile('strict', PageLoadStrategy.normal),
+    'fast': LoadProfile('fast', PageLoadStrategy.eager, block=DEFAULT_CATEGORIES),
+}
+
+
+def get_profile(profile: str | LoadProfile | None) -> LoadProfile | None:
+    """Resolve a profile name (or pass a LoadProfile through); None and '' mean no profile."""
+    if profile is None or isinstance(profile, LoadProfile):
+        return profile
+    if not profile:
+        return None
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f'Unknown load profile {profile!r}; expected one of {sorted(PROFILES)}') from None
+
+
+def apply_profile(options: ArgOptions, browser: str, profile: str | LoadProfile | None) -> ArgOptions:
+    """Return a copy of options with the profile applied; options itself is not modified."""
+    profile = get_profile(profile)
+    if profile is None:
+        return options
+    options = copy.deepcopy(options)
+
+    if options.page_load_strategy == PageLoadStrategy.normal:
+        options.page_load_strategy = profile.page_load_strategy
+    if profile.page_load_timeout is not None:
+        options.timeouts = {**(options.timeouts or {}), 'pageLoad': int(profile.page_load_timeout * 1000)}
+
+    if 'images' in profile.block and browser in CHROMIUM_BROWSERS:
+        prefs = dict(options.experimental_options.get('prefs', {}))
+        prefs[CHROMIUM_IMAGES_PREF] = BLOCKED
+        options.add_experimental_option('prefs', prefs)
+    elif profile.block and browser == 'firefox':
+        for name, value in firefox_block_prefs(profile.block).items():
+            options.set_preference(name, value)
+    return options
+
+
+def apply_session_profile(driver: WebDriver, browser: str, profile: str | LoadProfile | None) -> WebDriver:
+    """The part of a profile that needs a running session: CDP URL blocking on Chrome/Edge."""
+    profile = get_profile(profile)
+    if profile is not None and profile.block and browser in CHROMIUM_BROWSERS:
+        block_resources(driver, profile.block)
+    return driver
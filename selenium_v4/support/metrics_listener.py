@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+Per-command latency histograms collected through EventFiringWebDriver.
+
+MetricsListener is an AbstractEventListener that times every hooked command
+(the span between its before_* and after_* callbacks) and counts the
+exceptions reported through on_exception. Results accumulate in a
+CommandMetrics registry, which can be shared by every session of a suite
+and exported as:
+
+    - Prometheus text exposition format (write_prometheus(), e.g. for the
+      node_exporter textfile collector):
+          selenium_command_duration_seconds_bucket{command="find",outcome="ok",le="0.05"} 12
+          selenium_command_duration_seconds_sum{command="find",outcome="ok"} 0.41
+          selenium_command_duration_seconds_count{command="find",outcome="ok"} 15
+          selenium_command_exceptions_total{command="find",exception="NoSuchElementException"} 2
+    - JSON (write_json()), with count, sum, min, max, estimated p50/p90/p99
+      and the buckets of every command;
+    - a table sorted by total time (print_report()), to see which commands
+      dominate a run.
+
+Commands are named after the listener hooks: navigate_to, navigate_back,
+navigate_forward, find, click, change_value_of, execute_script, close,
+quit. An exception raised between before_X and after_X is counted for X
+and its duration recorded under outcome="error"; exceptions outside a
+hooked command (e.g. reading driver.title) are counted under "other".
+
+Example:
+    metrics = CommandMetrics()
+    driver = EventFiringWebDriver(webdriver.Chrome(), MetricsListener(metrics))
+    ...
+    metrics.write_prometheus(OUTPUT_DIR / 'selenium.prom')
+    metrics.print_report()
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+from selenium.webdriver.support.abstract_event_listener import AbstractEventListener
+
+# Upper bounds in seconds; the implicit last bucket is +Inf.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_PREFIX = 'selenium_command'
+OTHER = 'other'
+
+
+class Histogram:
+    """Bucketed durations of one command and outcome."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Interpolated inside its bucket like Prometheus' histogram_quantile(), clamped to min/max."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[index - 1] if index else 0.0
+                if index == len(self.buckets):
+                    return self.max
+                upper = self.buckets[index]
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                # The observed extremes are exact; never report beyond them.
+                return min(max(estimate, self.min), self.max)
+            seen += count
+        return self.max
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """(le, count) pairs in exposition order, ending with +Inf."""
+        pairs, total = [], 0
+        for bound, count in zip((*map(repr, self.buckets), '+Inf'), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+            'buckets': dict(self.cumulative()),
+        }
+
+
+class CommandMetrics:
+    """Thread-safe registry of command histograms and exception counts."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._durations: dict[tuple[str, str], Histogram] = {}
+        self._exceptions: dict[tuple[str, str], int] = {}
+
+    def observe(self, command: str, seconds: float, outcome: str = 'ok') -> None:
+        with self._lock:
+            histogram = self._durations.get((command, outcome))
+            if histogram is None:
+                histogram = self._durations[command, outcome] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def count_exception(self, command: str, exception: BaseException) -> None:
+        key = (command, type(exception).__name__)
+        with self._lock:
+            self._exceptions[key] = self._exceptions.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._durations.clear()
+            self._exceptions.clear()
+
+    def to_json(self) -> dict:
+        with self._lock:
+            durations = {}
+            for (command, outcome), histogram in sorted(self._durations.items()):
+                durations.setdefault(command, {})[outcome] = histogram.to_dict()
+            exceptions = {}
+            for (command, name), count in sorted(self._exceptions.items()):
+                exceptions.setdefault(command, {})[name] = count
+        return {'durations': durations, 'exceptions': exceptions}
+
+    def to_prometheus(self) -> str:
+        name = f'{METRIC_PREFIX}_duration_seconds'
+        lines = [
+            f'# HELP {name} Duration of WebDriver commands seen by MetricsListener.',
+            f'# TYPE {name} histogram',
+        ]
+        with self._lock:
+            for (command, outcome), histogram in sorted(self._durations.items()):
+                labels = f'command="{command}",outcome="{outcome}"'
+                for bound, total in histogram.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {total}')
+                lines.append(f'{name}_sum{{{labels}}} {histogram.sum!r}')
+                lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+            exceptions = sorted(self._exceptions.items())
+        name = f'{METRIC_PREFIX}_exceptions_total'
+        lines += [f'# HELP {name} Exceptions reported by WebDriver commands.', f'# TYPE {name} counter']
+        for (command, exception), count in exceptions:
+            lines.append(f'{name}{{command="{command}",exception="{exception}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str | Path) -> Path:
+        """Write the exposition text atomically, so a collector never reads a partial file."""
+        return _write_atomic(Path(path), self.to_prometheus())
+
+    def write_json(self, path: str | Path) -> Path:
+        return _write_atomic(Path(path), json.dumps(self.to_json(), indent=2) + '\n')
+
+    def print_report(self) -> None:
+        """Print every command sorted by total time, with its share of the total."""
+        data = self.to_json()
+        rows = []
+        for command, outcomes in data['durations'].items():
+            for outcome, stats in outcomes.items():
+                rows.append((command if outcome == 'ok' else f'{command} ({outcome})', stats))
+        if not rows:
+            print('No commands recorded.')
+            return
+        total = sum(stats['sum'] for _, stats in rows) or 1.0
+        width = max(len('command'), *(len(label) for label, _ in rows))
+        print(f'{"command":<{width}}  {"count":>6}  {"total s":>8}  {"share":>6}  {"p50 ms":>8}  {"p99 ms":>8}  {"max ms":>8}')
+        for label, stats in sorted(rows, key=lambda row: row[1]['sum'], reverse=True):
+            print(
+                f'{label:<{width}}  {stats["count"]:6d}  {stats["sum"]:8.3f}  {stats["sum"] / total:6.1%}  '
+                f'{stats["p50"] * 1000:8.1f}  {stats["p99"] * 1000:8.1f}  {stats["max"] * 1000:8.1f}'
+            )
+        for command, counts in data['exceptions'].items():
+            print(f'exceptions in {command}: ' + ', '.join(f'{name} x{count}' for name, count in counts.items()))
+
+
+def _write_atomic(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
+    return path
+
+
+class MetricsListener(AbstractEventListener):
+    """
+    Listener recording the duration of every hooked command into a CommandMetrics.
+
+    Args:
+        metrics: registry to record into; share one across sessions to get
+            suite-wide numbers. A new one by default (see .metrics).
+    """
+
+    def __init__(self, metrics: CommandMetrics | None = None) -> None:
+        self.metrics = metrics or CommandMetrics()
+        self._local = threading.local()
+
+    def _stack(self) -> list[tuple[str, float]]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _start(self, command: str) -> None:
+        self._stack().append((command, time.perf_counter()))
+
+    def _stop(self, command: str) -> None:
+        stack = self._stack()
+        if stack and stack[-1][0] == command:
+            _, start = stack.pop()
+            self.metrics.observe(command, time.perf_counter() - start)
+
+    def before_navigate_to(self, url, driver) -> None:
+        self._start('navigate_to')
+
+    def after_navigate_to(self, url, driver) -> None:
+        self._stop('navigate_to')
+
+    def before_navigate_back(self, driver) -> None:
+        self._start('navigate_back')
+
+    def after_navigate_back(self, driver) -> None:
+        self._stop('navigate_back')
+
+    def before_navigate_forward(self, driver) -> None:
+        self._start('navigate_forward')
+
+    def after_navigate_forward(self, driver) -> None:
+        self._stop('navigate_forward')
+
+    def before_find(self, by, value, driver) -> None:
+        self._start('find')
+
+    def after_find(self, by, value, driver) -> None:
+        self._stop('find')
+
+    def before_click(self, element, driver) -> None:
+        self._start('click')
+
+    def after_click(self, element, driver) -> None:
+        self._stop('click')
+
+    def before_change_value_of(self, element, driver) -> None:
+        self._start('change_value_of')
+
+    def after_change_value_of(self, element, driver) -> None:
+        self._stop('change_value_of')
+
+    def before_execute_script(self, script, driver) -> None:
+        self._start('execute_script')
+
+    def after_execute_script(self, script, driver) -> None:
+        self._stop('execute_script')
+
+    def before_close(self, driver) -> None:
+        self._start('close')
+
+    def after_close(self, driver) -> None:
+        self._stop('close')
+
+    def before_quit(self, driver) -> None:
+        self._start('quit')
+
+    def after_quit(self, driver) -> None:
+        self._stop('quit')
+
+    def on_exception(self, exception, driver) -> None:
+        stack = self._stack()
+        if not stack:
+            self.metrics.count_exception(OTHER, exception)
+            return
+        command, start = stack.pop()
+        self.metrics.observe(command, time.perf_counter() - start, outcome='error')
+        self.metrics.count_exception(command, exception)
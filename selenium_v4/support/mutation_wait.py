@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Explicit waits woken by DOM mutations instead of a fixed polling interval.
+
+WebDriverWait evaluates its condition, sleeps poll_frequency, and repeats:
+a long wait costs one condition evaluation (one or more commands) per
+interval, and a change is noticed up to poll_frequency late. MutationWait
+re-evaluates the condition only when the page changed:
+
+    bidi      driver.script.add_dom_mutation_handler() (WebDriver BiDi) sets
+              an event in this process; the waiting thread wakes at once.
+    observer  a MutationObserver installed in the page; each wait is one
+              execute_async_script that returns on the next mutation (or
+              after long_poll seconds). Works on every classic session.
+    poll      plain WebDriverWait-style sleeping, the last resort.
+
+mode='auto' picks bidi when the session was created with enable_bidi,
+observer otherwise, and drops to poll for the rest of a wait if the
+observer script fails (e.g. a page that forbids script execution).
+poll_frequency stays the upper bound between two evaluations in every
+mode, so a change the events cannot see (a navigation, a window switch) is
+still noticed.
+
+Example:
+    wait = MutationWait(driver, timeout=10)
+    element = wait.until(EC.visibility_of_element_located((By.ID, 'revealed')))
+    print(wait.last_stats)
+
+    with MutationWait(driver, 10) as wait:  # keep the BiDi subscription across waits
+        wait.until(...)
+        wait.until(...)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+MODES = ('auto', 'bidi', 'observer', 'poll')
+MUTATION_TYPES = ('attributes', 'childList', 'characterData')
+
+# Resolves with [mutation count, woken by a mutation] as soon as the page's count
+# differs from arguments[0] (null: on the next mutation), or after arguments[1] ms.
+# The observer stays installed for later waits; a new document starts again at 0,
+# which also differs from the caller's last count.
+LONG_POLL_SCRIPT = """
+const seen = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+let state = window.__seMutationWait;
+if (!state) {
+  state = window.__seMutationWait = {count: 0, listeners: []};
+  new MutationObserver(function () {
+    state.count++;
+    const listeners = state.listeners;
+    state.listeners = [];
+    listeners.forEach(function (wake) { wake(); });
+  }).observe(document, {attributes: true, childList: true, characterData: true, subtree: true});
+}
+if (seen !== null && state.count !== seen) {
+  done([state.count, true]);
+  return;
+}
+function wake() {
+  clearTimeout(timer);
+  done([state.count, true]);
+}
+const timer = setTimeout(function () {
+  state.listeners = state.listeners.filter(function (listener) { return listener !== wake; });
+  done([state.count, false]);
+}, timeoutMs);
+state.listeners.push(wake);
+"""
+
+
+@dataclass
+class WaitStats:
+    """What one until() call cost; wakeups by mutation vs by poll_frequency expiring."""
+
+    mode: str
+    evaluations: int = 0
+    mutation_wakeups: int = 0
+    timer_wakeups: int = 0
+    seconds: float = 0.0
+
+
+class MutationWait:
+    """
+    WebDriverWait replacement that re-evaluates its condition on DOM mutations.
+
+    Args:
+        driver: the session to wait on.
+        timeout: seconds before TimeoutException.
+        poll_frequency: longest gap between two evaluations, whatever the mode.
+        ignored_exceptions: exceptions treated as "not yet", like WebDriverWait.
+        mode: 'auto', 'bidi', 'observer' or 'poll'; see the module docstring.
+        min_interval: shortest gap between two evaluations, so a page that
+            mutates continuously (animations, tickers) is not re-queried in
+            a tight loop.
+        long_poll: seconds one observer round trip may block; keep it below
+            the session's script timeout (30 s by default).
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout: float,
+        poll_frequency: float = 1.0,
+        ignored_exceptions: Iterable[type[Exception]] | None = None,
+        mode: str = 'auto',
+        min_interval: float = 0.02,
+        long_poll: float = 5.0,
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError(f'mode must be one of {MODES}, not {mode!r}')
+        self._driver = driver
+        self._timeout = float(timeout)
+        self._poll = poll_frequency
+        self._ignored = (NoSuchElementException, *(ignored_exceptions or ()))
+        self._mode = mode
+        self._min_interval = min_interval
+        self._long_poll = long_poll
+        self._changed = threading.Event()
+        self._handler_id: int | None = None
+        self._entered = False
+        self.last_stats: WaitStats | None = None
+
+    @property
+    def mode(self) -> str:
+        if self._mode != 'auto':
+            return self._mode
+        return 'bidi' if self._driver.capabilities.get('webSocketUrl') else 'observer'
+
+    # -- BiDi subscription -------------------------------------------------
+
+    def _on_mutation(self, _mutation: Any) -> None:
+        self._changed.set()
+
+    def _subscribe(self) -> None:
+        if self._handler_id is None:
+            self._handler_id = self._driver.script.add_dom_mutation_handler(self._on_mutation, MUTATION_TYPES)
+
+    def _unsubscribe(self) -> None:
+        if self._handler_id is not None:
+            handler_id, self._handler_id = self._handler_id, None
+            try:
+                self._driver.script.remove_dom_mutation_handler(handler_id)
+            except WebDriverException:
+                pass
+
+    def __enter__(self) -> MutationWait:
+        self._entered = True
+        if self.mode == 'bidi':
+            self._subscribe()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._entered = False
+        self._unsubscribe()
+
+    # -- waiting -----------------------------------------------------------
+
+    def until(self, method: Callable[[WebDriver], Any], message: str = '') -> Any:
+        """Return method(driver) once it is truthy; TimeoutException after timeout seconds."""
+        return self._wait(method, message, bool, ignored_satisfies=False)
+
+    def until_not(self, method: Callable[[WebDriver], Any], message: str = '') -> Any:
+        """Return once method(driver) is falsy; an ignored exception counts as falsy (returns True)."""
+        return self._wait(method, message, lambda value: not value, ignored_satisfies=True)
+
+    def _wait(self, method, message, satisfied, ignored_satisfies):
+        mode = self.mode
+        stats = self.last_stats = WaitStats(mode)
+        start = time.monotonic()
+        end = start + self._timeout
+        seen = None
+        screen = stacktrace = None
+
+        if mode == 'bidi':
+            self._subscribe()
+        try:
+            while True:
+                self._changed.clear()
+                evaluated_at = time.monotonic()
+                stats.evaluations += 1
+                try:
+                    value = method(self._driver)
+                    if satisfied(value):
+                        return value
+                except self._ignored as exc:
+                    if ignored_satisfies:
+                        return True
+                    screen = getattr(exc, 'screen', None)
+                    stacktrace = getattr(exc, 'stacktrace', None)
+
+                now = time.monotonic()
+                if now >= end:
+                    break
+                budget = min(end, evaluated_at + self._poll) - now
+
+                if mode == 'bidi':
+                    woke = self._changed.wait(budget)
+                elif mode == 'observer':
+                    try:
+                        seen, woke = self._driver.execute_async_script(
+                            LONG_POLL_SCRIPT, seen, int(min(budget, self._long_poll) * 1000)
+                        )
+                    except WebDriverException:
+                        # Unloaded document or script blocked: finish this wait by polling.
+                        mode = stats.mode = 'poll'
+                        woke = False
+                        time.sleep(max(0.0, min(end, evaluated_at + self._poll) - time.monotonic()))
+                else:
+                    woke = False
+                    time.sleep(budget)
+
+                if woke:
+                    stats.mutation_wakeups += 1
+                else:
+                    stats.timer_wakeups += 1
+                pause = evaluated_at + self._min_interval - time.monotonic()
+                if pause > 0:
+                    time.sleep(pause)
+        finally:
+            stats.seconds = time.monotonic() - start
+            if not self._entered:
+                self._unsubscribe()
+
+        raise TimeoutException(message, screen, stacktrace)
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+Batch printing of many pages to PDF across pooled sessions.
+
+The print_page_to_pdf() examples start a browser, print one page and hold
+the whole base64 payload and the decoded PDF in memory before writing it.
+print_batch() prints a list of URLs instead:
+
+    sessions   `workers` threads each lease one session from a pool of
+               `workers` sessions (private to the batch unless one is
+               passed) and print URLs off a shared queue until it is empty,
+               so a browser is launched once per worker, not once per page.
+    streaming  Chrome / Edge print through CDP Page.printToPDF with
+               transferMode=ReturnAsStream and read the PDF back with
+               IO.read in CHUNK_SIZE pieces: no full payload ever exists.
+               Elsewhere (or when CDP printing fails, e.g. a headed
+               browser) the W3C print_page() payload is decoded CHUNK_SIZE
+               characters at a time and dropped once written, so the
+               decoded bytes never sit in memory next to it.
+    pages      counted while streaming (/Type /Page objects), reported as
+               pages per second of wall time by BatchReport.
+
+A page that fails to load or print is recorded with its error and the
+batch goes on; a session that stopped answering is discarded and replaced.
+PDF files are written to a .part file and renamed when complete.
+
+Page counts rely on page objects being stored uncompressed, which is the
+case for Chrome, Edge and Firefox output; PDFs hiding them in compressed
+object streams count 0 pages.
+
+Example:
+    options = PrintOptions()
+    options.orientation = 'landscape'
+    report = print_batch(urls, options, 'output/pdf', workers=4)
+    print(report)
+
+    python -m selenium_v4.support.pdf_batch -j 4 -o output/pdf https://www.selenium.dev/ ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.print_page_options import PrintOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from selenium_v4.support.drivers import BROWSERS, new_driver
+from selenium_v4.support.fast_launch import fast_launch_options
+from selenium_v4.support.pool import SESSION_ERRORS, DriverPool, is_alive
+
+# Multiple of 4 (whole base64 quanta) and of 3 (whole decoded bytes).
+CHUNK_SIZE = 3 * 4 * 64 * 1024
+PAGE_PATTERN = re.compile(rb'/Type\s*/Page(?![A-Za-z0-9])')
+CM_PER_INCH = 2.54
+# W3C print defaults, in cm; CDP expects inches.
+DEFAULT_PAGE = {'width': 21.59, 'height': 27.94}
+DEFAULT_MARGIN = 1.0
+
+
+@dataclass
+class PrintedPdf:
+    """One URL of a batch: where it was written and what it cost."""
+
+    url: str
+    path: Path
+    pages: int = 0
+    size: int = 0
+    seconds: float = 0.0
+    error: str = ''
+
+
+@dataclass
+class BatchReport:
+    """print_batch() results in URL order."""
+
+    results: list[PrintedPdf] = field(default_factory=list)
+    elapsed: float = 0.0
+    workers: int = 0
+
+    @property
+    def pages(self) -> int:
+        return sum(result.pages for result in self.results)
+
+    @property
+    def failed(self) -> list[PrintedPdf]:
+        return [result for result in self.results if result.error]
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        size = sum(result.size for result in self.results)
+        return (
+            f'{len(self.results) - len(self.failed)}/{len(self.results)} PDF(s), {self.pages} page(s), '
+            f'{size / 1024:.0f} KiB in {self.elapsed:.2f}s with {self.workers} session(s): '
+            f'{self.pages_per_second:.1f} pages/s'
+        )
+
+
+class _PageCounter:
+    """Counts page objects in a PDF fed chunk by chunk, including matches split across chunks."""
+
+    KEEP = 64
+
+    def __init__(self) -> None:
+        self.pages = 0
+        self._tail = b''
+        self._counted = 0
+
+    def feed(self, chunk: bytes, final: bool = False) -> None:
+        buffer = self._tail + chunk
+        # Keep one byte of look-ahead: '/Type /Page' may continue as '/Type /Pages'.
+        limit = len(buffer) if final else len(buffer) - 1
+        self.pages += sum(
+            1 for match in PAGE_PATTERN.finditer(buffer) if self._counted < match.end() <= limit
+        )
+        self._tail = buffer[-self.KEEP:]
+        self._counted = max(0, limit - (len(buffer) - len(self._tail)))
+
+
+def _cdp_print_params(print_options: PrintOptions | None) -> dict:
+    settings = print_options.to_dict() if print_options else {}
+    page = {**DEFAULT_PAGE, **settings.get('page', {})}
+    margin = settings.get('margin', {})
+    params = {
+        'transferMode': 'ReturnAsStream',
+        'landscape': settings.get('orientation') == 'landscape',
+        'printBackground': settings.get('background', False),
+        'scale': settings.get('scale', 1.0),
+        'preferCSSPageSize': not settings.get('shrinkToFit', True),
+        'paperWidth': page['width'] / CM_PER_INCH,
+        'paperHeight': page['height'] / CM_PER_INCH,
+        'pageRanges': ','.join(str(pages) for pages in settings.get('pageRanges', [])),
+    }
+    for side in ('top', 'bottom', 'left', 'right'):
+        params[f'margin{side.title()}'] = margin.get(side, DEFAULT_MARGIN) / CM_PER_INCH
+    return params
+
+
+def _stream_cdp(driver: WebDriver, print_options: PrintOptions | None, handle, counter: _PageCounter) -> int:
+    stream = driver.execute_cdp_cmd('Page.printToPDF', _cdp_print_params(print_options))['stream']
+    size = 0
+    try:
+        while True:
+            chunk = driver.execute_cdp_cmd('IO.read', {'handle': stream, 'size': CHUNK_SIZE})
+            data = chunk.get('data', '')
+            data = base64.b64decode(data) if chunk.get('base64Encoded') else data.encode('latin-1')
+            handle.write(data)
+            counter.feed(data)
+            size += len(data)
+            if chunk.get('eof'):
+                return size
+    finally:
+        driver.execute_cdp_cmd('IO.close', {'handle': stream})
+
+
+def _stream_w3c(driver: WebDriver, print_options: PrintOptions | None, handle, counter: _PageCounter) -> int:
+    payload = driver.print_page(print_options)
+    size = 0
+    for start in range(0, len(payload), CHUNK_SIZE):
+        data = base64.b64decode(payload[start:start + CHUNK_SIZE])
+        handle.write(data)
+        counter.feed(data)
+        size += len(data)
+    return size
+
+
+def print_to_pdf(
+    driver: WebDriver,
+    path: str | Path,
+    print_options: PrintOptions | None = None,
+    stream: bool = True,
+    url: str | None = None,
+) -> PrintedPdf:
+    """
+    Print the current page of driver to path, streaming the PDF to disk.
+
+    stream=False skips CDP streaming and always uses the W3C print command.
+    url is only recorded in the result; it defaults to driver.current_url.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + '.part')
+    result = PrintedPdf(driver.current_url if url is None else url, path)
+    started = time.perf_counter()
+    writers = [_stream_w3c]
+    if stream and hasattr(driver, 'execute_cdp_cmd'):
+        writers.insert(0, _stream_cdp)
+    try:
+        for writer in writers:
+            counter = _PageCounter()
+            with open(partial, 'wb') as handle:
+                try:
+                    result.size = writer(driver, print_options, handle, counter)
+                except WebDriverException:
+                    # CDP printing is only available headless; print_page() reports the real error.
+                    if writer is writers[-1]:
+                        raise
+                    continue
+            counter.feed(b'', final=True)
+            result.pages = counter.pages
+            break
+        os.replace(partial, path)
+    finally:
+        if partial.exists():
+            partial.unlink()
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def pdf_name(index: int, url: str) -> str:
+    """File name of the index-th URL of a batch: 003-www.selenium.dev-documentation.pdf."""
+    parts = urlsplit(url)
+    slug = re.sub(r'[^A-Za-z0-9.]+', '-', f'{parts.netloc}{parts.path}').strip('-.')
+    return f'{index:03d}-{slug[:80] or "page"}.pdf'
+
+
+def print_batch(
+    urls: Iterable[str],
+    print_options: PrintOptions | None = None,
+    output_dir: str | Path = 'output/pdf',
+    browser: str = 'chrome',
+    options: ArgOptions | None = None,
+    workers: int = 2,
+    pool: DriverPool | None = None,
+    stream: bool = True,
+) -> BatchReport:
+    """
+    Print every URL to its own PDF in output_dir, spread over pooled sessions.
+
+    Args:
+        urls: pages to print; file names come from pdf_name().
+        print_options: the same PrintOptions for every page.
+        output_dir: created when missing.
+        browser: 'chrome', 'edge', 'firefox' or 'safari'.
+        options: browser options; defaults to the fast-launch switches
+            (headless, which Chrome / Edge printing needs).
+        workers: sessions printing concurrently.
+        pool: pool to lease from, at most pool.max_size sessions at a time;
+            defaults to a pool of `workers` sessions created for this batch
+            and closed when it ends.
+        stream: allow CDP streaming on Chrome / Edge (see print_to_pdf()).
+    """
+    if workers < 1:
+        raise ValueError('workers must be at least 1')
+    if browser not in BROWSERS:
+        raise ValueError(f'Unsupported browser {browser!r}; expected one of {sorted(BROWSERS)}')
+    urls = list(urls)
+    output_dir = Path(output_dir)
+    private = pool is None
+    if private:
+        options = options or fast_launch_options(browser)
+        # Sessions are quit when the batch ends: no reset on checkin.
+        pool = DriverPool(lambda: new_driver(browser, options), max_size=workers, reset=lambda driver: None)
+    jobs: queue.SimpleQueue = queue.SimpleQueue()
+    for index, url in enumerate(urls):
+        jobs.put(index)
+    report = BatchReport([PrintedPdf(url, output_dir / pdf_name(index, url)) for index, url in enumerate(urls)])
+    report.workers = min(workers, pool.max_size, len(urls))
+
+    def checkout() -> WebDriver | None:
+        try:
+            return pool.checkout()
+        except SESSION_ERRORS as exc:
+            # Other workers may still drain the queue; what is left is marked after join.
+            errors.append(getattr(exc, 'msg', None) or str(exc))
+            return None
+
+    def work() -> None:
+        driver = checkout()
+        try:
+            while driver is not None:
+                try:
+                    index = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                target = report.results[index]
+                started = time.perf_counter()
+                try:
+                    driver.get(target.url)
+                    report.results[index] = print_to_pdf(driver, target.path, print_options, stream, target.url)
+                except (*SESSION_ERRORS, ValueError) as exc:
+                    target.error = getattr(exc, 'msg', None) or str(exc) or type(exc).__name__
+                    target.seconds = time.perf_counter() - started
+                    if not is_alive(driver):
+                        pool.checkin(driver, discard=True)
+                        driver = checkout()
+        finally:
+            if driver is not None:
+                pool.checkin(driver)
+
+    errors: list[str] = []
+    started = time.perf_counter()
+    threads = [threading.Thread(target=work, name=f'pdf-batch-{n}', daemon=True) for n in range(report.workers)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        if private:
+            pool.close()
+    report.elapsed = time.perf_counter() - started
+    while not jobs.empty():
+        report.results[jobs.get_nowait()].error = f'no session available: {errors[0] if errors else "worker failed"}'
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Print many pages to PDF across pooled browser sessions.')
+    parser.add_argument('urls', nargs='+')
+    parser.add_argument('-j', '--workers', type=int, default=2, help='sessions printing concurrently')
+    parser.add_argument('-o', '--output', type=Path, default=Path('output/pdf'), help='output directory')
+    parser.add_argument('--browser', choices=sorted(BROWSERS), default='chrome')
+    parser.add_argument('--landscape', action='store_true')
+    parser.add_argument('--background', action='store_true', help='print background graphics')
+    args = parser.parse_args(argv)
+
+    print_options = PrintOptions()
+    print_options.orientation = 'landscape' if args.landscape else 'portrait'
+    print_options.background = args.background
+    report = print_batch(args.urls, print_options, args.output, args.browser, workers=args.workers)
+    for result in report.results:
+        status = f'error: {result.error}' if result.error else f'{result.pages} page(s), {result.seconds:.2f}s'
+        print(f'{result.path}  {result.url}  {status}')
+    print(report)
+    return 1 if report.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
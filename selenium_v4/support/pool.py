@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Driver pool shared by the example modules.
+
+Starting a browser is by far the most expensive step of every example: the
+driver binary has to be spawned, the browser launched and a new session
+negotiated. A DriverPool keeps a bounded number of live sessions per browser
+and options combination and hands them out to successive borrowers.
+
+Lifecycle of a pooled session:
+    - checkout(): reuse an idle session (after a health check) or start a new
+      one while the pool is below max_size, otherwise block until a session
+      is returned.
+    - checkin(): reset the session state (alerts, windows, cookies, storage,
+      cache, permissions) and park it as idle. Sessions that fail the reset
+      are discarded.
+    - reclaim(): check in every session still leased, e.g. after a borrower
+      failed before calling quit(); unhealthy ones are discarded.
+    - close(): really quit every session owned by the pool.
+
+While a session is leased its quit() method is rebound to checkin(), so the
+existing examples that end with driver.quit() return the browser to the pool
+without any change.
+
+Pools are registered per key in a process-wide registry (get_pool) and are
+closed automatically at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from urllib3.exceptions import HTTPError
+
+from selenium_v4.support.session_reset import reset_session
+
+# What a command on a broken session raises: a WebDriver error, or, once the
+# driver process is gone, urllib3's MaxRetryError / ProtocolError or an OSError.
+SESSION_ERRORS = (WebDriverException, HTTPError, OSError)
+
+
+def is_alive(driver: WebDriver) -> bool:
+    """Health check: a session is usable if it still answers a cheap command."""
+    try:
+        driver.current_window_handle  # pylint: disable=pointless-statement
+    except SESSION_ERRORS:
+        return False
+    return True
+
+
+def reset_driver(driver: WebDriver) -> None:
+    """
+    Bring a session back to a neutral state before the next borrower.
+
+    Dismisses alerts, replaces every window by one fresh tab and clears
+    cookies, storage, IndexedDB, cache and permissions (see
+    session_reset.reset_session()).
+    """
+    reset_session(driver)
+
+
+class PoolTimeout(WebDriverException):
+    """Raised when no session becomes available within the checkout timeout."""
+
+
+class DriverPool:
+    """
+    Bounded pool of live WebDriver sessions created by a single factory.
+
+    Args:
+        factory: callable returning a new WebDriver session.
+        max_size: maximum number of sessions alive at the same time.
+        health_check: callable deciding whether an idle session can be reused.
+        reset: callable clearing a session's state on checkin.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        max_size: int = 1,
+        health_check: Callable[[WebDriver], bool] = is_alive,
+        reset: Callable[[WebDriver], None] = reset_driver,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        self.factory = factory
+        self.max_size = max_size
+        self.health_check = health_check
+        self.reset = reset
+
+        self._idle: deque[WebDriver] = deque()
+        self._leased: dict[int, WebDriver] = {}
+        self._timeouts: dict[int, object] = {}
+        self._size = 0
+        self._closed = False
+        self._lock = threading.Condition()
+
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    # -- checkout / checkin ------------------------------------------------
+
+    def checkout(self, timeout: float | None = None) -> WebDriver:
+        """Lease a session, starting a new one only when no idle session is healthy."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise WebDriverException('DriverPool is closed')
+                driver = self._idle.popleft() if self._idle else None
+                if driver is None and self._size < self.max_size:
+                    self._size += 1
+                    create = True
+                elif driver is None:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise PoolTimeout(f'No driver available after {timeout}s')
+                    self._lock.wait(remaining)
+                    continue
+                else:
+                    create = False
+
+            if create:
+                try:
+                    driver = self.factory()
+                except BaseException:
+                    self._release_slot()
+                    raise
+                self.created += 1
+                # Borrowers may change implicit/page load/script timeouts; restored on checkin.
+                try:
+                    self._timeouts[id(driver)] = driver.timeouts
+                except SESSION_ERRORS:
+                    self._destroy(driver)
+                    raise
+            elif self.health_check(driver):
+                self.reused += 1
+            else:
+                self._destroy(driver)
+                continue
+
+            return self._lease(driver)
+
+    def checkin(self, driver: WebDriver, discard: bool = False) -> None:
+        """Return a leased session; it is reset and parked, or quit when unusable."""
+        with self._lock:
+            if self._leased.pop(id(driver), None) is None:
+                return
+        driver.__dict__.pop('quit', None)
+
+        if not discard and not self._closed:
+            try:
+                driver.timeouts = self._timeouts[id(driver)]
+                self.reset(driver)
+            except SESSION_ERRORS:
+                discard = True
+
+        if discard or self._closed:
+            self._destroy(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+            self._lock.notify()
+
+    @contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[WebDriver]:
+        """Context manager form of checkout()/checkin()."""
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def reclaim(self) -> int:
+        """Check in every leased session (discarding the unhealthy ones); returns how many were leased."""
+        with self._lock:
+            leased = list(self._leased.values())
+        for driver in leased:
+            self.checkin(driver, discard=not self.health_check(driver))
+        return len(leased)
+
+    def close(self) -> None:
+        """Quit every idle session; leased sessions are quit when checked in."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._lock.notify_all()
+        for driver in idle:
+            self._destroy(driver)
+
+    # -- internals ---------------------------------------------------------
+
+    def _lease(self, driver: WebDriver) -> WebDriver:
+        with self._lock:
+            self._leased[id(driver)] = driver
+        # Examples end with driver.quit(); while leased that returns the session.
+        driver.quit = functools.partial(self.checkin, driver)
+        return driver
+
+    def _destroy(self, driver: WebDriver) -> None:
+        self.discarded += 1
+        self._timeouts.pop(id(driver), None)
+        try:
+            type(driver).quit(driver)
+        except SESSION_ERRORS:
+            pass
+        finally:
+            self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._size -= 1
+            self._lock.notify()
+
+    def __repr__(self) -> str:
+        return (
+            f'DriverPool(size={self._size}/{self.max_size}, idle={len(self._idle)}, '
+            f'created={self.created}, reused={self.reused}, discarded={self.discarded})'
+        )
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registry
+# ---------------------------------------------------------------------------
+
+_POOLS: dict[Hashable, DriverPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(key: Hashable, factory: Callable[[], WebDriver], max_size: int = 1) -> DriverPool:
+    """Return the pool registered for key, creating it with factory on first use."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = DriverPool(factory, max_size=max_size)
+        return pool
+
+
+def reclaim_all_pools() -> int:
+    """reclaim() every pool of this process; returns how many sessions were still leased."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    return sum(pool.reclaim() for pool in pools)
+
+
+def close_all_pools() -> None:
+    """Quit every pooled session of this process."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
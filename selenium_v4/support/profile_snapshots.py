@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+"""
+Warmed browser profiles prepared once and cloned per session.
+
+A session started from an empty profile pays for first-run work every
+time: Chrome creates and migrates its Preferences, Local State and
+databases, Firefox builds a new profile (times.json, compatibility.ini,
+startup cache) and Selenium zips and uploads the FirefoxProfile; add-ons are
+installed (or unpacked, for Chrome's add_extension()) again and the HTTP
+cache starts cold. ProfileSnapshot does that once:
+
+    prepare()   launch the browser on a new profile directory with the
+                preferences, extensions and arguments of a SnapshotSpec,
+                open the warm-up URLs (HTTP cache, HSTS, service workers),
+                quit cleanly, drop lock files and publish the directory
+                under SNAPSHOT_DIR/<name>-<fingerprint>/. A later prepare()
+                with the same spec (in any process) reuses it.
+    clone()     copy the snapshot into a fresh directory for one session:
+                files that browsers never modify in place (unpacked
+                extensions, .xpi files, versioned component data) are
+                hard-linked, every other file is reflinked (copy-on-write,
+                FICLONE on Btrfs / XFS / bcachefs) or copied when the file
+                system cannot. A session therefore never writes into the
+                snapshot.
+    options()   options starting the browser on a clone: Chrome / Edge
+                --user-data-dir (and --load-extension for the snapshot's
+                unpacked extensions), Firefox -profile, which geckodriver
+                uses in place instead of copying.
+    session()   clone, start a session, quit, delete the clone.
+
+Clones live in SNAPSHOT_DIR/clones so that hard links and reflinks stay on
+the snapshot's file system. Safari has no profile directory to snapshot.
+
+Environment:
+    SELENIUM_EXAMPLES_PROFILE_SNAPSHOTS   snapshot directory (default ~/.cache/selenium-examples/profiles)
+
+Example:
+    snapshot = ProfileSnapshot('docs', SnapshotSpec('firefox', prefs={'intl.accept_languages': 'en-US'}))
+    snapshot.prepare()
+    with snapshot.session() as driver:
+        driver.get(url)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import errno
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from selenium_v4.support.drivers import BROWSERS, build_driver, new_driver
+
+try:
+    import fcntl
+except ImportError:  # Windows: no reflinks, clones copy instead
+    fcntl = None
+
+SNAPSHOT_DIR = Path(
+    os.getenv('SELENIUM_EXAMPLES_PROFILE_SNAPSHOTS', Path.home() / '.cache' / 'selenium-examples' / 'profiles')
+)
+MANIFEST = 'snapshot.json'
+# Unpacked Chrome / Edge extensions inside the snapshot, loaded with --load-extension.
+EXTENSIONS_DIR = 'se-extensions'
+
+CHROMIUM_BROWSERS = ('chrome', 'edge')
+# Left behind by a running (or crashed) browser; a clone must not start "in use".
+LOCK_FILES = ('SingletonLock', 'SingletonSocket', 'SingletonCookie', 'DevToolsActivePort', 'lock', '.parentlock', 'parent.lock')
+# Relative paths whose files are written once and replaced, never modified in place: safe to hard-link.
+LINK_PATTERNS = (
+    f'{EXTENSIONS_DIR}/*',
+    'Default/Extensions/*',
+    'WidevineCdm/*',
+    'hyphen-data/*',
+    'ZxcvbnData/*',
+    'extensions/*.xpi',
+)
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+# errno values meaning "this file system (pair) cannot reflink".
+NO_REFLINK = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS}
+
+
+@dataclass
+class SnapshotSpec:
+    """
+    What a snapshot contains.
+
+    Args:
+        browser: 'chrome', 'edge' or 'firefox'.
+        prefs: Chrome preferences (written to Default/Preferences by
+            chromedriver) or Firefox about:config preferences (user.js).
+        extensions: Chrome / Edge .crx or .zip files or unpacked directories,
+            unpacked into the snapshot; Firefox .xpi files installed
+            permanently, so they must be signed for release builds.
+        warm_urls: pages opened before the snapshot is taken.
+        arguments: browser arguments used while preparing.
+    """
+
+    browser: str
+    prefs: dict[str, object] = field(default_factory=dict)
+    extensions: tuple[str, ...] = ()
+    warm_urls: tuple[str, ...] = ()
+    arguments: tuple[str, ...] = ()
+
+    def fingerprint(self) -> str:
+        """Short hash of the spec; extension files count by path, size and modification time."""
+        payload = asdict(self)
+        payload['extensions'] = [_file_signature(Path(path)) for path in self.extensions]
+        text = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _file_signature(path: Path) -> list:
+    if path.is_dir():
+        return [str(path), sorted(_file_signature(child) for child in path.rglob('*') if child.is_file())]
+    stat = path.stat()
+    return [str(path), stat.st_size, stat.st_mtime_ns]
+
+
+@dataclass
+class ProfileClone:
+    """One per-session copy of a snapshot and how it was made."""
+
+    path: Path
+    linked: int = 0
+    reflinked: int = 0
+    copied: int = 0
+    bytes_copied: int = 0
+    seconds: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f'{self.path}: {self.linked} linked, {self.reflinked} reflinked, {self.copied} copied '
+            f'({self.bytes_copied / 1024:.0f} KiB) in {self.seconds * 1000:.0f} ms'
+        )
+
+
+class ProfileSnapshot:
+    """
+    A named, warmed profile shared by every session that asks for the same spec.
+
+    Args:
+        name: snapshot name; the directory is <root>/<name>-<fingerprint>.
+        spec: browser, preferences, extensions and warm-up URLs.
+        root: snapshot directory, SNAPSHOT_DIR by default.
+    """
+
+    def __init__(self, name: str, spec: SnapshotSpec, root: str | Path | None = None) -> None:
+        if spec.browser not in CHROMIUM_BROWSERS and spec.browser != 'firefox':
+            raise ValueError(f'Cannot snapshot {spec.browser!r} profiles; expected chrome, edge or firefox')
+        self.name = name
+        self.spec = spec
+        self.root = Path(root) if root is not None else SNAPSHOT_DIR
+        self.path = self.root / f'{name}-{spec.fingerprint()}'
+        self._lock = threading.Lock()
+        self._reflink = fcntl is not None
+
+    @property
+    def ready(self) -> bool:
+        return (self.path / MANIFEST).is_file()
+
+    def manifest(self) -> dict:
+        return json.loads((self.path / MANIFEST).read_text(encoding='utf-8'))
+
+    def prepare(self, force: bool = False) -> Path:
+        """Build the snapshot unless it already exists (force rebuilds it); returns its directory."""
+        with self._lock:
+            if self.ready and not force:
+                return self.path
+            self.root.mkdir(parents=True, exist_ok=True)
+            build = Path(tempfile.mkdtemp(prefix=f'.{self.name}-build-', dir=self.root))
+            try:
+                started = time.perf_counter()
+                self._populate(build)
+                manifest = {
+                    'name': self.name,
+                    'fingerprint': self.spec.fingerprint(),
+                    'spec': asdict(self.spec),
+                    'prepared_at': time.time(),
+                    'prepare_seconds': time.perf_counter() - started,
+                }
+                (build / MANIFEST).write_text(json.dumps(manifest, indent=2) + '\n', encoding='utf-8')
+                if force:
+                    shutil.rmtree(self.path, ignore_errors=True)
+                try:
+                    os.replace(build, self.path)
+                except OSError:
+                    # Another process published the same snapshot first; theirs is as good as ours.
+                    if not self.ready:
+                        raise
+            finally:
+                shutil.rmtree(build, ignore_errors=True)
+            self._prune()
+            return self.path
+
+    def _populate(self, profile: Path) -> None:
+        options = BROWSERS[self.spec.browser][1]()
+        for argument in self.spec.arguments:
+            options.add_argument(argument)
+
+        if self.spec.browser == 'firefox':
+            # geckodriver restores user.js after the session, so preferences go in before launch.
+            lines = [f'user_pref({json.dumps(name)}, {json.dumps(value)});' for name, value in self.spec.prefs.items()]
+            (profile / 'user.js').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+            options.add_argument('-profile')
+            options.add_argument(str(profile))
+        else:
+            if self.spec.prefs:
+                options.add_experimental_option('prefs', dict(self.spec.prefs))
+            unpacked = [self._unpack_extension(Path(path), profile / EXTENSIONS_DIR) for path in self.spec.extensions]
+            options.add_argument(f'--user-data-dir={profile}')
+            if unpacked:
+                options.add_argument('--load-extension=' + ','.join(map(str, unpacked)))
+
+        driver = new_driver(self.spec.browser, options)
+        try:
+            if self.spec.browser == 'firefox':
+                for path in self.spec.extensions:
+                    driver.install_addon(str(Path(path).resolve()))
+            for url in self.spec.warm_urls:
+                driver.get(url)
+        finally:
+            driver.quit()
+        for name in LOCK_FILES:
+            with contextlib.suppress(FileNotFoundError):
+                (profile / name).unlink()
+
+    @staticmethod
+    def _unpack_extension(source: Path, target_dir: Path) -> Path:
+        target = target_dir / source.stem
+        if source.is_dir():
+            shutil.copytree(source, target)
+        else:
+            # .crx files are zip archives behind a header, which zipfile skips.
+            with zipfile.ZipFile(source) as archive:
+                archive.extractall(target)
+        return target
+
+    def _prune(self) -> None:
+        """Remove snapshots of this name built from an older spec."""
+        for old in self.root.glob(f'{self.name}-' + '?' * 16):
+            if old != self.path and (old / MANIFEST).is_file():
+                shutil.rmtree(old, ignore_errors=True)
+
+    def clone(self, dest: str | Path | None = None) -> ProfileClone:
+        """Copy the prepared snapshot into dest (a new directory under <root>/clones by default)."""
+        if not self.ready:
+            raise FileNotFoundError(f'Snapshot {self.path} is not prepared; call prepare() first')
+        if dest is None:
+            clones = self.root / 'clones'
+            clones.mkdir(parents=True, exist_ok=True)
+            dest = tempfile.mkdtemp(prefix=f'{self.name}-', dir=clones)
+        result = ProfileClone(Path(dest))
+        started = time.perf_counter()
+        for directory, dirnames, filenames in os.walk(self.path):
+            source_dir = Path(directory)
+            relative = source_dir.relative_to(self.path)
+            target_dir = result.path / relative
+            target_dir.mkdir(parents=True, exist_ok=True)
+            for filename in filenames:
+                if relative == Path('.') and filename == MANIFEST:
+                    continue
+                self._clone_file(source_dir / filename, target_dir / filename, (relative / filename).as_posix(), result)
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def _clone_file(self, source: Path, target: Path, relative: str, result: ProfileClone) -> None:
+        if any(fnmatch.fnmatch(relative, pattern) for pattern in LINK_PATTERNS):
+            try:
+                os.link(source, target)
+                result.linked += 1
+                return
+            except OSError:
+                pass
+        if self._reflink and self._reflink_file(source, target):
+            result.reflinked += 1
+            return
+        shutil.copy2(source, target)
+        result.copied += 1
+        result.bytes_copied += target.stat().st_size
+
+    def _reflink_file(self, source: Path, target: Path) -> bool:
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            except OSError as exc:
+                if exc.errno not in NO_REFLINK:
+                    raise
+                # Not supported here: stop trying for this snapshot.
+                self._reflink = False
+                return False
+        shutil.copystat(source, target)
+        return True
+
+    def discard(self, clone: ProfileClone | str | Path) -> None:
+        """Delete a clone; the browser using it must have quit."""
+        shutil.rmtree(clone.path if isinstance(clone, ProfileClone) else clone, ignore_errors=True)
+
+    def options(self, clone: ProfileClone | str | Path, options: ArgOptions | None = None) -> ArgOptions:
+        """Return a copy of options (new ones when None) that starts the browser on the clone."""
+        path = Path(clone.path if isinstance(clone, ProfileClone) else clone).resolve()
+        options = copy.deepcopy(options) if options is not None else BROWSERS[self.spec.browser][1]()
+        if self.spec.browser == 'firefox':
+            options.add_argument('-profile')
+            options.add_argument(str(path))
+            return options
+        options.add_argument(f'--user-data-dir={path}')
+        extensions = sorted((path / EXTENSIONS_DIR).glob('*'))
+        if extensions:
+            options.add_argument('--load-extension=' + ','.join(map(str, extensions)))
+        return options
+
+    @contextlib.contextmanager
+    def session(self, options: ArgOptions | None = None) -> Iterator[WebDriver]:
+        """
+        Yield a driver started on a fresh clone; quits it and deletes the clone afterwards.
+
+        Sessions are never pooled (a pooled browser would outlive its clone).
+        """
+        self.prepare()
+        clone = self.clone()
+        try:
+            driver = build_driver(self.spec.browser, self.options(clone, options), pooled=False)
+            try:
+                yield driver
+            finally:
+                driver.quit()
+        finally:
+            self.discard(clone)
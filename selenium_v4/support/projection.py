@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Locate elements and project their fields in the page, one round trip per call.
+
+Looping over find_elements() and reading get_attribute() per element costs
+1 + N * F WebDriver commands. project() runs the locator and reads the
+requested fields inside a single execute_script, so the whole collection
+comes back as a list of dicts in one response.
+
+For pages with tens of thousands of matches, iter_project_chunks() and
+iter_project() keep the located nodes in the page (window.__seProjection)
+and fetch them chunk_size rows at a time, so neither the driver response
+nor the Python side holds the whole collection at once. The first chunk is
+returned by the locating call itself; the stash is deleted when the
+iterator is exhausted or closed.
+
+Fields use the element_info grammar (displayed, text, attribute:<name>,
+property:<name>, ...). Locators are evaluated with DOM APIs the way the
+driver does:
+    - ID, NAME, CLASS_NAME, TAG_NAME are rewritten to CSS selectors, as
+      WebDriver.find_elements() does before sending the command.
+    - XPATH uses document.evaluate(); non-element results are skipped.
+    - LINK_TEXT / PARTIAL_LINK_TEXT compare against the trimmed innerText
+      of <a> elements.
+
+Example:
+    rows = project(driver, By.TAG_NAME, 'input', ['attribute:type', 'attribute:name'])
+    for row in iter_project(driver, By.CSS_SELECTOR, 'tr', ['text'], chunk_size=2000):
+        ...
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Iterator
+
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from selenium_v4.support.element_info import READ_FIELD_JS, parse_field
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Defines locate(by, value, root) and row(el, fields, withElement).
+LOCATE_JS = """
+function locate(by, value, root) {
+  const scope = root || document;
+  switch (by) {
+    case 'css selector': return Array.from(scope.querySelectorAll(value));
+    case 'xpath': {
+      const snapshot = document.evaluate(value, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      const nodes = [];
+      for (let i = 0; i < snapshot.snapshotLength; i++) {
+        const node = snapshot.snapshotItem(i);
+        if (node.nodeType === Node.ELEMENT_NODE) nodes.push(node);
+      }
+      return nodes;
+    }
+    case 'link text':
+    case 'partial link text':
+      return Array.from(scope.querySelectorAll('a')).filter(function (a) {
+        const text = (a.innerText === undefined ? a.textContent : a.innerText).trim();
+        return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+      });
+  }
+  throw new Error('Unsupported locator strategy: ' + by);
+}
+
+function row(el, fields, withElement) {
+  const values = fields.map(function (field) { return read(el, field[0], field[1]); });
+  if (withElement) values.push(el);
+  return values;
+}
+"""
+
+PROJECT_SCRIPT = READ_FIELD_JS + LOCATE_JS + """
+const nodes = locate(arguments[0], arguments[1], arguments[2]);
+const fields = arguments[3];
+const withElements = arguments[4];
+return nodes.map(function (el) { return row(el, fields, withElements); });
+"""
+
+START_SCRIPT = READ_FIELD_JS + LOCATE_JS + """
+const nodes = locate(arguments[0], arguments[1], arguments[2]);
+const fields = arguments[3];
+const withElements = arguments[4];
+const size = arguments[6];
+window.__seProjection = window.__seProjection || {};
+window.__seProjection[arguments[5]] = nodes;
+return [nodes.length, nodes.slice(0, size).map(function (el) { return row(el, fields, withElements); })];
+"""
+
+FETCH_SCRIPT = READ_FIELD_JS + LOCATE_JS + """
+const nodes = window.__seProjection && window.__seProjection[arguments[0]];
+if (!nodes) return null;
+const fields = arguments[1];
+const withElements = arguments[2];
+return nodes.slice(arguments[3], arguments[3] + arguments[4]).map(function (el) {
+  return row(el, fields, withElements);
+});
+"""
+
+RELEASE_SCRIPT = """
+if (window.__seProjection) delete window.__seProjection[arguments[0]];
+"""
+
+
+def dom_locator(by: str, value: str) -> tuple[str, str]:
+    """Rewrite (by, value) into a strategy locate() handles natively, like WebDriver.find_elements() does."""
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f'.{value}'
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    if by in (By.CSS_SELECTOR, By.XPATH, By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        return by, value
+    raise ValueError(f'Unsupported locator strategy for in-page lookup: {by!r}')
+
+
+def _to_dicts(fields: list[str], rows: list[list], with_elements: bool) -> list[dict]:
+    if not with_elements:
+        return [dict(zip(fields, row)) for row in rows]
+    return [{**dict(zip(fields, row[:-1])), 'element': row[-1]} for row in rows]
+
+
+def project(
+    driver: WebDriver,
+    by: str,
+    value: str,
+    fields: Iterable[str],
+    root: WebElement | None = None,
+    with_elements: bool = False,
+) -> list[dict]:
+    """
+    Locate every match of (by, value) and return the requested fields, in one execute_script.
+
+    Args:
+        driver: the session to query.
+        by, value: the locator, as for find_elements().
+        fields: field names, see support/element_info.py.
+        root: search only inside this element, like element.find_elements().
+        with_elements: also return each WebElement under the 'element' key.
+
+    Returns:
+        One dict per match, in document order; empty when nothing matches.
+    """
+    fields = list(fields)
+    parsed = [parse_field(field) for field in fields]
+    by, value = dom_locator(by, value)
+    rows = driver.execute_script(PROJECT_SCRIPT, by, value, root, parsed, with_elements)
+    return _to_dicts(fields, rows, with_elements)
+
+
+def iter_project_chunks(
+    driver: WebDriver,
+    by: str,
+    value: str,
+    fields: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    root: WebElement | None = None,
+    with_elements: bool = False,
+) -> Iterator[list[dict]]:
+    """
+    Chunked form of project(): yields lists of at most chunk_size dicts.
+
+    The matches are located once, when the first chunk is requested; later
+    chunks are sliced from that snapshot. Navigating away in between drops
+    the snapshot and raises StaleElementReferenceException.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    fields = list(fields)
+    parsed = [parse_field(field) for field in fields]
+    by, value = dom_locator(by, value)
+    token = uuid.uuid4().hex
+
+    total, rows = driver.execute_script(START_SCRIPT, by, value, root, parsed, with_elements, token, chunk_size)
+    try:
+        if rows:
+            yield _to_dicts(fields, rows, with_elements)
+        for start in range(chunk_size, total, chunk_size):
+            rows = driver.execute_script(FETCH_SCRIPT, token, parsed, with_elements, start, chunk_size)
+            if rows is None:
+                raise StaleElementReferenceException('Projection snapshot is gone; the page was reloaded or left')
+            yield _to_dicts(fields, rows, with_elements)
+    finally:
+        try:
+            driver.execute_script(RELEASE_SCRIPT, token)
+        except WebDriverException:
+            pass
+
+
+def iter_project(
+    driver: WebDriver,
+    by: str,
+    value: str,
+    fields: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    root: WebElement | None = None,
+    with_elements: bool = False,
+) -> Iterator[dict]:
+    """Row-by-row form of iter_project_chunks(); one round trip per chunk_size rows."""
+    for chunk in iter_project_chunks(driver, by, value, fields, chunk_size, root, with_elements):
+        yield from chunk
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel runner for the example modules.
+
+Every module ends with an ``if __name__ == '__main__':`` block that calls a
+few example functions one after another, each one paying a full browser
+lifecycle. The runner discovers those functions and fans them out over a
+process pool instead. Each worker process enables the driver pool with one
+session per browser configuration (browser name plus options), so a worker
+launches a browser the first time it meets a configuration and every later
+function asking for the same one reuses it; a worker keeps one live browser
+per distinct configuration it has run. A session a failed function left
+leased is reclaimed after the function, so the next one does not wait on it.
+
+Discovery is static (ast), so modules are only imported inside workers:
+    - default: the functions called from each module's __main__ block.
+    - --all: every public top-level function that takes no required argument.
+
+Usage (from the repository root):
+    python -m selenium_v4.support.runner -j 4
+    python -m selenium_v4.support.runner -j 4 selenium_v4/interactions selenium_v4/actions/mouse.py
+    python -m selenium_v4.support.runner --all --json output/runner.json
+
+The report lists every function with its duration, then the summed function
+time (what a serial run costs), the wall time and the resulting speed-up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing.util
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+PACKAGE_DIR = REPO_ROOT / 'selenium_v4'
+EXCLUDED_DIRS = {'support', 'benchmarks'}
+
+
+@dataclass(frozen=True)
+class ExampleTask:
+    """One example function, addressed by its importable module name."""
+
+    module: str
+    function: str
+
+    @property
+    def name(self) -> str:
+        return f'{self.module}.{self.function}'
+
+
+@dataclass
+class ExampleResult:
+    """Outcome of one example function run inside a worker."""
+
+    module: str
+    function: str
+    seconds: float
+    ok: bool
+    worker: int
+    output: str = ''
+    error: str = ''
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+
+def _module_name(path: Path) -> str:
+    return '.'.join(path.resolve().relative_to(REPO_ROOT).with_suffix('').parts)
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == '__name__'
+    )
+
+
+def _takes_no_arguments(func: ast.FunctionDef) -> bool:
+    args = func.args
+    required_positional = len(args.posonlyargs) + len(args.args) - len(args.defaults)
+    required_keyword = sum(default is None for default in args.kw_defaults)
+    return required_positional == 0 and required_keyword == 0
+
+
+def discover_module(path: Path, include_all: bool = False) -> list[ExampleTask]:
+    """Return the example functions of one module file."""
+    tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+    functions = {
+        node.name: node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and not node.name.startswith('_')
+    }
+
+    if include_all:
+        names = [name for name, node in functions.items() if _takes_no_arguments(node)]
+    else:
+        names = []
+        for node in filter(_is_main_guard, tree.body):
+            for call in ast.walk(node):
+                if (
+                    isinstance(call, ast.Call)
+                    and isinstance(call.func, ast.Name)
+                    and call.func.id in functions
+                    and not call.args
+                    and not call.keywords
+                    and call.func.id not in names
+                ):
+                    names.append(call.func.id)
+
+    module = _module_name(path)
+    return [ExampleTask(module, name) for name in names]
+
+
+def discover(paths: list[Path] | None = None, include_all: bool = False) -> list[ExampleTask]:
+    """Discover example functions under the given files/directories (default: selenium_v4/)."""
+    files: list[Path] = []
+    for path in paths or [PACKAGE_DIR]:
+        path = path.resolve()
+        files.extend(sorted(path.rglob('*.py')) if path.is_dir() else [path])
+
+    tasks = []
+    for file in files:
+        if file.name == '__init__.py' or EXCLUDED_DIRS.intersection(file.relative_to(REPO_ROOT).parts):
+            continue
+        tasks.extend(discover_module(file, include_all))
+    return tasks
+
+
+# ---------------------------------------------------------------------------
+# Workers
+# ---------------------------------------------------------------------------
+
+def _init_worker() -> None:
+    """Enable pooling in this worker and quit its browsers when the worker exits."""
+    os.environ['SELENIUM_EXAMPLES_POOL'] = '1'
+    os.environ['SELENIUM_EXAMPLES_POOL_SIZE'] = '1'
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    from selenium_v4.support import drivers  # pylint: disable=import-outside-toplevel
+    from selenium_v4.support.pool import close_all_pools  # pylint: disable=import-outside-toplevel
+
+    drivers.POOL_ENABLED = True
+    drivers.POOL_SIZE = 1
+    # atexit does not run in pool workers; multiprocessing finalizers do.
+    multiprocessing.util.Finalize(None, close_all_pools, exitpriority=10)
+
+
+def run_task(task: ExampleTask) -> ExampleResult:
+    """Import the task's module, run the function and time it; then reclaim sessions it still holds."""
+    from selenium_v4.support.pool import reclaim_all_pools  # pylint: disable=import-outside-toplevel
+
+    output = io.StringIO()
+    error = ''
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            getattr(importlib.import_module(task.module), task.function)()
+        ok = True
+    except Exception:  # pylint: disable=broad-except
+        ok = False
+        error = traceback.format_exc()
+    finally:
+        # A function that raised before driver.quit() would otherwise block the worker's next checkout.
+        reclaim_all_pools()
+    seconds = time.perf_counter() - start
+    return ExampleResult(task.module, task.function, seconds, ok, os.getpid(), output.getvalue(), error)
+
+
+def run(tasks: list[ExampleTask], workers: int, verbose: bool = False) -> tuple[list[ExampleResult], float]:
+    """Run tasks across a process pool; returns the results and the wall time."""
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(run_task, task): task for task in tasks}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            status = 'ok  ' if result.ok else 'FAIL'
+            print(f'[{status}] {result.seconds:8.2f}s  {result.module}.{result.function}', flush=True)
+            if verbose and result.output:
+                print(result.output.rstrip())
+            if not result.ok:
+                print(result.error.rstrip())
+    return results, time.perf_counter() - start
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+def print_report(results: list[ExampleResult], wall: float, workers: int) -> None:
+    """Print per-function timing, slowest first, and the overall speed-up."""
+    serial = sum(r.seconds for r in results)
+    failed = [r for r in results if not r.ok]
+
+    print()
+    print(f'{"seconds":>9}  function')
+    for result in sorted(results, key=lambda r: r.seconds, reverse=True):
+        marker = '' if result.ok else '  (failed)'
+        print(f'{result.seconds:9.2f}  {result.module}.{result.function}{marker}')
+    print()
+    print(f'functions: {len(results)}  failed: {len(failed)}  workers: {workers}')
+    print(f'summed function time: {serial:.2f}s  wall time: {wall:.2f}s  speed-up: {serial / wall if wall else 0:.2f}x')
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1], formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument('paths', nargs='*', type=Path, help='files or directories to scan (default: selenium_v4/)')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1, help='worker processes, one browser each')
+    parser.add_argument('--all', action='store_true', help='run every zero-argument public function, not only __main__ calls')
+    parser.add_argument('-k', '--filter', default='', help='only run functions whose module.function contains this text')
+    parser.add_argument('--list', action='store_true', help='print the discovered functions and exit')
+    parser.add_argument('--json', type=Path, help='write per-function results to this JSON file')
+    parser.add_argument('-v', '--verbose', action='store_true', help='print the captured output of every function')
+    args = parser.parse_args(argv)
+
+    tasks = [task for task in discover(args.paths, args.all) if args.filter in task.name]
+    if args.list:
+        for task in tasks:
+            print(task.name)
+        return 0
+    if not tasks:
+        print('No example functions found.')
+        return 0
+
+    workers = max(1, min(args.workers, len(tasks)))
+    results, wall = run(tasks, workers, args.verbose)
+    print_report(results, wall, workers)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        payload = {'workers': workers, 'wall_seconds': wall, 'results': [asdict(r) for r in results]}
+        args.json.write_text(json.dumps(payload, indent=2), encoding='utf-8')
+        print(f'Results written to {args.json}')
+
+    return 1 if any(not r.ok for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
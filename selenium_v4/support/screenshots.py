@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+Screenshot service: decoding and storage off the driver thread, duplicates and deltas not stored twice.
+
+driver.save_screenshot() and element.screenshot() decode the base64 reply
+and write a full PNG on the calling thread, once per call, even when the
+frame is identical to the previous one. ScreenshotService splits the work:
+
+    driver thread   only the WebDriver command: get_screenshot_as_base64()
+                    (element.screenshot_as_base64, or Firefox's full-page
+                    variant); capture() returns a Future at once
+    worker pool     base64 decode, SHA-256, storage
+
+Storage is content-addressed under <directory>/blobs/, so an identical
+frame (same hash, in this run or an earlier one) costs no write at all.
+With delta=True the first capture of a name becomes its baseline and later
+captures of that name are stored as the PNG scanlines that differ from
+it: both images are inflated with zlib and compared row by row (the
+filtered rows, a C-level bytes comparison, no per-pixel Python work). A
+delta stores the changed rows compressed; load() splices them into the
+baseline and deflates again, which gives a PNG with exactly the captured
+pixels. Captures whose size or format differs from the baseline, and
+ones where more than max_delta_ratio of the rows changed, are stored whole.
+
+index.jsonl records every capture (name, hash, kind, bytes written);
+baselines.json keeps the baselines across runs.
+
+Example:
+    with ScreenshotService(OUTPUT_DIR / 'screenshots', delta=True) as shots:
+        shots.capture(driver, 'home')
+        shots.capture(driver, 'heading', element=heading)
+    print(shots.stats)
+    shots.export('home', OUTPUT_DIR / 'home.png')
+"""
+
+from __future__ import annotations
+
+import base64
+import functools
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+DELTA_MAGIC = b'SEDELTA1\n'
+# Samples per pixel of each PNG colour type.
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+MAX_DELTA_RATIO = 0.5
+
+
+class NotDeltaEncodable(ValueError):
+    """The PNG (interlaced, or different from its baseline) cannot be stored as a row delta."""
+
+
+def _chunks(png: bytes) -> list[tuple[bytes, bytes]]:
+    if not png.startswith(PNG_SIGNATURE):
+        raise ValueError('Not a PNG image')
+    chunks, offset = [], len(PNG_SIGNATURE)
+    while offset < len(png):
+        length, kind = struct.unpack('>I4s', png[offset:offset + 8])
+        chunks.append((kind, png[offset + 8:offset + 8 + length]))
+        offset += 12 + length
+    return chunks
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def _scanlines(png: bytes) -> tuple[bytes, list[bytes]]:
+    """IHDR payload and the filtered scanlines (filter byte included) of a non-interlaced PNG."""
+    chunks = _chunks(png)
+    header = chunks[0][1]
+    width, height, depth, colour, _, _, interlace = struct.unpack('>IIBBBBB', header)
+    if interlace:
+        raise NotDeltaEncodable('Interlaced PNGs are stored whole')
+    row = 1 + (width * CHANNELS[colour] * depth + 7) // 8
+    data = zlib.decompress(b''.join(payload for kind, payload in chunks if kind == b'IDAT'))
+    return header, [data[i * row:(i + 1) * row] for i in range(height)]
+
+
+def encode_delta(png: bytes, baseline: bytes, baseline_sha: str, max_ratio: float = MAX_DELTA_RATIO) -> bytes:
+    """Rows of png that differ from baseline, as a compact delta; raises NotDeltaEncodable when not worth it."""
+    header, rows = _scanlines(png)
+    base_header, base_rows = _scanlines(baseline)
+    if header != base_header:
+        raise NotDeltaEncodable('Size or format differs from the baseline')
+    changed = [index for index, (row, base) in enumerate(zip(rows, base_rows)) if row != base]
+    if len(changed) > max_ratio * len(rows):
+        raise NotDeltaEncodable(f'{len(changed)} of {len(rows)} rows changed')
+    ranges: list[list[int]] = []
+    for index in changed:
+        if ranges and ranges[-1][0] + ranges[-1][1] == index:
+            ranges[-1][1] += 1
+        else:
+            ranges.append([index, 1])
+    meta = json.dumps({'baseline': baseline_sha, 'rows': ranges}).encode('ascii')
+    return DELTA_MAGIC + meta + b'\n' + zlib.compress(b''.join(rows[index] for index in changed))
+
+
+def apply_delta(delta: bytes, baseline: bytes) -> bytes:
+    """PNG bytes with the delta's rows spliced into the baseline."""
+    meta, body = delta[len(DELTA_MAGIC):].split(b'\n', 1)
+    ranges = json.loads(meta)['rows']
+    _, rows = _scanlines(baseline)
+    changed = zlib.decompress(body)
+    row_size = len(rows[0]) if rows else 0
+    offset = 0
+    for start, count in ranges:
+        for index in range(start, start + count):
+            rows[index] = changed[offset:offset + row_size]
+            offset += row_size
+    idat = png_chunk(b'IDAT', zlib.compress(b''.join(rows)))
+    parts = [PNG_SIGNATURE]
+    for kind, payload in _chunks(baseline):
+        if kind == b'IDAT':
+            if idat:
+                parts.append(idat)
+                idat = b''
+        else:
+            parts.append(png_chunk(kind, payload))
+    return b''.join(parts)
+
+
+@dataclass
+class ScreenshotRecord:
+    """One capture: where its pixels are stored and what storing them cost."""
+
+    name: str
+    sha256: str
+    kind: str  # 'png', 'delta' or 'duplicate'
+    size: int  # decoded PNG bytes
+    written: int  # bytes written to disk (0 for duplicates)
+    seconds: float  # worker time: decode, hash, encode, write
+
+
+@dataclass
+class ScreenshotStats:
+    captures: int = 0
+    duplicates: int = 0
+    deltas: int = 0
+    png_bytes: int = 0
+    written_bytes: int = 0
+    driver_seconds: float = 0.0
+
+    def __str__(self) -> str:
+        saved = 1 - self.written_bytes / self.png_bytes if self.png_bytes else 0.0
+        return (
+            f'{self.captures} captures ({self.duplicates} duplicate, {self.deltas} delta): '
+            f'{self.png_bytes / 1024:.0f} KiB captured, {self.written_bytes / 1024:.0f} KiB written '
+            f'({saved:.0%} saved), {self.driver_seconds:.2f}s on the driver thread'
+        )
+
+
+class ScreenshotService:
+    """
+    Capture screenshots on the driver thread, decode and store them on a worker pool.
+
+    Args:
+        directory: storage root (blobs/, index.jsonl, baselines.json).
+        workers: decoding / storage threads.
+        delta: store later captures of a name as row deltas against its first one.
+        max_delta_ratio: above this share of changed rows a capture is stored whole.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        workers: int = 4,
+        delta: bool = False,
+        max_delta_ratio: float = MAX_DELTA_RATIO,
+    ) -> None:
+        self.directory = Path(directory)
+        self.blobs = self.directory / 'blobs'
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        self.delta = delta
+        self.max_delta_ratio = max_delta_ratio
+        self.stats = ScreenshotStats()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='screenshots')
+        self._lock = threading.Lock()
+        self._latest: dict[str, str] = {}
+        baselines = self.directory / 'baselines.json'
+        self._baselines: dict[str, str] = json.loads(baselines.read_text(encoding='utf-8')) if baselines.exists() else {}
+        # Baselines being written by a worker, so captures queued behind them wait instead of storing whole.
+        self._pending_baselines: dict[str, Future] = {}
+        self._futures: set[Future] = set()
+
+    # -- capture -----------------------------------------------------------
+
+    def capture(
+        self,
+        driver: WebDriver,
+        name: str,
+        element: WebElement | None = None,
+        full_page: bool = False,
+    ) -> Future:
+        """
+        Take a screenshot now and store it in the background; the Future resolves to a ScreenshotRecord.
+
+        Args:
+            driver: session to capture.
+            name: logical name (page or component); deltas are per name.
+            element: capture only this element.
+            full_page: whole document instead of the viewport (Firefox only).
+        """
+        started = time.perf_counter()
+        if element is not None:
+            encoded = element.screenshot_as_base64
+        elif full_page:
+            encoded = driver.get_full_page_screenshot_as_base64()
+        else:
+            encoded = driver.get_screenshot_as_base64()
+        with self._lock:
+            self.stats.driver_seconds += time.perf_counter() - started
+            baseline = None
+            if self.delta:
+                baseline = self._pending_baselines.get(name) or self._baselines.get(name)
+            future = self._executor.submit(self._store, name, encoded, baseline)
+            self._futures.add(future)
+            if self.delta and baseline is None:
+                self._pending_baselines[name] = future
+        future.add_done_callback(functools.partial(self._done, name))
+        return future
+
+    def _done(self, name: str, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+            # A failed first capture is no baseline; the next capture of the name becomes it.
+            if future.exception() is not None and self._pending_baselines.get(name) is future:
+                del self._pending_baselines[name]
+
+    def _store(self, name: str, encoded: str, baseline: str | Future | None) -> ScreenshotRecord:
+        started = time.perf_counter()
+        png = base64.b64decode(encoded)
+        sha = hashlib.sha256(png).hexdigest()
+        if isinstance(baseline, Future):
+            # Captures queued before the first one failed are stored whole.
+            baseline = None if baseline.exception() is not None else baseline.result().sha256
+
+        written, kind = 0, 'duplicate'
+        if self._blob_path(sha) is None:
+            kind, data = 'png', png
+            if baseline is not None and baseline != sha:
+                try:
+                    data = encode_delta(png, self.load_blob(baseline), baseline, self.max_delta_ratio)
+                    kind = 'delta'
+                except (ValueError, zlib.error, FileNotFoundError):
+                    # NotDeltaEncodable, or a missing or unreadable baseline blob: store the whole PNG.
+                    pass
+            written = self._write(self.blobs / f'{sha}.{kind}', data)
+
+        record = ScreenshotRecord(name, sha, kind, len(png), written, time.perf_counter() - started)
+        with self._lock:
+            self.stats.captures += 1
+            self.stats.duplicates += kind == 'duplicate'
+            self.stats.deltas += kind == 'delta'
+            self.stats.png_bytes += len(png)
+            self.stats.written_bytes += written
+            self._latest[name] = sha
+            if self.delta and name not in self._baselines:
+                self._baselines[name] = sha
+                self._pending_baselines.pop(name, None)
+            with open(self.directory / 'index.jsonl', 'a', encoding='utf-8') as index:
+                index.write(json.dumps(asdict(record)) + '\n')
+        return record
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> int:
+        tmp = path.with_name(f'.{path.name}.{threading.get_ident()}.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        return len(data)
+
+    # -- reading back ------------------------------------------------------
+
+    def _blob_path(self, sha: str) -> Path | None:
+        for kind in ('png', 'delta'):
+            path = self.blobs / f'{sha}.{kind}'
+            if path.exists():
+                return path
+        return None
+
+    def load_blob(self, sha: str) -> bytes:
+        """PNG bytes of a stored capture, rebuilding deltas from their baseline."""
+        path = self._blob_path(sha)
+        if path is None:
+            raise FileNotFoundError(f'No screenshot {sha} in {self.blobs}')
+        data = path.read_bytes()
+        if path.suffix == '.delta':
+            meta = json.loads(data[len(DELTA_MAGIC):].split(b'\n', 1)[0])
+            return apply_delta(data, self.load_blob(meta['baseline']))
+        return data
+
+    def load(self, name: str) -> bytes:
+        """PNG bytes of the latest capture of name (waits for pending captures)."""
+        self.flush()
+        with self._lock:
+            sha = self._latest.get(name) or self._baselines.get(name)
+        if sha is None:
+            raise KeyError(name)
+        return self.load_blob(sha)
+
+    def export(self, name: str, path: str | Path) -> Path:
+        """Write the latest capture of name as a regular PNG file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.load(name))
+        return path
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def flush(self) -> None:
+        """Wait until every capture queued so far is stored."""
+        with self._lock:
+            pending = list(self._futures)
+        for future in pending:
+            future.exception()
+
+    def close(self) -> None:
+        """Store every queued capture, stop the workers and save the baselines."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            if self._baselines:
+                self._write(self.directory / 'baselines.json', json.dumps(self._baselines, indent=2).encode('utf-8'))
+
+    def __enter__(self) -> ScreenshotService:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+Long-lived Chrome / Edge browsers shared by successive runs through debuggerAddress.
+
+The driver pool (pool.py) keeps sessions alive within one process; every
+new `python example.py` or runner invocation still launches its own
+browsers. The session broker launches N browsers once, outside any
+WebDriver session, each with its own --user-data-dir and a DevTools port
+(--remote-debugging-port=0; the port is read back from DevToolsActivePort),
+and records them in a state file. Any process can then:
+
+    attach_driver()   lease a free browser (one lease file per browser,
+                      held under an exclusive flock for as long as the
+                      session lives, so the lease of a crashed process is
+                      freed by the kernel) and start a chromedriver session
+                      on it with the debuggerAddress option.
+    driver.quit()     reset the browser (session_reset.reset_session:
+                      alerts, windows, cookies, storage, cache,
+                      permissions), end the chromedriver session, which
+                      leaves a browser it attached to running, and release
+                      the lease. A browser whose reset fails is marked
+                      broken (a .broken file next to its lease) and no
+                      longer leased until the broker is restarted.
+
+Launch cost is paid once per broker browser; each attachment only starts
+chromedriver. The browser is already running with the broker's arguments,
+so only the caller's session capabilities (page load strategy, timeouts,
+...) are applied; broker_accepts() tells whether the caller's browser
+options ask for nothing more than that.
+
+SELENIUM_EXAMPLES_BROKER=1 makes build_driver() attach for chrome and edge
+instead of launching (or pooling) a browser, unless the caller passed
+pooled=False or options the broker browsers cannot honour (a profile
+directory, extensions, prefs, emulation, other arguments...).
+
+Usage (from the repository root):
+    python -m selenium_v4.support.session_broker start -n 4 --browser chrome
+    SELENIUM_EXAMPLES_BROKER=1 python -m selenium_v4.support.runner -j 4
+    python -m selenium_v4.support.session_broker stop
+
+Environment:
+    SELENIUM_EXAMPLES_BROKER=1          build_driver() attaches to broker browsers
+    SELENIUM_EXAMPLES_BROKER_STATE      state file (default ~/.cache/selenium-examples/broker.json)
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from selenium.webdriver.remote.webdriver import WebDriver
+
+if __package__ in (None, ''):
+    # Allow running this file directly: python selenium_v4/support/session_broker.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from selenium_v4.support.drivers import BROWSERS, new_driver  # noqa: E402
+from selenium_v4.support.fast_launch import FAST_LAUNCH_SETTINGS  # noqa: E402
+from selenium_v4.support.load_profiles import CHROMIUM_IMAGES_PREF  # noqa: E402
+from selenium_v4.support.pool import SESSION_ERRORS, reset_driver  # noqa: E402
+
+try:
+    import fcntl
+except ImportError:  # Windows: exclusive lease files, no takeover of dead holders
+    fcntl = None
+
+BROKER_STATE = Path(
+    os.getenv('SELENIUM_EXAMPLES_BROKER_STATE', Path.home() / '.cache' / 'selenium-examples' / 'broker.json')
+)
+BROKER_BROWSERS = ('chrome', 'edge')
+LAUNCH_ARGS = (
+    '--remote-debugging-port=0',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-background-networking',
+    '--disable-sync',
+)
+STARTUP_TIMEOUT = 30.0
+POLL_INTERVAL = 0.1
+
+
+class BrokerUnavailable(WebDriverException):
+    """Raised when no broker is running or no browser can be leased in time."""
+
+
+@dataclass(frozen=True)
+class BrokeredBrowser:
+    """One browser of the broker and where its DevTools endpoint listens."""
+
+    index: int
+    browser: str
+    address: str
+    pid: int
+    user_data_dir: str
+    arguments: tuple[str, ...] = ()
+
+
+def _lease_path(state_file: Path, index: int) -> Path:
+    return state_file.with_name(f'{state_file.stem}.{index}.lease')
+
+
+def _broken_path(state_file: Path, index: int) -> Path:
+    return state_file.with_name(f'{state_file.stem}.{index}.broken')
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == 'nt':
+        # os.kill(pid, 0) would terminate the process on Windows; assume the holder is alive.
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _browser_binary(browser: str, binary: str | None) -> str:
+    if binary:
+        return binary
+    return SeleniumManager().binary_paths(['--browser', browser])['browser_path']
+
+
+def _launch(binary: str, user_data_dir: Path, arguments: list[str]) -> tuple[subprocess.Popen, str]:
+    """Start one browser and wait for its DevTools port."""
+    port_file = user_data_dir / 'DevToolsActivePort'
+    process = subprocess.Popen(
+        [binary, f'--user-data-dir={user_data_dir}', *arguments, 'about:blank'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        # Own session: the browsers outlive the `start` command and its terminal.
+        start_new_session=os.name != 'nt',
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise BrokerUnavailable(f'{binary} exited with code {process.returncode} during start-up')
+        with contextlib.suppress(FileNotFoundError, ValueError, IndexError):
+            port = int(port_file.read_text(encoding='utf-8').splitlines()[0])
+            return process, f'127.0.0.1:{port}'
+        time.sleep(POLL_INTERVAL)
+    process.kill()
+    raise BrokerUnavailable(f'{binary} did not open a DevTools port within {STARTUP_TIMEOUT}s')
+
+
+class SessionBroker:
+    """
+    Starts and stops the broker browsers and owns the state file.
+
+    Args:
+        browser: 'chrome' or 'edge'.
+        size: number of browsers, i.e. how many runs can attach at once.
+        state_file: where attachments look the browsers up.
+        headless: add --headless=new.
+        binary: browser executable; located by Selenium Manager when None.
+        arguments: extra browser arguments.
+    """
+
+    def __init__(
+        self,
+        browser: str = 'chrome',
+        size: int = 2,
+        state_file: str | Path | None = None,
+        headless: bool = True,
+        binary: str | None = None,
+        arguments: tuple[str, ...] = (),
+    ) -> None:
+        if browser not in BROKER_BROWSERS:
+            raise ValueError(f'Unsupported browser {browser!r}; expected one of {list(BROKER_BROWSERS)}')
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        self.browser = browser
+        self.size = size
+        self.state_file = Path(state_file) if state_file is not None else BROKER_STATE
+        self.headless = headless
+        self.binary = binary
+        self.arguments = tuple(arguments)
+
+    def start(self) -> list[BrokeredBrowser]:
+        """Launch the browsers and publish them; stop() a running broker first."""
+        if self.state_file.exists():
+            raise BrokerUnavailable(f'A broker is already running ({self.state_file}); stop it first')
+        binary = _browser_binary(self.browser, self.binary)
+        arguments = [*LAUNCH_ARGS, *(('--headless=new',) if self.headless else ()), *self.arguments]
+        browsers: list[BrokeredBrowser] = []
+        try:
+            for index in range(self.size):
+                user_data_dir = Path(tempfile.mkdtemp(prefix=f'broker-{self.browser}-{index}-'))
+                try:
+                    process, address = _launch(binary, user_data_dir, arguments)
+                except BaseException:
+                    shutil.rmtree(user_data_dir, ignore_errors=True)
+                    raise
+                browsers.append(
+                    BrokeredBrowser(index, self.browser, address, process.pid, str(user_data_dir), tuple(arguments))
+                )
+        except BaseException:
+            _terminate(browsers)
+            raise
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_file.with_name(f'.{self.state_file.name}.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps({'browsers': [asdict(entry) for entry in browsers]}, indent=2), encoding='utf-8')
+        os.replace(tmp, self.state_file)
+        return browsers
+
+    def stop(self) -> None:
+        """Quit every broker browser, delete their profiles, leases, broken markers and the state file."""
+        browsers = read_state(self.state_file) if self.state_file.exists() else []
+        _terminate(browsers)
+        for entry in browsers:
+            for path in (_lease_path(self.state_file, entry.index), _broken_path(self.state_file, entry.index)):
+                with contextlib.suppress(FileNotFoundError):
+                    path.unlink()
+        with contextlib.suppress(FileNotFoundError):
+            self.state_file.unlink()
+
+    def __enter__(self) -> SessionBroker:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def _terminate(browsers: list[BrokeredBrowser]) -> None:
+    for entry in browsers:
+        with contextlib.suppress(OSError):
+            os.kill(entry.pid, signal.SIGTERM)
+    for entry in browsers:
+        deadline = time.monotonic() + 5
+        while os.name != 'nt' and _pid_alive(entry.pid) and time.monotonic() < deadline:
+            # Reap our own children (in-process brokers); others are reaped by init.
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(entry.pid, os.WNOHANG)
+            time.sleep(POLL_INTERVAL)
+        shutil.rmtree(entry.user_data_dir, ignore_errors=True)
+
+
+def read_state(state_file: str | Path | None = None) -> list[BrokeredBrowser]:
+    """Browsers published by the running broker."""
+    state_file = Path(state_file) if state_file is not None else BROKER_STATE
+    try:
+        payload = json.loads(state_file.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        raise BrokerUnavailable(f'No session broker is running ({state_file} does not exist)') from None
+    return [
+        BrokeredBrowser(**{**entry, 'arguments': tuple(entry.get('arguments', ()))}) for entry in payload['browsers']
+    ]
+
+
+def broker_accepts(browser: str, options: ArgOptions | None, state_file: str | Path | None = None) -> bool:
+    """
+    Whether a broker browser can stand in for a browser launched with options.
+
+    The browser options may only carry arguments the broker browsers were
+    launched with or fast-launch switches, and the image-blocking pref of the
+    'fast' load profile (attached sessions block images through CDP instead).
+    """
+    if options is None:
+        return True
+    vendor = dict(options.to_capabilities().get(options.KEY, {}))
+    if vendor.pop('extensions', []):
+        return False
+    if set(vendor.get('prefs', {})) - {CHROMIUM_IMAGES_PREF}:
+        return False
+    if set(vendor) - {'args', 'prefs'}:
+        return False
+    tolerated = set(FAST_LAUNCH_SETTINGS[browser][0])
+    for entry in read_state(state_file):
+        if entry.browser == browser:
+            tolerated.update(entry.arguments)
+    return all(argument in tolerated for argument in vendor.get('args', []))
+
+
+# lease file -> locked descriptor held by this process
+_HELD: dict[str, int] = {}
+
+
+def _try_lease(path: Path) -> bool:
+    if fcntl is None:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+            handle.write(str(os.getpid()))
+        return True
+
+    fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # stop() may have removed the file between open and flock.
+        if os.fstat(fd).st_ino != os.stat(path).st_ino:
+            raise FileNotFoundError(path)
+    except (BlockingIOError, FileNotFoundError):
+        os.close(fd)
+        return False
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode('ascii'))
+    _HELD[str(path)] = fd
+    return True
+
+
+def _leased(path: Path) -> bool:
+    """Whether any process holds the lease (for `status`)."""
+    if fcntl is None or not path.exists():
+        return path.exists()
+    if str(path) in _HELD:
+        return True
+    with open(path, 'rb') as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+    return False
+
+
+def lease(browser: str | None = None, state_file: str | Path | None = None, timeout: float | None = 60.0) -> BrokeredBrowser:
+    """
+    Reserve a free broker browser for this process; waits up to timeout seconds (forever when None).
+
+    Browsers marked broken are skipped.
+    """
+    state_file = Path(state_file) if state_file is not None else BROKER_STATE
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        usable = 0
+        for entry in read_state(state_file):
+            if browser is not None and entry.browser != browser:
+                continue
+            if _broken_path(state_file, entry.index).exists():
+                continue
+            usable += 1
+            if _try_lease(_lease_path(state_file, entry.index)):
+                if not _broken_path(state_file, entry.index).exists():
+                    return entry
+                # Marked broken while we were acquiring the lease.
+                release(entry, state_file)
+        if not usable:
+            raise BrokerUnavailable(f'Every {browser or "broker"} browser is marked broken; restart the broker')
+        if deadline is not None and time.monotonic() >= deadline:
+            raise BrokerUnavailable(f'No {browser or "broker"} browser became free within {timeout}s')
+        time.sleep(POLL_INTERVAL)
+
+
+def release(entry: BrokeredBrowser, state_file: str | Path | None = None) -> None:
+    state_file = Path(state_file) if state_file is not None else BROKER_STATE
+    path = _lease_path(state_file, entry.index)
+    fd = _HELD.pop(str(path), None)
+    if fd is not None:
+        # Unlocking frees the lease; the file stays so no one can lock a stale inode.
+        os.close(fd)
+        return
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()
+
+
+def attach_driver(
+    browser: str = 'chrome',
+    options: ArgOptions | None = None,
+    state_file: str | Path | None = None,
+    timeout: float | None = 60.0,
+) -> WebDriver:
+    """
+    Start a session on a leased broker browser; driver.quit() resets it and releases the lease.
+
+    The broker browser keeps running; only its state is cleared.
+    """
+    entry = lease(browser, state_file, timeout)
+    attach_options = BROWSERS[entry.browser][1]()
+    attach_options.debugger_address = entry.address
+    if options is not None:
+        for name, value in options.to_capabilities().items():
+            if name not in ('browserName', options.KEY):
+                attach_options.set_capability(name, value)
+    try:
+        driver = new_driver(entry.browser, attach_options)
+    except BaseException:
+        release(entry, state_file)
+        raise
+    driver.quit = functools.partial(_detach, driver, entry, state_file)
+    driver.brokered_browser = entry
+    return driver
+
+
+def _detach(driver: WebDriver, entry: BrokeredBrowser, state_file: str | Path | None) -> None:
+    driver.__dict__.pop('quit', None)
+    state_file = Path(state_file) if state_file is not None else BROKER_STATE
+    try:
+        try:
+            reset_driver(driver)
+        except SESSION_ERRORS as exc:
+            # The browser may still hold the last run's state: keep it out of rotation.
+            _broken_path(state_file, entry.index).write_text(f'{type(exc).__name__}: {exc}', encoding='utf-8')
+        with contextlib.suppress(*SESSION_ERRORS):
+            type(driver).quit(driver)
+    finally:
+        release(entry, state_file)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Start or stop the long-lived browsers of the session broker.')
+    parser.add_argument('command', choices=('start', 'stop', 'status'))
+    parser.add_argument('-n', '--size', type=int, default=os.cpu_count() or 1, help='browsers to launch')
+    parser.add_argument('--browser', choices=BROKER_BROWSERS, default='chrome')
+    parser.add_argument('--headed', action='store_true', help='show the browser windows')
+    parser.add_argument('--state', type=Path, default=BROKER_STATE, help='state file')
+    args = parser.parse_args(argv)
+
+    broker = SessionBroker(args.browser, args.size, args.state, headless=not args.headed)
+    if args.command == 'start':
+        for entry in broker.start():
+            print(f'{entry.browser} #{entry.index}: {entry.address} (pid {entry.pid})')
+        print(f'State written to {args.state}; attach with SELENIUM_EXAMPLES_BROKER=1')
+    elif args.command == 'stop':
+        broker.stop()
+        print('Broker stopped.')
+    else:
+        try:
+            browsers = read_state(args.state)
+        except BrokerUnavailable as exc:
+            print(exc.msg)
+            return 1
+        for entry in browsers:
+            if _broken_path(args.state, entry.index).exists():
+                state = 'broken'
+            else:
+                state = 'leased' if _leased(_lease_path(args.state, entry.index)) else 'free'
+            print(f'{entry.browser} #{entry.index}: {entry.address} (pid {entry.pid}) {state}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Full state reset of a live session, for pooled and brokered browsers.
+
+A reused browser is only as good as its reset: whatever the previous
+borrower left behind (a cookie, a localStorage flag, an IndexedDB, a
+granted permission, a second tab, a switched-to frame, an open alert)
+leaks into the next example. reset_session() clears all of it:
+
+    alerts        an open alert is dismissed first, in every window
+    windows       a new tab is opened and every previous window closed:
+                  no frame context, navigation history, sessionStorage or
+                  page script state survive
+    Chrome / Edge browser-wide CDP commands, no page scripts:
+                  Network.clearBrowserCookies, Network.clearBrowserCache,
+                  Browser.resetPermissions and Storage.clearDataForOrigin
+                  (local storage, IndexedDB, Cache Storage, service workers,
+                  ...) for every origin in the closed tabs' history, in
+                  their frame trees (cross-origin iframes) and among the
+                  browser's targets (workers, out-of-process frames)
+    Firefox / Safari
+                  CLEAR_STORAGE_JS in each window before it is closed
+                  (local and session storage, IndexedDB, Cache Storage,
+                  service workers of the page's origin), cookies through
+                  BiDi storage.deleteCookies when the session has
+                  webSocketUrl, otherwise delete_all_cookies() per window.
+                  WebDriver has no command resetting permissions or the
+                  HTTP cache there.
+
+There is no single CDP or BiDi command that clears every kind of state,
+so on Chrome / Edge the reset costs one round trip per window and origin
+plus three browser-wide ones. measure_reset() compares it with quitting
+and relaunching the browser, and counts what survived the reset.
+
+Example:
+    reset_session(driver)
+    print(measure_reset('chrome', url=shared_server().url('www.example.com/')))
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+CLEAR_STORAGE_JS = """
+var done = arguments[arguments.length - 1];
+var tasks = [];
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+try {
+  if (window.indexedDB && indexedDB.databases) {
+    tasks.push(indexedDB.databases().then(function (dbs) {
+      return Promise.all(dbs.map(function (db) {
+        return new Promise(function (resolve) {
+          var request = indexedDB.deleteDatabase(db.name);
+          request.onsuccess = request.onerror = request.onblocked = resolve;
+        });
+      }));
+    }));
+  }
+  if (window.caches) {
+    tasks.push(caches.keys().then(function (keys) {
+      return Promise.all(keys.map(function (key) { return caches.delete(key); }));
+    }));
+  }
+  if (navigator.serviceWorker && navigator.serviceWorker.getRegistrations) {
+    tasks.push(navigator.serviceWorker.getRegistrations().then(function (registrations) {
+      return Promise.all(registrations.map(function (r) { return r.unregister(); }));
+    }));
+  }
+} catch (e) {}
+Promise.all(tasks.map(function (t) { return t.catch(function () {}); })).then(function () { done(true); });
+"""
+
+# Leaves state of every kind behind, for measure_reset(); arguments[0] is the URL opened in a second tab.
+DIRTY_JS = """
+var done = arguments[arguments.length - 1];
+localStorage.setItem('reset-check', '1');
+sessionStorage.setItem('reset-check', '1');
+document.cookie = 'reset_check=1; path=/';
+window.open(arguments[0], '_blank');
+var request = indexedDB.open('reset-check', 1);
+request.onupgradeneeded = function () { request.result.createObjectStore('items'); };
+request.onsuccess = function () { request.result.close(); done(true); };
+request.onerror = function () { done(false); };
+"""
+
+# What survived: cookies, storage entries and IndexedDB databases of the page's origin.
+RESIDUE_JS = """
+var done = arguments[arguments.length - 1];
+var count = (document.cookie ? document.cookie.split(';').length : 0) + localStorage.length + sessionStorage.length;
+if (!indexedDB.databases) { done(count); return; }
+indexedDB.databases().then(function (dbs) { done(count + dbs.length); }, function () { done(count); });
+"""
+
+
+def _dismiss_alert(driver: WebDriver) -> None:
+    try:
+        driver.switch_to.alert.dismiss()
+    except NoAlertPresentException:
+        pass
+
+
+def _origin(url: str) -> str | None:
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}' if parts.scheme in ('http', 'https') else None
+
+
+def _history_origins(driver: WebDriver) -> set[str]:
+    """Origins of the window's navigation history and of every frame of its current page."""
+    history = driver.execute_cdp_cmd('Page.getNavigationHistory', {})
+    urls = [entry.get('url', '') for entry in history.get('entries', [])]
+    frames = [driver.execute_cdp_cmd('Page.getFrameTree', {}).get('frameTree', {})]
+    while frames:
+        node = frames.pop()
+        urls.append(node.get('frame', {}).get('url', ''))
+        frames.extend(node.get('childFrames', []))
+    return {origin for origin in map(_origin, urls) if origin}
+
+
+def _target_origins(driver: WebDriver) -> set[str]:
+    """Origins of the browser's pages, frames and workers, whichever window they belong to."""
+    targets = driver.execute_cdp_cmd('Target.getTargets', {}).get('targetInfos', [])
+    return {origin for origin in (_origin(target.get('url', '')) for target in targets) if origin}
+
+
+def _bidi_enabled(driver: WebDriver) -> bool:
+    return bool(driver.caps.get('webSocketUrl'))
+
+
+def reset_session(driver: WebDriver) -> None:
+    """Dismiss alerts, replace every window by one fresh tab and clear cookies, storage, cache and permissions."""
+    cdp = hasattr(driver, 'execute_cdp_cmd')
+    bidi = not cdp and _bidi_enabled(driver)
+    _dismiss_alert(driver)
+    handles = driver.window_handles
+    driver.switch_to.new_window('tab')
+    fresh = driver.current_window_handle
+
+    origins = _target_origins(driver) if cdp else set()
+    for handle in handles:
+        driver.switch_to.window(handle)
+        _dismiss_alert(driver)
+        if cdp:
+            origins.update(_history_origins(driver))
+        else:
+            driver.switch_to.default_content()
+            driver.execute_async_script(CLEAR_STORAGE_JS)
+            if not bidi:
+                driver.delete_all_cookies()
+        driver.close()
+    driver.switch_to.window(fresh)
+
+    if cdp:
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        driver.execute_cdp_cmd('Browser.resetPermissions', {})
+        for origin in sorted(origins):
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+    elif bidi:
+        driver.storage.delete_cookies()
+
+
+@dataclass
+class ResetBenchmark:
+    """measure_reset() timings in seconds, one entry per run."""
+
+    browser: str
+    reset: list[float] = field(default_factory=list)
+    relaunch: list[float] = field(default_factory=list)
+    residue: int = 0
+
+    def __str__(self) -> str:
+        reset = statistics.median(self.reset)
+        relaunch = statistics.median(self.relaunch)
+        return (
+            f'{self.browser}: reset {reset * 1000:.0f} ms, relaunch {relaunch * 1000:.0f} ms '
+            f'({relaunch / reset if reset else 0:.1f}x), state left after reset: {self.residue} item(s) '
+            f'(median of {len(self.reset)})'
+        )
+
+
+def _dirty(driver: WebDriver, url: str) -> None:
+    driver.get(url)
+    driver.execute_async_script(DIRTY_JS, url)
+
+
+def measure_reset(browser: str = 'chrome', options: ArgOptions | None = None, runs: int = 5, url: str = '') -> ResetBenchmark:
+    """
+    Dirty a session on url (storage, cookie, IndexedDB, second tab), then time
+    reset_session() against quit + relaunch, runs times each.
+
+    After every reset the page is reopened and RESIDUE_JS counts leftovers,
+    summed in .residue (0 means the reset was complete). Sessions are
+    started with new_driver(), never pooled.
+    """
+    # drivers.py -> pool.py imports this module, so not at module level.
+    from selenium_v4.support.drivers import new_driver  # pylint: disable=import-outside-toplevel
+
+    if runs < 1:
+        raise ValueError('runs must be at least 1')
+    if not url:
+        raise ValueError('url must be an http(s) page: about:blank has no storage')
+    result = ResetBenchmark(browser)
+    driver = new_driver(browser, options)
+    try:
+        for _ in range(runs):
+            _dirty(driver, url)
+            started = time.perf_counter()
+            reset_session(driver)
+            result.reset.append(time.perf_counter() - started)
+            driver.get(url)
+            result.residue += driver.execute_async_script(RESIDUE_JS)
+
+        for _ in range(runs):
+            _dirty(driver, url)
+            started = time.perf_counter()
+            driver.quit()
+            driver = new_driver(browser, options)
+            result.relaunch.append(time.perf_counter() - started)
+    finally:
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+    return result
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized comparison of screenshots held in memory.
+
+compare() takes two screenshots as PNG bytes (driver.get_screenshot_as_png(),
+element.screenshot_as_png, ScreenshotService.load()) or RGBA arrays, and
+returns a DiffResult: how many pixels differ, the mask of those pixels and
+the bounding boxes of the changed areas. No temporary files are written.
+
+A pixel differs when:
+    tolerance   any channel differs by more than the tolerance, given once
+                for all channels or per channel (R, G, B, A), and
+    threshold   (optional) its perceptual distance, pixelmatch's YIQ colour
+                difference after blending onto white, exceeds threshold
+                (0 to 1; 0.1 ignores anti-aliasing-level noise).
+    ignore      pixels inside the ignore regions never differ: (x, y, width,
+                height) tuples or element.rect dicts, in CSS pixels times
+                scale (the devicePixelRatio of the captures).
+
+All per-pixel work is NumPy array arithmetic, done in horizontal strips of
+strip_rows rows so that full-page captures 10k+ pixels high stay within a
+few hundred MB. Bounding boxes come from the changed blocks (block x block
+pixels) grouped into 8-connected areas, then tightened to the exact pixels.
+highlight() returns the actual PNG with the changes painted, still in memory.
+
+NumPy and Pillow (PNG decoding) are optional dependencies of the examples,
+listed in requirements-visual.txt; the functions below raise ImportError
+when they are missing.
+
+Example:
+    before = driver.get_screenshot_as_png()
+    ...
+    result = compare(before, driver.get_screenshot_as_png(), tolerance=2, threshold=0.1,
+                     ignore=[clock.rect])
+    print(result.ratio, result.boxes)
+    Path('diff.png').write_bytes(highlight(driver.get_screenshot_as_png(), result))
+"""
+
+from __future__ import annotations
+
+import io
+import struct
+import zlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from selenium_v4.support.screenshots import PNG_SIGNATURE, png_chunk
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # optional dependencies, see _require_dependencies()
+    np = Image = None
+
+# pixelmatch: largest possible YIQ delta between two colours.
+MAX_YIQ_DELTA = 35215.0
+DEFAULT_BLOCK = 16
+DEFAULT_STRIP_ROWS = 1024
+
+
+def _require_dependencies() -> None:
+    if np is None:
+        raise ImportError('visual_diff needs NumPy and Pillow: pip install -r requirements-visual.txt')
+
+
+@dataclass(frozen=True)
+class Box:
+    """A changed area, in pixels of the captures."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@dataclass
+class DiffResult:
+    """Outcome of compare(); mask is a (height, width) bool array, True where pixels differ."""
+
+    width: int
+    height: int
+    changed: int
+    mask: np.ndarray
+    boxes: list[Box]
+    size_mismatch: bool = False
+
+    @property
+    def ratio(self) -> float:
+        return self.changed / (self.width * self.height) if self.width and self.height else 0.0
+
+    @property
+    def identical(self) -> bool:
+        return not self.changed and not self.size_mismatch
+
+    def matches(self, max_ratio: float = 0.0) -> bool:
+        """True when the sizes agree and at most max_ratio of the pixels differ."""
+        return not self.size_mismatch and self.ratio <= max_ratio
+
+
+# ---------------------------------------------------------------------------
+# PNG <-> array
+# ---------------------------------------------------------------------------
+
+def decode_png(png: bytes) -> np.ndarray:
+    """RGBA uint8 array of shape (height, width, 4)."""
+    _require_dependencies()
+    with Image.open(io.BytesIO(png)) as image:
+        return np.asarray(image.convert('RGBA'))
+
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    """PNG bytes of an RGBA uint8 array (filter type 0, zlib level 6)."""
+    _require_dependencies()
+    height, width = pixels.shape[:2]
+    raw = np.zeros((height, width * 4 + 1), np.uint8)
+    raw[:, 1:] = pixels.reshape(height, width * 4)
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return b''.join((
+        PNG_SIGNATURE,
+        png_chunk(b'IHDR', header),
+        png_chunk(b'IDAT', zlib.compress(raw.tobytes(), 6)),
+        png_chunk(b'IEND', b''),
+    ))
+
+
+def _as_pixels(image: bytes | np.ndarray) -> np.ndarray:
+    return decode_png(image) if isinstance(image, (bytes, bytearray, memoryview)) else np.asarray(image, np.uint8)
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+def _yiq(pixels: np.ndarray) -> np.ndarray:
+    rgb = pixels[..., :3].astype(np.float32)
+    alpha = pixels[..., 3:4].astype(np.float32) / 255.0
+    rgb = 255.0 + (rgb - 255.0) * alpha  # blend onto white
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    return np.stack((
+        r * 0.29889531 + g * 0.58662247 + b * 0.11448223,
+        r * 0.59597799 - g * 0.27417610 - b * 0.32180189,
+        r * 0.21147017 - g * 0.52261711 + b * 0.31114694,
+    ), axis=-1)
+
+
+def _region(region: Sequence[float] | dict, scale: float) -> tuple[int, int, int, int]:
+    if isinstance(region, dict):
+        region = (region['x'], region['y'], region['width'], region['height'])
+    x, y, width, height = (value * scale for value in region)
+    return int(x), int(y), int(x + width + 0.999), int(y + height + 0.999)
+
+
+def _boxes(mask: np.ndarray, block: int) -> list[Box]:
+    height, width = mask.shape
+    rows, cols = -(-height // block), -(-width // block)
+    padded = np.zeros((rows * block, cols * block), bool)
+    padded[:height, :width] = mask
+    grid = padded.reshape(rows, block, cols, block).any(axis=(1, 3))
+
+    remaining = set(zip(*(axis.tolist() for axis in np.nonzero(grid))))
+    boxes = []
+    while remaining:
+        seed = remaining.pop()
+        stack, top, left, bottom, right = [seed], seed[0], seed[1], seed[0], seed[1]
+        while stack:
+            y, x = stack.pop()
+            for ny in (y - 1, y, y + 1):
+                for nx in (x - 1, x, x + 1):
+                    if (ny, nx) in remaining:
+                        remaining.remove((ny, nx))
+                        stack.append((ny, nx))
+                        top, bottom, left, right = min(top, ny), max(bottom, ny), min(left, nx), max(right, nx)
+        area = mask[top * block:(bottom + 1) * block, left * block:(right + 1) * block]
+        changed_rows = np.flatnonzero(area.any(axis=1))
+        changed_cols = np.flatnonzero(area.any(axis=0))
+        boxes.append(Box(
+            int(left * block + changed_cols[0]),
+            int(top * block + changed_rows[0]),
+            int(changed_cols[-1] - changed_cols[0] + 1),
+            int(changed_rows[-1] - changed_rows[0] + 1),
+        ))
+    return sorted(boxes, key=lambda box: (box.y, box.x))
+
+
+def compare(
+    expected: bytes | np.ndarray,
+    actual: bytes | np.ndarray,
+    tolerance: int | Sequence[int] = 0,
+    threshold: float | None = None,
+    ignore: Iterable[Sequence[float] | dict] = (),
+    scale: float = 1.0,
+    block: int = DEFAULT_BLOCK,
+    strip_rows: int = DEFAULT_STRIP_ROWS,
+) -> DiffResult:
+    """
+    Compare two screenshots pixel by pixel.
+
+    Args:
+        expected, actual: PNG bytes or (height, width, 4) RGBA arrays.
+        tolerance: largest ignored difference per channel, one int or (R, G, B, A).
+        threshold: perceptual threshold 0-1; None compares channels only.
+        ignore: regions never reported, (x, y, width, height) or element.rect.
+        scale: device pixels per CSS pixel of the ignore regions.
+        block: granularity (pixels) at which nearby changes join one box.
+        strip_rows: rows compared at once; bounds the temporary memory.
+
+    Pixels outside the common area of differently sized images count as changed.
+    """
+    _require_dependencies()
+    expected, actual = _as_pixels(expected), _as_pixels(actual)
+    height, width = max(expected.shape[0], actual.shape[0]), max(expected.shape[1], actual.shape[1])
+    common_h, common_w = min(expected.shape[0], actual.shape[0]), min(expected.shape[1], actual.shape[1])
+    limits = np.broadcast_to(np.asarray(tolerance, np.int16), (4,))
+
+    mask = np.ones((height, width), bool)
+    for start in range(0, common_h, strip_rows):
+        stop = min(start + strip_rows, common_h)
+        a = expected[start:stop, :common_w]
+        b = actual[start:stop, :common_w]
+        strip = (np.abs(a.astype(np.int16) - b.astype(np.int16)) > limits).any(axis=-1)
+        if threshold is not None and strip.any():
+            delta = _yiq(a) - _yiq(b)
+            distance = 0.5053 * delta[..., 0] ** 2 + 0.299 * delta[..., 1] ** 2 + 0.1957 * delta[..., 2] ** 2
+            strip &= distance > MAX_YIQ_DELTA * threshold * threshold
+        mask[start:stop, :common_w] = strip
+
+    for region in ignore:
+        left, top, right, bottom = _region(region, scale)
+        mask[max(top, 0):max(bottom, 0), max(left, 0):max(right, 0)] = False
+
+    size_mismatch = expected.shape[:2] != actual.shape[:2]
+    return DiffResult(width, height, int(np.count_nonzero(mask)), mask, _boxes(mask, block), size_mismatch)
+
+
+def highlight(actual: bytes | np.ndarray, result: DiffResult, color: tuple[int, int, int] = (255, 0, 0)) -> bytes:
+    """PNG bytes of actual with changed pixels painted and every box outlined in color."""
+    _require_dependencies()
+    pixels = np.zeros((result.height, result.width, 4), np.uint8)
+    source = _as_pixels(actual)
+    pixels[:source.shape[0], :source.shape[1]] = source
+    paint = np.array((*color, 255), np.uint8)
+    pixels[result.mask] = paint
+    for box in result.boxes:
+        bottom, right = box.y + box.height - 1, box.x + box.width - 1
+        pixels[box.y, box.x:right + 1] = paint
+        pixels[bottom, box.x:right + 1] = paint
+        pixels[box.y:bottom + 1, box.x] = paint
+        pixels[box.y:bottom + 1, right] = paint
+    return encode_png(pixels)